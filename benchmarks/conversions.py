@@ -0,0 +1,277 @@
+"""Benchmarks for all conversions of pyintergraph.
+
+Every conversion function in funcs.py and every InterGraph.from_*/to_* method is timed on
+synthetic graphs of several sizes and kinds. Each case runs in its own child process, so
+that its peak RSS can be measured independently of all other cases.
+
+Usage:
+    python benchmarks/conversions.py --scales 1e3 1e4 1e5 --output results.json
+    python benchmarks/conversions.py --ops to_graph_tool to_graph_tool_4_workers \
+        --attributes wide --scales 1e6
+    python benchmarks/conversions.py --output new.json --compare results.json
+
+With --compare, cases that got slower (or use more memory) than the baseline by more than
+--tolerance are reported and the script exits with status 1.
+"""
+import argparse
+from functools import partial
+import importlib
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+
+import pyintergraph
+from pyintergraph import InterGraph
+from pyintergraph.columns import Column
+
+KINDS = ["directed", "undirected", "multigraph"]
+ATTRIBUTES = ["none", "scalar", "string", "vector", "wide"]
+
+# numeric edge attributes of the "wide" graphs, which show how workers scale
+WIDE_COLUMNS = 16
+
+# name -> (source library, required libraries, conversion)
+OPS = {
+    "nx2gt": ("networkx", ["networkx", "graph_tool"], pyintergraph.nx2gt),
+    "nx2igraph": ("networkx", ["networkx", "igraph"], pyintergraph.nx2igraph),
+    "gt2nx": ("graph_tool", ["graph_tool", "networkx"], pyintergraph.gt2nx),
+    "gt2igraph": ("graph_tool", ["graph_tool", "igraph"], pyintergraph.gt2igraph),
+    "igraph2nx": ("igraph", ["igraph", "networkx"], pyintergraph.igraph2nx),
+    "igraph2gt": ("igraph", ["igraph", "graph_tool"], pyintergraph.igraph2gt),
+    "from_networkx": ("networkx", ["networkx"], InterGraph.from_networkx),
+    "from_graph_tool": ("graph_tool", ["graph_tool"], InterGraph.from_graph_tool),
+    "from_igraph": ("igraph", ["igraph"], InterGraph.from_igraph),
+    "to_networkx": ("intergraph", ["networkx"], InterGraph.to_networkx),
+    "to_graph_tool": ("intergraph", ["graph_tool"], InterGraph.to_graph_tool),
+    "to_graph_tool_4_workers": (
+        "intergraph",
+        ["graph_tool"],
+        partial(InterGraph.to_graph_tool, workers=4),
+    ),
+    "to_igraph": ("intergraph", ["igraph"], InterGraph.to_igraph),
+}
+
+
+def make_graph(n_edges, kind, attributes, seed=0):
+    """Creates a random InterGraph with about n_edges edges and ten times fewer nodes."""
+    rng = np.random.default_rng(seed)
+    n_nodes = max(n_edges // 10, 2)
+    is_directed = kind == "directed"
+
+    edges = rng.integers(0, n_nodes, size=(n_edges, 2))
+    if not is_directed:
+        edges = np.sort(edges, axis=1)
+    if kind == "multigraph":
+        edges[: n_edges // 100 + 1] = edges[0]
+    else:
+        edges = np.unique(edges, axis=0)
+        rng.shuffle(edges)
+    n_edges = len(edges)
+
+    node_columns = {}
+    edge_columns = {}
+    if attributes == "scalar":
+        node_columns["weight"] = Column(rng.random(n_nodes))
+        node_columns["count"] = Column(rng.integers(0, 1000, n_nodes))
+        node_columns["flag"] = Column(rng.random(n_nodes) > 0.5)
+        edge_columns["weight"] = Column(rng.random(n_edges))
+        edge_columns["count"] = Column(rng.integers(0, 100000, n_edges))
+    elif attributes == "string":
+        categories = np.array([f"category_{i}" for i in range(100)], dtype=object)
+        node_columns["category"] = Column(categories[rng.integers(0, 100, n_nodes)])
+        edge_columns["kind"] = Column(categories[rng.integers(0, 10, n_edges)])
+    elif attributes == "vector":
+        node_columns["position"] = Column.from_values(rng.random((n_nodes, 3)).tolist())
+        edge_columns["path"] = Column.from_values(rng.integers(0, 10, (n_edges, 2)).tolist())
+    elif attributes == "wide":
+        for i in range(WIDE_COLUMNS // 2):
+            edge_columns[f"weight_{i}"] = Column(rng.random(n_edges))
+            edge_columns[f"count_{i}"] = Column(rng.integers(0, 100000, n_edges))
+
+    return InterGraph.from_columns(
+        np.arange(n_nodes), edges, is_directed, node_columns, edge_columns
+    )
+
+
+def make_source(G, library):
+    if library == "networkx":
+        return G.to_networkx()
+    elif library == "igraph":
+        return G.to_igraph()
+    elif library == "graph_tool":
+        return G.to_graph_tool()
+    return G
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def is_available(library):
+    try:
+        importlib.import_module(library)
+    except ImportError:
+        return False
+    return True
+
+
+def run_case(op, n_edges, kind, attributes, repeat, queue):
+    library, _, convert = OPS[op]
+    G = make_graph(n_edges, kind, attributes)
+    source = make_source(G, library)
+    del G
+    setup_rss = peak_rss_mb()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(source)
+        times.append(time.perf_counter() - start)
+
+    queue.put({"times": times, "setup_rss_mb": setup_rss, "peak_rss_mb": peak_rss_mb()})
+
+
+def run(ops, scales, kinds, attributes, repeat):
+    context = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
+    results = []
+    for op in ops:
+        missing = [lib for lib in OPS[op][1] if not is_available(lib)]
+        for n_edges in scales:
+            for kind in kinds:
+                for attrs in attributes:
+                    case = {
+                        "case": f"{op}/{kind}/{attrs}/{n_edges}",
+                        "op": op,
+                        "n_edges": n_edges,
+                        "kind": kind,
+                        "attributes": attrs,
+                    }
+                    if missing:
+                        case["status"] = f"skipped, missing {', '.join(missing)}"
+                        results.append(case)
+                        print(format_case(case), flush=True)
+                        continue
+
+                    queue = context.Queue()
+                    process = context.Process(
+                        target=run_case, args=(op, n_edges, kind, attrs, repeat, queue)
+                    )
+                    process.start()
+                    process.join()
+                    if process.exitcode != 0:
+                        case["status"] = f"failed with exit code {process.exitcode}"
+                    else:
+                        measured = queue.get()
+                        case.update(measured)
+                        case["time_s"] = min(measured["times"])
+                        case["status"] = "ok"
+                    results.append(case)
+                    print(format_case(case), flush=True)
+    return results
+
+
+def format_case(case):
+    if case["status"] != "ok":
+        return f"{case['case']:<45} {case['status']}"
+    return (
+        f"{case['case']:<45} {case['time_s']:>10.4f} s "
+        f"{case['peak_rss_mb']:>10.1f} MB peak ({case['setup_rss_mb']:.1f} MB setup)"
+    )
+
+
+def compare(results, baseline, tolerance):
+    """Returns the cases that are slower or use more memory than in the baseline."""
+    previous = {case["case"]: case for case in baseline["results"] if case["status"] == "ok"}
+    regressions = []
+    for case in results:
+        old = previous.get(case["case"])
+        if case["status"] != "ok" or old is None:
+            continue
+        for metric in ("time_s", "peak_rss_mb"):
+            ratio = case[metric] / old[metric] if old[metric] else 1.0
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    {
+                        "case": case["case"],
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": case[metric],
+                        "ratio": ratio,
+                    }
+                )
+    return regressions
+
+
+def metadata():
+    versions = {}
+    for library in ("numpy", "networkx", "igraph", "graph_tool"):
+        try:
+            versions[library] = importlib.import_module(library).__version__
+        except (ImportError, AttributeError):
+            versions[library] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "versions": versions,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", nargs="+", default=list(OPS), choices=list(OPS))
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=lambda s: int(float(s)),
+        default=[1000, 10000, 100000],
+        help="number of edges, e.g. 1e3 1e4 1e5 1e6 1e7",
+    )
+    parser.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    parser.add_argument("--attributes", nargs="+", default=ATTRIBUTES, choices=ATTRIBUTES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative slowdown that counts as regression, defaults to 0.2",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args.ops, args.scales, args.kinds, args.attributes, args.repeat)
+    report = {"meta": metadata(), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['case']} {r['metric']}: "
+                f"{r['baseline']:.4f} -> {r['current']:.4f} ({r['ratio']:.2f}x)"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,578 @@
-from collections import defaultdict, abc
-import numbers
-from .infer import infer_type
-from .exceptions import PyIntergraphCompatibilityException
+from functools import partial
+from itertools import chain
+
+import numpy as np
+
+import pyintergraph
+from .columns import (
+    CategoricalColumn,
+    Column,
+    ColumnBuilder,
+    LazyColumns,
+    ValuesView,
+    columns_from_dicts,
+    edge_array,
+    has_parallel_edges,
+    iter_rows,
+    select_columns,
+    take_columns,
+)
+from .infer import infer_array_type, is_scalar_type
+from .exceptions import PyIntergraphCompatibilityException, PyIntergraphInferException
+from .parallel import map_columns
+from .profiling import profiled, stage
 
 
 class InterGraph:
     """This defines a interchangeable format that can be read in by the 'from_'-classmethods
     and convert the interchangeable format the package formats with the 'to_'-methods
+
+    Internally, the graph is stored column-wise: the edges as a contiguous (E, 2)
+    integer array of node indices, the node labels as one Column and every node-
+    and edge attribute as a typed Column with a validity mask (see columns.py).
+    The attributes nodes, node_labels, node_attributes, edges and edge_attributes
+    are built from these columns on access.
     """
 
     def __init__(
         self, nodes, node_labels, node_attributes, edges, edge_attributes, is_directed
     ):
-        self.nodes = nodes
-        self.node_labels = node_labels
-        self.node_attributes = node_attributes
+        nodes = list(nodes)
+        edges = list(edges)
+        if nodes != list(range(len(nodes))):
+            position = {node: i for i, node in enumerate(nodes)}
+            edges = [(position[u], position[v]) for u, v in edges]
+
+        self._set_columns(
+            labels=Column.from_values(node_labels[node] for node in nodes),
+            edges=edge_array(edges),
+            node_columns=columns_from_dicts(node_attributes, len(nodes)),
+            edge_columns=columns_from_dicts(edge_attributes, len(edges)),
+            is_directed=is_directed,
+        )
+
+    def _set_columns(
+        self, labels, edges, node_columns, edge_columns, is_directed, is_multigraph=None
+    ):
+        self.labels = labels
+        self.node_columns = node_columns
 
-        self.edges = edges
-        self.edge_attributes = edge_attributes
+        self.edge_array = edges
+        self.edge_columns = edge_columns
 
         self.is_directed = is_directed
         self.use_labels = True
 
+        self._is_multigraph = is_multigraph
+        self._value_types = {}
+        # node label -> node index, see delta.node_index
+        self._label_index = None
+
+    @classmethod
+    def from_columns(
+        cls,
+        labels,
+        edges,
+        is_directed,
+        node_columns=None,
+        edge_columns=None,
+        is_multigraph=None,
+    ):
+        """Creates a Graph object directly from its columnar representation.
+
+        :params:
+            labels: Column or sequence with one label per node.
+                nodes are identified by their position in labels.
+            edges: (E, 2) integer array of node indices.
+            is_directed: bool
+            node_columns: dict of attribute name -> Column of length N, defaults to None.
+            edge_columns: dict of attribute name -> Column of length E, defaults to None.
+            is_multigraph: None or bool, defaults to None.
+                whether the edges contain parallel edges, if already known.
+                if None, this is detected on first access of is_multigraph.
+        :returns:
+            Graph object
+        """
+        if not isinstance(labels, Column):
+            labels = Column.from_values(labels)
+
+        G = cls.__new__(cls)
+        G._set_columns(
+            labels=labels,
+            edges=edge_array(edges),
+            node_columns=node_columns or {},
+            edge_columns=edge_columns or {},
+            is_directed=is_directed,
+            is_multigraph=is_multigraph,
+        )
+        return G
+
+    @property
+    def n_nodes(self):
+        return len(self.labels)
+
+    @property
+    def n_edges(self):
+        return len(self.edge_array)
+
+    @property
+    def is_multigraph(self):
+        """Whether the graph contains parallel edges, detected once and then cached.
+
+        For undirected graphs, (u, v) and (v, u) count as the same edge.
+        """
+        if self._is_multigraph is None:
+            self._is_multigraph = has_parallel_edges(self.edge_array, self.is_directed)
+        return self._is_multigraph
+
+    def _value_type(self, kind, key, column):
+        """Returns the graph-tool value type of a column, inferred once per column."""
+        cache_key = (kind, key, pyintergraph.USE_LONG_DOUBLE)
+        cached = self._value_types.get(cache_key)
+        if cached is not None and cached[0] is column:
+            return cached[1]
+
+        value_type = _infer_value_type(kind, key, column)
+        self._value_types[cache_key] = (column, value_type)
+        return value_type
+
+    @property
+    def nodes(self):
+        return list(range(self.n_nodes))
+
+    @property
+    def node_labels(self):
+        return dict(enumerate(self.labels.tolist()))
+
+    @property
+    def node_attributes(self):
+        return list(iter_rows(self.node_columns, self.n_nodes))
+
+    @property
+    def edges(self):
+        return [tuple(edge) for edge in self.edge_array.tolist()]
+
+    @property
+    def edge_attributes(self):
+        return list(iter_rows(self.edge_columns, self.n_edges))
+
+    @profiled("filter")
+    def filter(self, node_filter=None, edge_filter=None):
+        """Returns a new Graph object with only the nodes and edges that pass the filters.
+
+        The filters are evaluated on whole columns. Edges of removed nodes are removed as
+        well and the remaining nodes are renumbered in a single vectorized pass.
+        On a lazy Graph object, only the columns used by the filters are extracted.
+
+        :params:
+            node_filter: None, boolean array of length n_nodes or callable, defaults to None.
+                a callable is called with a mapping of node attribute name -> values array
+                and has to return the boolean array, e.g. lambda nodes: nodes["kind"] == "a".
+                Attributes that are not set on every node are np.ma.MaskedArrays that mask
+                the unset entries. Masked entries of the returned array count as False,
+                e.g. nodes["size"] == 0 does not keep nodes without size.
+                np.ma.getmaskarray(nodes["size"]) selects the nodes without size.
+            edge_filter: None, boolean array of length n_edges or callable, defaults to None.
+                same as node_filter for the edges, e.g. lambda edges: edges["weight"] > 0.5.
+        :returns:
+            Graph object
+        """
+        node_mask = _filter_mask(node_filter, self.node_columns, self.n_nodes, "node")
+        edge_mask = _filter_mask(edge_filter, self.edge_columns, self.n_edges, "edge")
+
+        labels = self.labels
+        node_columns = self.node_columns
+        if node_mask is not None:
+            with stage("filter_nodes", count=self.n_nodes):
+                node_index = np.flatnonzero(node_mask)
+                labels = labels.take(node_index)
+                node_columns = take_columns(node_columns, node_index)
+
+                has_endpoints = node_mask[self.edge_array].all(axis=1)
+                edge_mask = has_endpoints if edge_mask is None else edge_mask & has_endpoints
+
+        edges = self.edge_array
+        edge_columns = self.edge_columns
+        if edge_mask is not None:
+            with stage("filter_edges", count=self.n_edges):
+                edge_index = np.flatnonzero(edge_mask)
+                edges = edges[edge_index]
+                edge_columns = take_columns(edge_columns, edge_index)
+
+                if node_mask is not None:
+                    position = np.cumsum(node_mask, dtype=np.int64) - 1
+                    edges = position[edges]
+
+        return type(self).from_columns(
+            labels,
+            edges,
+            self.is_directed,
+            node_columns,
+            edge_columns,
+            is_multigraph=False if self._is_multigraph is False else None,
+        )
+
+    def _apply_filters(self, node_filter, edge_filter):
+        if node_filter is None and edge_filter is None:
+            return self
+        return self.filter(node_filter=node_filter, edge_filter=edge_filter)
+
+    @profiled("apply_changes")
+    def apply_changes(self, changes, target=None, labelname=None):
+        """Returns a new Graph object with the changes of a ChangeLog applied.
+
+        Nodes and edges are looked up by node label through an index that is built once
+        and handed on to the returned Graph object, so that a series of updates only
+        touches the changed nodes and edges. Removed nodes are dropped, the remaining nodes
+        keep their order and new nodes are appended.
+
+        :params:
+            changes: delta.ChangeLog
+            target: None, igraph Graph or graph-tool Graph, defaults to None.
+                a graph converted from this Graph object with to_igraph or to_graph_tool
+                and only changed with apply_changes since. The changes are applied to it
+                in place and its vertex indices stay the node indices of the returned
+                Graph object.
+            labelname: None or str, defaults to None.
+                the labelname the graph-tool target was converted with.
+        :returns:
+            Graph object
+        """
+        from . import delta
+
+        return delta.apply_changes(self, changes, target=target, labelname=labelname)
+
+    @profiled("to_shared_memory")
+    def to_shared_memory(self):
+        """Copies the Graph object into a shared memory block for other processes.
+
+        The edges, numeric labels and the values, masks and codes of all attributes are
+        stored in one block of multiprocessing.shared_memory. Strings and other python
+        objects are pickled with the returned handle.
+
+        :returns:
+            shared.SharedGraph, a picklable handle of the block. The calling process owns the
+            block and has to close the handle once no process uses the graph anymore.
+        """
+        from .shared import SharedGraph
+
+        return SharedGraph(self)
+
+    @classmethod
+    @profiled("from_shared_memory")
+    def from_shared_memory(cls, shared):
+        """Attaches to a Graph object in shared memory without copying its arrays.
+
+        The arrays of the returned Graph object are read-only views of the block, conversions
+        like to_igraph or to_graph_tool work as usual.
+
+        :params:
+            shared: shared.SharedGraph returned by to_shared_memory.
+        :returns:
+            Graph object
+        """
+        return shared.attach(cls)
+
+    @profiled("save")
+    def save(self, path):
+        """Writes the Graph object to a file in the native binary format of pyintergraph.
+
+        The edges and numeric attributes are stored as raw arrays, string labels as table of
+        strings and string attributes dictionary-encoded. See storage.py for the layout.
+
+        :params:
+            path: path of the file
+        """
+        from . import storage
+
+        storage.save(self, path)
+
+    @classmethod
+    @profiled("load")
+    def load(cls, path, mmap=True):
+        """Reads a Graph object from a file written by save.
+
+        Attributes of python objects other than strings and numbers are stored pickled and
+        unpickling can run arbitrary code. Only load files from trusted sources.
+
+        :params:
+            path: path of the file
+            mmap: bool, defaults to True.
+                if True, the edges and numeric attributes are memory-mapped read-only
+                instead of read into memory. Processes that load the same file share
+                these pages.
+        :returns:
+            Graph object
+        """
+        from . import storage
+
+        return storage.load(cls, path, mmap=mmap)
+
+    @classmethod
+    @profiled("from_edgelist")
+    def from_edgelist(
+        cls,
+        path,
+        is_directed=True,
+        delimiter=None,
+        comments="#",
+        nodetype=None,
+        data=(),
+        chunksize=None,
+    ):
+        """Reads a Graph object from an edge list with one edge per line.
+
+        The file is parsed in chunks of chunksize lines, node labels are mapped to integer
+        ids while reading. Nodes without edges cannot be represented in an edge list.
+
+        :params:
+            path: path of the file or a file object opened in text mode
+            is_directed: bool, defaults to True.
+            delimiter: None or str, defaults to None.
+                separator of the fields, None splits on any whitespace.
+            comments: None or str, defaults to '#'.
+                everything after this marker is ignored.
+            nodetype: None or callable, defaults to None.
+                converts the node labels, e.g. int. If None, labels are kept as str.
+            data: sequence of (name, type)-pairs, defaults to ().
+                the edge attributes that follow source and target on every line,
+                e.g. [("weight", float)]. Further fields are ignored.
+            chunksize: None or int, defaults to None.
+                number of lines parsed at once, defaults to edgelist.CHUNKSIZE.
+        :returns:
+            Graph object
+        """
+        from . import edgelist
+
+        return edgelist.read_edgelist(
+            cls,
+            path,
+            is_directed,
+            delimiter,
+            comments,
+            nodetype,
+            data,
+            chunksize or edgelist.CHUNKSIZE,
+        )
+
+    @classmethod
+    @profiled("from_csv")
+    def from_csv(
+        cls,
+        path,
+        is_directed=True,
+        nodes_path=None,
+        source="source",
+        target="target",
+        node_id="id",
+        delimiter=",",
+        nodetype=None,
+        dtypes=None,
+        chunksize=None,
+    ):
+        """Reads a Graph object from CSV files with a header row.
+
+        The edge file has a source and a target column, all other columns become edge
+        attributes. Optionally, a node file with an id column and node attributes is read
+        first; it also defines the order of the nodes and can contain nodes without edges.
+        Both files are parsed in chunks of chunksize rows. Empty fields mean that the
+        attribute is not set.
+
+        :params:
+            path: path of the edge file or a file object opened in text mode
+            is_directed: bool, defaults to True.
+            nodes_path: None or path of the node file, defaults to None.
+            source: name of the source column, defaults to 'source'.
+            target: name of the target column, defaults to 'target'.
+            node_id: name of the label column in the node file, defaults to 'id'. Every
+                node id may only appear once in the node file.
+            delimiter: str, defaults to ','.
+            nodetype: None or callable, defaults to None.
+                converts the node labels, e.g. int. If None, labels are kept as str.
+            dtypes: None or dict of column name -> type, defaults to None.
+                types of the attribute columns. Columns without type are parsed as
+                bool, int or float if possible and kept as str otherwise.
+            chunksize: None or int, defaults to None.
+                number of rows parsed at once, defaults to edgelist.CHUNKSIZE.
+        :returns:
+            Graph object
+        """
+        from . import edgelist
+
+        return edgelist.read_csv(
+            cls,
+            path,
+            is_directed,
+            nodes_path,
+            source,
+            target,
+            node_id,
+            delimiter,
+            nodetype,
+            dtypes,
+            chunksize or edgelist.CHUNKSIZE,
+        )
+
+    @profiled("to_edgelist")
+    def to_edgelist(self, path, delimiter=" ", data=False, chunksize=None):
+        """Writes the edges to an edge list with one edge per line, see from_edgelist.
+
+        :params:
+            path: path of the file or a file object opened in text mode
+            delimiter: str, defaults to ' '.
+            data: bool or list of edge attribute names, defaults to False.
+                the edge attributes written after source and target, True writes all.
+            chunksize: None or int, defaults to None.
+                number of edges formatted at once, defaults to edgelist.CHUNKSIZE.
+        """
+        from . import edgelist
+
+        edgelist.write_edgelist(self, path, delimiter, data, chunksize or edgelist.CHUNKSIZE)
+
+    @profiled("to_csv")
+    def to_csv(
+        self,
+        path,
+        nodes_path=None,
+        source="source",
+        target="target",
+        node_id="id",
+        delimiter=",",
+        chunksize=None,
+    ):
+        """Writes the edges and optionally the nodes to CSV files, see from_csv.
+
+        Attributes that are not set are written as empty fields.
+
+        :params:
+            path: path of the edge file or a file object opened in text mode
+            nodes_path: None or path of the node file, defaults to None.
+                if None, only the edges are written.
+            source: name of the source column, defaults to 'source'.
+            target: name of the target column, defaults to 'target'.
+            node_id: name of the label column in the node file, defaults to 'id'.
+            delimiter: str, defaults to ','.
+            chunksize: None or int, defaults to None.
+                number of rows formatted at once, defaults to edgelist.CHUNKSIZE.
+        """
+        from . import edgelist
+
+        edgelist.write_csv(
+            self,
+            path,
+            nodes_path,
+            source,
+            target,
+            node_id,
+            delimiter,
+            chunksize or edgelist.CHUNKSIZE,
+        )
+
+    @profiled("to_arrow")
+    def to_arrow(self, node_id="id", source="source", target="target"):
+        """Converts the Graph object to two pyarrow Tables.
+
+        Numeric columns are handed to Arrow without copying their values, attributes that
+        are not set become nulls. Whether the graph is directed is stored in the schema
+        metadata of the edges table.
+
+        :params:
+            node_id: name of the node label column, defaults to 'id'.
+            source: name of the source column, defaults to 'source'.
+            target: name of the target column, defaults to 'target'.
+        :returns:
+            nodes table with the node labels and node attributes,
+            edges table with the positions of source and target in the nodes table
+            and the edge attributes.
+        """
+        from . import arrow
+
+        return arrow.to_arrow(self, node_id=node_id, source=source, target=target)
+
+    @classmethod
+    @profiled("from_arrow")
+    def from_arrow(
+        cls, nodes, edges, is_directed=None, node_id="id", source="source", target="target"
+    ):
+        """Creates a Graph object from two pyarrow Tables, see to_arrow.
+
+        Numeric columns without nulls share their buffers with the Arrow arrays.
+
+        :params:
+            nodes: None or pyarrow Table with the node labels and node attributes.
+                if None, the nodes are labeled by their positions.
+            edges: pyarrow Table with the positions of source and target in nodes.
+            is_directed: None or bool, defaults to None.
+                if None, this is read from the schema metadata written by to_arrow.
+            node_id: name of the node label column, defaults to 'id'.
+            source: name of the source column, defaults to 'source'.
+            target: name of the target column, defaults to 'target'.
+        :returns:
+            Graph object
+        """
+        from . import arrow
+
+        return arrow.from_arrow(
+            cls,
+            nodes,
+            edges,
+            is_directed=is_directed,
+            node_id=node_id,
+            source=source,
+            target=target,
+        )
+
+    @profiled("to_parquet")
+    def to_parquet(self, nodes_path, edges_path, **kwargs):
+        """Writes the tables of to_arrow to two Parquet files.
+
+        :params:
+            nodes_path: path of the nodes file
+            edges_path: path of the edges file
+            kwargs: passed to pyarrow.parquet.write_table, e.g. compression.
+        """
+        from . import arrow
+
+        arrow.to_parquet(self, nodes_path, edges_path, **kwargs)
+
+    @classmethod
+    @profiled("from_parquet")
+    def from_parquet(cls, nodes_path, edges_path, is_directed=None, attributes=None):
+        """Reads a Graph object from two Parquet files written by to_parquet.
+
+        :params:
+            nodes_path: path of the nodes file
+            edges_path: path of the edges file
+            is_directed: None or bool, defaults to None.
+                if None, this is read from the metadata of the edges file.
+            attributes: None or list of attribute names, defaults to None.
+                if given, only these node- and edge attributes are read.
+        :returns:
+            Graph object
+        """
+        from . import arrow
+
+        return arrow.from_parquet(
+            cls, nodes_path, edges_path, is_directed=is_directed, attributes=attributes
+        )
+
     @classmethod
-    def from_networkx(cls, nxG):
+    @profiled("from_networkx")
+    def from_networkx(cls, nxG, lazy=False, node_filter=None, edge_filter=None):
         """Converts networkX Graph to Graph object
 
+        Nodes are numbered in a single pass over the graph, edge endpoints are written
+        directly into a preallocated integer array and attributes are collected into one
+        column per key.
+
         :params:
             nxG:networkX-Graph
+            lazy: bool, defaults to False.
+                if True, only the names of the attributes are collected. Every attribute
+                column is extracted from nxG on first access, e.g. by a to_*-method with
+                attributes=[...]. nxG must not be changed until then.
+            node_filter, edge_filter: None, boolean arrays or callables, defaults to None.
+                keep only some nodes and edges, see filter.
         :returns:
             Graph object
         """
@@ -38,37 +583,66 @@ class InterGraph:
 
         is_directed = nxG.is_directed()
 
-        try:
-            next(iter(nxG.nodes))
-            nodes = list(range(nx.number_of_nodes(nxG)))
-            node_labels, node_attributes = zip(*nxG.nodes(data=True))
-            node_labels = {node: label for node, label in zip(nodes, node_labels)}
-        except StopIteration:
-            nodes = []
-            node_labels, node_attributes = {}, []
-
-        label_map = {label: node for node, label in node_labels.items()}
-        try:
-            next(iter(nxG.edges()))
-            u_s, v_s, edge_attributes = zip(*nxG.edges(data=True))
-        except StopIteration:
-            u_s, v_s, edge_attributes = [], [], []
-
-        edges = [(label_map[u], label_map[v]) for u, v in zip(u_s, v_s)]
-
-        return cls(
-            nodes, node_labels, node_attributes, edges, edge_attributes, is_directed
+        n_nodes = nxG.number_of_nodes()
+        n_edges = nxG.number_of_edges()
+
+        with stage("read_nodes", count=n_nodes):
+            index = {}
+            labels = []
+            node_columns = _NetworkxAttributes(nxG.nodes) if lazy else ColumnBuilder()
+            for i, (label, data) in enumerate(nxG.nodes(data=True)):
+                index[label] = i
+                labels.append(label)
+                if data:
+                    node_columns.add(i, data)
+            labels = Column.from_values(labels)
+            node_columns = node_columns.build(n_nodes)
+
+        edge_columns = _NetworkxAttributes(nxG.edges) if lazy else ColumnBuilder()
+
+        def endpoints():
+            for i, (u, v, data) in enumerate(nxG.edges(data=True)):
+                if data:
+                    edge_columns.add(i, data)
+                yield index[u]
+                yield index[v]
+
+        with stage("read_edges", count=n_edges):
+            edges = np.fromiter(endpoints(), dtype=np.int64, count=2 * n_edges)
+            edges = edges.reshape(n_edges, 2)
+            edge_columns = edge_columns.build(n_edges)
+
+        G = cls.from_columns(
+            labels,
+            edges,
+            is_directed,
+            node_columns,
+            edge_columns,
+            is_multigraph=None if nxG.is_multigraph() else False,
         )
+        return G._apply_filters(node_filter, edge_filter)
 
     @classmethod
-    def from_graph_tool(cls, gtG, labelname=None):
+    @profiled("from_graph_tool")
+    def from_graph_tool(
+        cls, gtG, labelname=None, lazy=False, node_filter=None, edge_filter=None
+    ):
         """Converts graph-tool Object to Graph
 
+        Edges and scalar properties are read as numpy arrays, only string-, vector-
+        and python::object-properties are read element by element.
+
         :params:
             gtG:graph-tool Graph object
             labelname:None or vertex_attribute
                 if None node labels will be set equal to vertex-indices.
                 otherwise a vertex-attribute, that contains the node labels can be set.
+            lazy: bool, defaults to False.
+                if True, every property map is read on first access of its column,
+                e.g. by a to_*-method with attributes=[...]. gtG must not be changed
+                until then.
+            node_filter, edge_filter: None, boolean arrays or callables, defaults to None.
+                keep only some nodes and edges, see filter.
         :returns:
             Graph object
         """
@@ -77,129 +651,67 @@ class InterGraph:
         if not isinstance(gtG, Graph):
             raise TypeError("gtG must be an instance of graph_tool.Graph() !")
 
-        is_directed = gtG.is_directed()
-
-        def create_nodes(g):
-            for v in g.vertices():
-                attrs = {
-                    attr: g.vertex_properties[attr][v]
-                    for attr in g.vertex_properties.keys()
-                    if not attr == labelname
-                }
-                yield (v, attrs)
-
-        def create_edges(g):
-            for e in g.edges():
-                attrs = {
-                    attr: g.edge_properties[attr][e]
-                    for attr in g.edge_properties.keys()
-                    if not attr == labelname
-                }
-                yield ((e.source(), e.target()), attrs)
-
-        try:
-            next(gtG.edges())
-            gt_edges, edge_attributes = zip(*create_edges(gtG))
-        except StopIteration:
-            gt_edges, edge_attributes = [], []
-
-        try:
-            next(gtG.vertices())
-            gt_nodes, node_attributes = zip(*create_nodes(gtG))
-        except StopIteration:
-            gt_nodes, node_attributes = [], []
-
-        if len(gt_nodes) == 0:
-            return cls([], [], {}, [], [], is_directed)
-
-        # create name-map for nodes
-        nodemap = {v: i for v, i in zip(gtG.vertices(), gtG.get_vertices())}
-        if labelname:
-            node_labels = {
-                v: label
-                for v, label in zip(
-                    gtG.get_vertices(), gtG.vertex_properties[labelname]
-                )
-            }
-            nodes = list(node_labels.keys())
-        else:
-            node_labels = {i: i for i in gtG.get_vertices()}
-            nodes = list(node_labels.keys())
-
-        if not is_directed:
-            edges = []
-            for u, v in gt_edges:
-                u = nodemap[u]
-                v = nodemap[v]
-                if node_labels[u] < node_labels[v]:
-                    edges.append((u, v))
-                else:
-                    edges.append((v, u))
-            edges = sorted(edges)
-        else:
-            edges = [(nodemap[u], nodemap[v]) for u, v in gt_edges]
-
-        return cls(
-            nodes, node_labels, node_attributes, edges, edge_attributes, is_directed
+        is_directed, labels, edges, node_columns, edge_columns = _read_graph_tool(
+            gtG, labelname
         )
+        if not lazy:
+            node_columns, edge_columns = dict(node_columns), dict(edge_columns)
+        G = cls.from_columns(labels, edges, is_directed, node_columns, edge_columns)
+        return G._apply_filters(node_filter, edge_filter)
 
     @classmethod
-    def from_igraph(cls, iG):
-        import igraph
-
+    @profiled("from_igraph")
+    def from_igraph(cls, iG, lazy=False, node_filter=None, edge_filter=None):
         """Converts igraph-Graph to Graph object
+
+        The edge list is read with a single call and every attribute is read as a whole
+        column. If present, the vertex attribute 'name' is used as node labels.
+
+        :params:
+            iG:igraph-Graph
+            lazy: bool, defaults to False.
+                if True, every attribute is read on first access of its column,
+                e.g. by a to_*-method with attributes=[...]. iG must not be changed
+                until then.
+            node_filter, edge_filter: None, boolean arrays or callables, defaults to None.
+                keep only some nodes and edges, see filter.
+        :returns:
+            Graph object
         """
+        import igraph
 
         if not isinstance(iG, igraph.Graph):
             raise TypeError("iG must be instance of igraph.Graph() !")
 
-        is_directed = iG.is_directed()
-
-        # check if edges are present
-        try:
-            edges, edge_attributes = zip(*((e.tuple, e.attributes()) for e in iG.es()))
-        except ValueError:
-            edges, edge_attributes = [], ()
-
-        # check if nodes are present
-        try:
-            nodes, node_attributes = zip(*((n.index, n.attributes()) for n in iG.vs()))
-        except ValueError:
-            nodes, node_attributes = [], ()
-
-        node_labels = {}
-        for node, node_attrs in zip(nodes, node_attributes):
-            if "name" in node_attrs:
-                node_labels[node] = node_attrs["name"]
-                del node_attrs["name"]
-            else:
-                node_labels[node] = node
-
-        return cls(
-            list(nodes),
-            node_labels,
-            node_attributes,
-            list(edges),
-            edge_attributes,
-            is_directed,
-        )
+        is_directed, labels, edges, node_columns, edge_columns = _read_igraph(iG)
+        if not lazy:
+            node_columns, edge_columns = dict(node_columns), dict(edge_columns)
+        G = cls.from_columns(labels, edges, is_directed, node_columns, edge_columns)
+        return G._apply_filters(node_filter, edge_filter)
 
-    def to_networkx(self):
+    @profiled("to_networkx")
+    def to_networkx(self, multigraph=None, copy_attributes=True, attributes=None):
         """
         Converts Graph object to networkX Graph.
 
         :params:
-            use_labels:bool, defaults to true
-                choose whether to use labels or indices as names for the nodes.
-                if no specific labels were read in, these to are equal.
+            multigraph: None or bool, defaults to None.
+                whether to create a Multi(Di)Graph. If None, this is decided by
+                whether the graph contains parallel edges.
+            copy_attributes: bool, defaults to True.
+                if False, the attribute-dicts created from the edge columns are used as
+                edge data of the networkX Graph directly instead of being copied by
+                networkX. Parallel edges in a graph created with multigraph=False then
+                keep only the attributes of the last edge.
+            attributes: None or list of attribute names, defaults to None.
+                if given, only these node- and edge attributes are converted.
 
         :returns:
             networkX Graph, DiGraph, MultiGraph or MultiDiGraph
         """
         import networkx as nx
 
-        # is multi?
-        is_multigraph = len(self.edges) > len(set(self.edges))
+        is_multigraph = self.is_multigraph if multigraph is None else multigraph
 
         # select appropriate networkX-Graph-Type
         if self.is_directed and not is_multigraph:
@@ -211,132 +723,526 @@ class InterGraph:
         else:
             nxG = nx.MultiDiGraph()
 
-        nxG.add_nodes_from(
-            zip((self.node_labels[n] for n in self.nodes), self.node_attributes)
-        )
+        node_columns = select_columns(self.node_columns, attributes)
+        edge_columns = select_columns(self.edge_columns, attributes)
+
+        labels = self.labels.values
+        with stage("add_nodes", count=self.n_nodes):
+            nxG.add_nodes_from(zip(labels.tolist(), iter_rows(node_columns, self.n_nodes)))
 
-        for edge, edge_attr in zip(self.edges, self.edge_attributes):
-            u, v = edge
-            nxG.add_edge(self.node_labels[u], self.node_labels[v], **edge_attr)
+        with stage("add_edges", count=self.n_edges):
+            us = labels[self.edge_array[:, 0]].tolist()
+            vs = labels[self.edge_array[:, 1]].tolist()
+            edge_attributes = iter_rows(edge_columns, self.n_edges)
+
+            if copy_attributes:
+                nxG.add_edges_from(zip(us, vs, edge_attributes))
+            else:
+                _add_edges_without_copy(nxG, us, vs, edge_attributes)
 
         return nxG
 
-    def to_graph_tool(self, labelname=None):
+    @profiled("to_graph_tool")
+    def to_graph_tool(self, labelname=None, workers=None, attributes=None, chunksize=None):
         """Converts Graph object to graph-tool Graph.
 
+        Vertices and edges are added in bulk from the edge array. Scalar property maps
+        are filled through their array view, only string-, vector- and python::object-
+        properties are set element by element.
+
         :params:
             labelname: name for vertex_attribute None, defaults to None.
                 if node labels should be kept as vertex attribute,
                 the name for the vertex attribute can be specified this way.
+            workers: None or int, defaults to None.
+                number of threads that infer the value types and convert the values of
+                the numeric attributes in parallel, see parallel.map_columns. String-,
+                vector- and python::object-attributes are converted in the calling
+                thread, as they hold the GIL.
+            attributes: None or list of attribute names, defaults to None.
+                if given, only these node- and edge attributes are converted.
+            chunksize: None or int, defaults to None.
+                if given, the edges are added in chunks of this many edges, so that a
+                memory-mapped edge array is read sequentially, see outofcore.py.
+        """
+        return _write_graph_tool(
+            self.n_nodes,
+            self.edge_array,
+            self.is_directed,
+            self.labels if labelname else None,
+            select_columns(self.node_columns, attributes).items(),
+            select_columns(self.edge_columns, attributes).items(),
+            labelname=labelname,
+            value_type=self._value_type,
+            workers=workers,
+            chunksize=chunksize,
+        )
+
+    @profiled("to_igraph")
+    def to_igraph(self, attributes=None, chunksize=None):
+        """Converts Graph object to igraph Graph.
+
+        The graph is created with a single call from the edge array, every node- and
+        edge attribute is then assigned as a whole column.
+        The node labels are stored in the vertex attribute 'name'.
+
+        :params:
+            attributes: None or list of attribute names, defaults to None.
+                if given, only these node- and edge attributes are converted.
+            chunksize: None or int, defaults to None.
+                if given, the edges are added in chunks of this many edges instead of
+                converting the whole edge array to a list first. Every chunk costs a
+                pass over the graph in igraph, so chunks should be large.
+        :returns:
+            igraph Graph
         """
-        import graph_tool.all as gt
-
-        gtG = gt.Graph(directed=self.is_directed)
-
-        if len(self.nodes) == 0:
-            return gtG
-
-        attrs = {}
-        node_type = infer_type(self.node_labels.values(), as_vector=False)
-
-        if labelname:
-            attrs[labelname] = gtG.new_vertex_property(node_type)
-
-        nodes = {}
-        node_property_type_assertion = defaultdict(set)
-
-        for nx_node, data in zip(self.nodes, self.node_attributes):
-            v = gtG.add_vertex()
-            if labelname:
-                attrs[labelname][v] = self.node_labels[nx_node]
-            nodes[nx_node] = v
-
-            for key, val in data.items():
-                # Single Type assertion
-                node_property_type_assertion[key].add(type(val))
-                if len(node_property_type_assertion[key]) > 1:
-                    raise Exception(
-                        f"Type not equal for all nodes on Node-Attribute {key}, \
-                        types found: {node_property_type_assertion[key]}"
-                    )
-
-                if key not in attrs:
-                    as_vector = isinstance(val, abc.Iterable) and not isinstance(
-                        val, str
-                    )
-                    attrs[key] = gtG.new_vertex_property(
-                        infer_type(val, as_vector=as_vector)
-                    )
-
-                attrs[key][v] = val
-
-        for attr_name, attr_val in attrs.items():
-            gtG.vertex_properties[attr_name] = attr_val
-
-        attrs = {}
-        edge_property_assertion = defaultdict(set)
-        for e, data in zip(self.edges, self.edge_attributes):
-            u, v = e
-            edge = gtG.add_edge(nodes[u], nodes[v])
-            for key, val in data.items():
-                # Single Type assertion
-                edge_property_assertion[key].add(type(val))
-                if len(edge_property_assertion[key]) > 1:
-                    raise Exception(
-                        f"Type not equal for all edges on Edge-Attribute {key}, \
-                        types found: {edge_property_assertion[key]}"
-                    )
-
-                if key not in attrs:
-                    as_vector = isinstance(val, abc.Iterable) and not isinstance(
-                        val, str
-                    )
-                    attrs[key] = gtG.new_edge_property(
-                        infer_type(val, as_vector=as_vector)
-                    )
-
-                attrs[key][edge] = val
-
-        for attr_key, attr_val in attrs.items():
-            gtG.edge_properties[attr_key] = attr_val
+        return _write_igraph(
+            self.n_nodes,
+            self.edge_array,
+            self.is_directed,
+            self.labels,
+            select_columns(self.node_columns, attributes).items(),
+            select_columns(self.edge_columns, attributes).items(),
+            chunksize=chunksize,
+        )
+
+
+def _read_graph_tool(gtG, labelname=None):
+    """Reads a graph-tool Graph column by column.
 
+    :returns:
+        is_directed, label Column, (E, 2) edge array and LazyColumns of the node- and
+        edge attributes, which read every property map on first access.
+    """
+    is_directed = gtG.is_directed()
+
+    vertices = gtG.get_vertices()
+    if len(vertices) == 0:
+        empty = Column.from_values([])
+        return is_directed, empty, edge_array([]), LazyColumns({}), LazyColumns({})
+
+    with stage("read_edges", count=gtG.num_edges()):
+        gt_edges = gtG.get_edges([gtG.edge_index])
+        edges = gt_edges[:, :2]
+        edge_index = gt_edges[:, 2]
+
+        # vertex indices can have gaps if the graph is filtered
+        if not np.array_equal(vertices, np.arange(len(vertices))):
+            position = np.full(vertices.max() + 1, -1, dtype=np.int64)
+            position[vertices] = np.arange(len(vertices))
+            edges = position[edges]
+
+        # canonical edge order for undirected graphs
+        order = None
+        if not is_directed:
+            edges = np.column_stack([edges.min(axis=1), edges.max(axis=1)])
+            order = np.lexsort((edges[:, 1], edges[:, 0]))
+            edges = edges[order]
+            edge_index = edge_index[order]
+
+    if labelname:
+        with stage("read_labels", count=len(vertices)):
+            labels = _property_column(
+                gtG.vertex_properties[labelname], vertices, gtG.vertices, categorical=False
+            )
+    else:
+        labels = Column(vertices)
+
+    def node_column(attr, prop):
+        with stage("read_attribute", count=len(vertices), attribute=attr):
+            return _property_column(prop, vertices, gtG.vertices)
+
+    def edge_column(attr, prop):
+        with stage("read_attribute", count=len(edges), attribute=attr):
+            column = _property_column(prop, edge_index, gtG.edges)
+            if order is not None and not is_scalar_type(prop.value_type()):
+                column = column.take(order)
+        return column
+
+    node_columns = LazyColumns(
+        {
+            attr: partial(node_column, attr, prop)
+            for attr, prop in gtG.vertex_properties.items()
+            if attr != labelname
+        }
+    )
+    edge_columns = LazyColumns(
+        {
+            attr: partial(edge_column, attr, prop)
+            for attr, prop in gtG.edge_properties.items()
+            if attr != labelname
+        }
+    )
+    return is_directed, labels, edges, node_columns, edge_columns
+
+
+def _write_graph_tool(
+    n_nodes,
+    edges,
+    is_directed,
+    labels,
+    node_columns,
+    edge_columns,
+    labelname=None,
+    value_type=None,
+    workers=None,
+    chunksize=None,
+):
+    """Creates a graph-tool Graph from an edge array and (name, Column)-pairs.
+
+    Vertices and edges are added in bulk. Scalar property maps are filled through their
+    array view, only string-, vector- and python::object-properties are set element by
+    element. The value types of numeric columns are inferred and their values are converted
+    in parallel with workers > 1, see _in_pool. The property maps are always filled in the
+    calling thread.
+    Columns without any set value have no value type and are skipped.
+    """
+    import graph_tool.all as gt
+
+    if value_type is None:
+        value_type = _infer_value_type
+
+    gtG = gt.Graph(directed=is_directed)
+
+    if n_nodes == 0:
         return gtG
 
-    def to_igraph(self):
-        import igraph as ig
+    with stage("add_vertices", count=n_nodes):
+        gtG.add_vertex(n_nodes)
+    with stage("add_edges", count=len(edges)):
+        step = chunksize or max(len(edges), 1)
+        for start in range(0, len(edges), step):
+            gtG.add_edge_list(edges[start : start + step])
+
+    vertices = _Descriptors(lambda: list(gtG.vertices()))
+    edge_descriptors = _Descriptors(lambda: _edges_by_index(gtG, len(edges)))
 
-        iG = ig.Graph(directed=self.is_directed)
+    def prepare(kind, key, column):
+        return _property_values(value_type(kind, key, column), column)
 
-        use_labels = True
+    node_items = [("label", labelname, labels)] if labelname else []
+    node_items = chain(
+        node_items, (("node", key, column) for key, column in node_columns if _has_values(column))
+    )
 
-        try:
-            label_type = type(next(iter(self.node_labels)))
-        except StopIteration:
-            return iG
+    attrs = {}
+    for (_, key, column), (prop_type, values) in map_columns(
+        prepare, node_items, workers, in_pool=_in_pool
+    ):
+        with stage("set_property", count=n_nodes, attribute=key):
+            attrs[key] = _new_property(
+                gtG.new_vertex_property, prop_type, column, values, vertices
+            )
 
-        if issubclass(label_type, numbers.Number):
-            use_labels = False
+    for attr_name, attr_val in attrs.items():
+        gtG.vertex_properties[attr_name] = attr_val
 
-        for i, (node, attr) in enumerate(zip(self.nodes, self.node_attributes)):
-            if use_labels is True:
-                iG.add_vertex(self.node_labels[node], **attr)
-            else:
-                if "name" in attr:
-                    raise PyIntergraphCompatibilityException(
-                        "Your network seems to have 'name' as a node attribute. "
-                        "This is a reserved keyword for node labels in python-igraph. "
-                        "You cannot use that !"
-                    )
-                iG.add_vertex()
-                iG.vs[i].update_attributes(name=self.node_labels[node], **attr)
-
-        for edge, attr in zip(self.edges, self.edge_attributes):
-            u, v = edge
-            # Handle for weird 'name' or 'Vertex-ID' input in igraph
-            if use_labels is True:
-                u = self.node_labels[u]
-                v = self.node_labels[v]
-
-            iG.add_edge(u, v, **attr)
-
-        return iG
+    edge_items = (("edge", key, column) for key, column in edge_columns if _has_values(column))
+
+    attrs = {}
+    for (_, key, column), (prop_type, values) in map_columns(
+        prepare, edge_items, workers, in_pool=_in_pool
+    ):
+        with stage("set_property", count=len(edges), attribute=key):
+            attrs[key] = _new_property(
+                gtG.new_edge_property, prop_type, column, values, edge_descriptors, in_order=False
+            )
+
+    for attr_key, attr_val in attrs.items():
+        gtG.edge_properties[attr_key] = attr_val
+
+    return gtG
+
+
+def _read_igraph(iG):
+    """Reads an igraph Graph column by column.
+
+    If present, the vertex attribute 'name' is used as node labels.
+
+    :returns:
+        is_directed, label Column, list of edges and LazyColumns of the node- and
+        edge attributes, which read every attribute on first access.
+    """
+    n_nodes = iG.vcount()
+    n_edges = iG.ecount()
+
+    vertex_attributes = iG.vs.attributes()
+    if "name" in vertex_attributes:
+        with stage("read_labels", count=n_nodes):
+            labels = Column.from_values(iG.vs["name"])
+    else:
+        labels = Column(np.arange(n_nodes, dtype=np.int64))
+
+    with stage("read_edges", count=n_edges):
+        edges = iG.get_edgelist()
+
+    def node_column(attr):
+        with stage("read_attribute", count=n_nodes, attribute=attr):
+            return Column.from_values(iG.vs[attr], categorical=True)
+
+    def edge_column(attr):
+        with stage("read_attribute", count=n_edges, attribute=attr):
+            return Column.from_values(iG.es[attr], categorical=True)
+
+    node_columns = LazyColumns(
+        {attr: partial(node_column, attr) for attr in vertex_attributes if attr != "name"}
+    )
+    edge_columns = LazyColumns({attr: partial(edge_column, attr) for attr in iG.es.attributes()})
+    return iG.is_directed(), labels, edges, node_columns, edge_columns
+
+
+def _write_igraph(
+    n_nodes, edges, is_directed, labels, node_columns, edge_columns, chunksize=None
+):
+    """Creates an igraph Graph from an (E, 2) edge array and (name, Column)-pairs.
+
+    The graph is created with a single call, every attribute is then assigned as a whole
+    column. The node labels are stored in the vertex attribute 'name'. Every column is
+    converted to a list right before it is assigned, so that only one list exists at a time.
+    """
+    import igraph as ig
+
+    if n_nodes == 0:
+        return ig.Graph(directed=is_directed)
+
+    def node_items():
+        yield "label", "name", labels
+        for attr, column in node_columns:
+            if attr == "name":
+                raise PyIntergraphCompatibilityException(
+                    "Your network seems to have 'name' as a node attribute. "
+                    "This is a reserved keyword for node labels in python-igraph. "
+                    "You cannot use that !"
+                )
+            yield "node", attr, column
+
+    with stage("create_graph", count=len(edges)):
+        if chunksize is None:
+            iG = ig.Graph(n=n_nodes, edges=edges.tolist(), directed=is_directed)
+        else:
+            iG = ig.Graph(n=n_nodes, directed=is_directed)
+            for start in range(0, len(edges), chunksize):
+                iG.add_edges(edges[start : start + chunksize].tolist())
+
+    for _, attr, column in node_items():
+        with stage("set_attribute", count=n_nodes, attribute=attr):
+            iG.vs[attr] = column.tolist()
+
+    for attr, column in edge_columns:
+        with stage("set_attribute", count=len(edges), attribute=attr):
+            iG.es[attr] = column.tolist()
+
+    return iG
+
+
+def _add_edges_without_copy(nxG, us, vs, edge_attributes):
+    """Inserts edges into the adjacency of nxG, using the attribute-dicts as edge data."""
+    if nxG.is_directed():
+        succ, pred = nxG._succ, nxG._pred
+    else:
+        succ = pred = nxG._adj
+
+    if nxG.is_multigraph():
+        for u, v, data in zip(us, vs, edge_attributes):
+            keydict = succ[u].get(v)
+            if keydict is None:
+                keydict = nxG.edge_key_dict_factory()
+                succ[u][v] = keydict
+                pred[v][u] = keydict
+            keydict[len(keydict)] = data
+    else:
+        for u, v, data in zip(us, vs, edge_attributes):
+            succ[u][v] = data
+            pred[v][u] = data
+
+
+def _filter_mask(predicate, columns, n, kind):
+    """Evaluates a node- or edge filter to a boolean array of length n."""
+    if predicate is None:
+        return None
+    if callable(predicate):
+        predicate = predicate(ValuesView(columns))
+    if isinstance(predicate, np.ma.MaskedArray):
+        # comparisons with unset values do not pass the filter
+        predicate = predicate.filled(False)
+
+    mask = np.asarray(predicate)
+    if mask.dtype != bool or mask.shape != (n,):
+        raise ValueError(f"The {kind} filter has to be a boolean array of length {n} !")
+    return mask
+
+
+class _NetworkxAttributes:
+    """Collects the attribute names of the nodes or edges of a networkX Graph.
+
+    Has the interface of ColumnBuilder, but build returns LazyColumns that extract
+    every attribute from the graph on first access.
+    """
+
+    def __init__(self, view):
+        self._view = view
+        self._keys = {}
+
+    def add(self, i, attrs):
+        for key in attrs:
+            if key not in self._keys:
+                self._keys[key] = None
+
+    def build(self, n):
+        return LazyColumns(
+            {key: partial(_networkx_column, self._view, key, n) for key in self._keys}
+        )
+
+
+_MISSING = object()
+
+
+def _networkx_column(view, key, n):
+    """Extracts the attribute key of all nodes or edges of a networkX Graph as Column.
+
+    :params:
+        view: nxG.nodes or nxG.edges
+    """
+    with stage("read_attribute", count=n, attribute=key):
+        indices = []
+        values = []
+        i = -1
+        for i, item in enumerate(view(data=key, default=_MISSING)):
+            if item[-1] is not _MISSING:
+                indices.append(i)
+                values.append(item[-1])
+
+        if i + 1 != n:
+            raise RuntimeError("The networkX Graph changed since the Graph object was created !")
+        return Column.from_sparse(n, indices, values, categorical=True)
+
+
+class _Descriptors:
+    """Creates the graph-tool vertex or edge descriptors only once they are needed."""
+
+    def __init__(self, create):
+        self._create = create
+        self._descriptors = None
+
+    def __getitem__(self, i):
+        if self._descriptors is None:
+            self._descriptors = self._create()
+        return self._descriptors[i]
+
+
+def _edges_by_index(gtG, n_edges):
+    edges = [None] * n_edges
+    for e in gtG.edges():
+        edges[gtG.edge_index[e]] = e
+    return edges
+
+
+def _in_pool(kind, key, column):
+    """Whether a column is prepared in the thread pool of map_columns.
+
+    Only numeric columns are, as numpy releases the GIL for their range scans and casts.
+    """
+    return column.dtype != object
+
+
+def _has_values(column):
+    """Whether any entry of a column is set. Columns without values get no property map."""
+    return len(column) > 0 and (column.mask is None or bool(column.mask.any()))
+
+
+def _valid_indices(column):
+    if column.mask is None:
+        return range(len(column))
+    return np.flatnonzero(column.mask).tolist()
+
+
+def _property_column(prop, index, descriptors, categorical=True):
+    """Reads a graph-tool property map into a Column.
+
+    Scalar properties are taken from the array view at index, all other properties are read
+    in the order of descriptors(). See Column.from_values for categorical.
+    """
+    value_type = prop.value_type()
+    if is_scalar_type(value_type):
+        values = np.asarray(prop.a)[index]
+        if value_type == "bool":
+            values = values.astype(bool)
+        return Column(values)
+
+    return Column.from_values((prop[d] for d in descriptors()), categorical=categorical)
+
+
+def _infer_value_type(kind, key, column):
+    with stage("infer_type", count=len(column), attribute=key):
+        if kind == "label":
+            return infer_array_type(column.values)
+        return _property_type(column, key, kind)
+
+
+def _property_type(column, key, kind):
+    """Infers the graph-tool value type of an attribute column.
+
+    All values of an attribute have to share the same python type.
+    """
+    if not _has_values(column):
+        raise PyIntergraphInferException(
+            f"Cannot infer the type of {kind.capitalize()}-Attribute {key} without values !"
+        )
+    if isinstance(column, CategoricalColumn):
+        return infer_array_type(column.categories)
+
+    values = column.values if column.mask is None else column.values[column.mask]
+    if values.dtype == object:
+        types = set(map(type, values))
+        if len(types) > 1:
+            raise PyIntergraphInferException(
+                f"Type not equal for all {kind}s on {kind.capitalize()}-Attribute {key}, \
+                types found: {types}"
+            )
+    return infer_array_type(values)
+
+
+# numpy dtypes of the array views of scalar graph-tool property maps
+_PROPERTY_DTYPES = {
+    "bool": np.uint8,
+    "uint8_t": np.uint8,
+    "int16_t": np.int16,
+    "int32_t": np.int32,
+    "int64_t": np.int64,
+    "double": np.float64,
+    "long double": np.longdouble,
+}
+
+
+def _property_values(value_type, column):
+    """Converts a column to the values that are written into a property map of value_type.
+
+    :returns:
+        value_type and an array of the dtype of the property map for scalar value types,
+        a list of python values otherwise. Strings that are not set are empty.
+    """
+    if is_scalar_type(value_type):
+        return value_type, column.values.astype(_PROPERTY_DTYPES[value_type], copy=False)
+    elif value_type == "string":
+        return value_type, column.filled_values("")
+    return value_type, column.values.tolist()
+
+
+def _new_property(new_property, value_type, column, values, descriptors, in_order=True):
+    """Creates a vertex- or edge property map and fills it with the prepared values.
+
+    graph-tool assigns the vals of a new string property map in the iteration order of the
+    vertices or edges. Only for vertices (in_order=True) this is the order of their indices,
+    string edge property maps are set element by element like vector properties.
+    """
+    if value_type == "string" and in_order:
+        return new_property(value_type, vals=values)
+
+    prop = new_property(value_type)
+    if is_scalar_type(value_type):
+        prop.a[:] = values
+        return prop
+
+    for i in _valid_indices(column):
+        prop[descriptors[i]] = values[i]
+    return prop
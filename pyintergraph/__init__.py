@@ -1,7 +1,63 @@
-"""Converts Graph Objects between networkX, graph_tools and igraph"""
-from .Graph import InterGraph
-from .funcs import *
-from .exceptions import *
+"""Converts Graph Objects between networkX, graph_tools and igraph
 
+The submodules, and numpy with them, are imported on first access of one of their names, so
+that importing the package itself stays cheap.
+"""
+import importlib
 
 USE_LONG_DOUBLE = False
+
+# public name -> submodule that defines it
+_LAZY_NAMES = {
+    "InterGraph": "Graph",
+    "ConversionCache": "cache",
+    "ChangeLog": "delta",
+    "OutOfCoreBuilder": "outofcore",
+    "SharedGraph": "shared",
+    "nx2gt": "funcs",
+    "nx2igraph": "funcs",
+    "gt2nx": "funcs",
+    "gt2igraph": "funcs",
+    "igraph2nx": "funcs",
+    "igraph2gt": "funcs",
+    "PyIntergraphInferException": "exceptions",
+    "PyIntergraphCompatibilityException": "exceptions",
+    "Profile": "profiling",
+    "Stage": "profiling",
+    "profile": "profiling",
+}
+
+_SUBMODULES = {
+    "Graph",
+    "arrow",
+    "cache",
+    "cli",
+    "columns",
+    "delta",
+    "edgelist",
+    "exceptions",
+    "funcs",
+    "infer",
+    "outofcore",
+    "parallel",
+    "profiling",
+    "shared",
+    "storage",
+}
+
+__all__ = ["USE_LONG_DOUBLE", *_LAZY_NAMES]
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(f".{_LAZY_NAMES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
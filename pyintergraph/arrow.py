@@ -0,0 +1,179 @@
+"""Conversion between InterGraph objects and Apache Arrow tables.
+
+A graph is represented by two tables: a nodes table with the node labels and one column per
+node attribute and an edges table with the positions of source and target in the nodes table
+and one column per edge attribute. Numeric columns share their buffers with the numpy arrays
+of the InterGraph wherever the layout allows it.
+"""
+import numpy as np
+
+from .columns import CategoricalColumn, Column, code_dtype, edge_array, object_array
+from .exceptions import PyIntergraphCompatibilityException
+from .profiling import stage
+
+IS_DIRECTED_KEY = b"pyintergraph.is_directed"
+
+
+def _to_arrow_array(column, key):
+    import pyarrow as pa
+
+    mask = None if column.mask is None else ~column.mask
+    try:
+        if isinstance(column, CategoricalColumn):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(column.codes.astype(np.int32), mask=mask),
+                pa.array(column.categories, type=pa.string()),
+            )
+        return pa.array(column.values, mask=mask)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise PyIntergraphCompatibilityException(
+            f"Attribute {key} cannot be converted to an Arrow column: {e}"
+        )
+
+
+def _table(names, columns, metadata=None):
+    import pyarrow as pa
+
+    arrays = []
+    for key, column in zip(names, columns):
+        with stage("convert_attribute", count=len(column), attribute=key):
+            arrays.append(_to_arrow_array(column, key))
+    return pa.Table.from_arrays(arrays, names=list(names), metadata=metadata)
+
+
+def _check_names(kind, reserved, columns):
+    for key in reserved:
+        if key in columns:
+            raise PyIntergraphCompatibilityException(
+                f"Your network has '{key}' as {kind} attribute. This name is used for "
+                f"the {kind} table column of the same name, pass another name for it !"
+            )
+
+
+def to_arrow(G, node_id="id", source="source", target="target"):
+    """Converts an InterGraph to a nodes and an edges table, see InterGraph.to_arrow."""
+    _check_names("node", [node_id], G.node_columns)
+    _check_names("edge", [source, target], G.edge_columns)
+
+    nodes = _table([node_id, *G.node_columns], [G.labels, *G.node_columns.values()])
+    edges = _table(
+        [source, target, *G.edge_columns],
+        [
+            Column(np.ascontiguousarray(G.edge_array[:, 0])),
+            Column(np.ascontiguousarray(G.edge_array[:, 1])),
+            *G.edge_columns.values(),
+        ],
+        metadata={IS_DIRECTED_KEY: b"true" if G.is_directed else b"false"},
+    )
+    return nodes, edges
+
+
+def _from_arrow_array(array, categorical=True):
+    """Converts an Arrow array to a Column, numeric arrays without copying their values.
+
+    Strings become a CategoricalColumn if categorical is True, see Column.from_values.
+    """
+    import pyarrow as pa
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+
+    n = len(array)
+    mask = array.is_valid().to_numpy(zero_copy_only=False) if array.null_count else None
+
+    if pa.types.is_integer(array.type) or pa.types.is_floating(array.type):
+        dtype = np.dtype(array.type.to_pandas_dtype())
+        if n == 0:
+            return Column(np.empty(0, dtype=dtype))
+        values = np.frombuffer(array.buffers()[1], dtype=dtype, count=array.offset + n)
+        return Column(values[array.offset :], mask)
+
+    if pa.types.is_boolean(array.type):
+        values = array.fill_null(False).to_numpy(zero_copy_only=False)
+        return Column(values, mask)
+
+    if pa.types.is_dictionary(array.type):
+        if categorical and pa.types.is_string(array.type.value_type):
+            categories = array.dictionary.to_pylist()
+            codes = array.indices.fill_null(0).to_numpy(zero_copy_only=False)
+            codes = codes.astype(code_dtype(len(categories)))
+            return CategoricalColumn(codes, object_array(categories), mask)
+        array = array.dictionary_decode()
+    values = array.to_pylist()
+    if mask is None:
+        return Column.from_values(values, categorical=categorical)
+    indices = np.flatnonzero(mask)
+    return Column.from_sparse(
+        n, indices, [values[i] for i in indices.tolist()], categorical=categorical
+    )
+
+
+def _columns(table, skip):
+    columns = {}
+    for key in table.column_names:
+        if key in skip:
+            continue
+        with stage("read_attribute", count=table.num_rows, attribute=key):
+            columns[key] = _from_arrow_array(table.column(key))
+    return columns
+
+
+def from_arrow(
+    cls, nodes, edges, is_directed=None, node_id="id", source="source", target="target"
+):
+    """Creates an InterGraph from a nodes and an edges table, see InterGraph.from_arrow."""
+    if is_directed is None:
+        metadata = edges.schema.metadata or {}
+        if IS_DIRECTED_KEY not in metadata:
+            raise ValueError(
+                "is_directed has to be given for tables that were not created by to_arrow !"
+            )
+        is_directed = metadata[IS_DIRECTED_KEY] == b"true"
+
+    with stage("read_edges", count=edges.num_rows):
+        endpoints = [
+            edges.column(key).to_numpy().astype(np.int64, copy=False) for key in (source, target)
+        ]
+        edges_arr = edge_array(np.column_stack(endpoints)) if edges.num_rows else edge_array([])
+
+    if nodes is None:
+        n_nodes = int(edges_arr.max()) + 1 if len(edges_arr) else 0
+        labels = Column(np.arange(n_nodes, dtype=np.int64))
+        node_columns = {}
+    else:
+        with stage("read_labels", count=nodes.num_rows):
+            labels = _from_arrow_array(nodes.column(node_id), categorical=False)
+        node_columns = _columns(nodes, {node_id})
+
+    return cls.from_columns(
+        labels, edges_arr, is_directed, node_columns, _columns(edges, {source, target})
+    )
+
+
+def to_parquet(G, nodes_path, edges_path, **kwargs):
+    """Writes an InterGraph to two Parquet files, see InterGraph.to_parquet."""
+    import pyarrow.parquet as pq
+
+    nodes, edges = to_arrow(G)
+    with stage("write_nodes", count=G.n_nodes):
+        pq.write_table(nodes, nodes_path, **kwargs)
+    with stage("write_edges", count=G.n_edges):
+        pq.write_table(edges, edges_path, **kwargs)
+
+
+def _read_parquet(path, keep, attributes):
+    import pyarrow.parquet as pq
+
+    if attributes is None:
+        return pq.read_table(path)
+    names = pq.read_schema(path).names
+    return pq.read_table(path, columns=[key for key in names if key in keep or key in attributes])
+
+
+def from_parquet(cls, nodes_path, edges_path, is_directed=None, attributes=None):
+    """Reads an InterGraph from two Parquet files, see InterGraph.from_parquet."""
+    with stage("read_nodes"):
+        nodes = _read_parquet(nodes_path, {"id"}, attributes)
+    with stage("read_edges"):
+        edges = _read_parquet(edges_path, {"source", "target"}, attributes)
+    return from_arrow(cls, nodes, edges, is_directed=is_directed)
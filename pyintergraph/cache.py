@@ -0,0 +1,236 @@
+"""Cache of conversion results, keyed by a structural fingerprint of the source graph.
+
+The fingerprint covers the type of the graph, whether it is directed, the node and edge counts,
+hashes of the node labels and the edges and the names of the node and edge attributes. It does
+not cover the attribute values: after changing attribute values only, the cached results of a
+graph have to be dropped with ConversionCache.invalidate.
+
+Cached results are shared between all callers and must not be changed in place.
+"""
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+import inspect
+import threading
+
+import pyintergraph
+from .profiling import stage
+
+# rough memory use of one node or edge and of one attribute value per node or edge
+_ELEMENT_BYTES = {"networkx": 400, "igraph": 16, "graph_tool": 32}
+_ATTRIBUTE_BYTES = {"networkx": 100, "igraph": 8, "graph_tool": 8}
+
+
+def _kind(graph):
+    kind = type(graph).__module__.split(".")[0]
+    if kind not in _ELEMENT_BYTES:
+        raise TypeError(f"Cannot fingerprint graphs of type {type(graph)} !")
+    return kind
+
+
+def _networkx_schema(views):
+    return tuple(sorted(set().union(*(data.keys() for _, data in views)), key=repr))
+
+
+def fingerprint(graph):
+    """Returns a hashable fingerprint of the structure of a networkx, igraph or graph-tool graph.
+
+    The edges are hashed in O(E) without converting the graph.
+    """
+    kind = _kind(graph)
+    with stage("fingerprint"):
+        if kind == "networkx":
+            edges = graph.edges(keys=True) if graph.is_multigraph() else graph.edges()
+            return (
+                kind,
+                type(graph).__name__,
+                graph.number_of_nodes(),
+                graph.number_of_edges(),
+                hash(tuple(graph)),
+                hash(tuple(edges)),
+                _networkx_schema(graph.nodes(data=True)),
+                _networkx_schema((None, data) for *_, data in graph.edges(data=True)),
+            )
+
+        if kind == "igraph":
+            vertex_attributes = tuple(graph.vs.attributes())
+            names = graph.vs["name"] if "name" in vertex_attributes else ()
+            return (
+                kind,
+                graph.is_directed(),
+                graph.vcount(),
+                graph.ecount(),
+                hash(tuple(names)),
+                hash(tuple(graph.get_edgelist())),
+                vertex_attributes,
+                tuple(graph.es.attributes()),
+            )
+
+        edges = graph.get_edges()
+        return (
+            kind,
+            graph.is_directed(),
+            graph.num_vertices(),
+            graph.num_edges(),
+            hashlib.blake2b(edges.tobytes(), digest_size=16).hexdigest(),
+            tuple((k, p.value_type()) for k, p in graph.vertex_properties.items()),
+            tuple((k, p.value_type()) for k, p in graph.edge_properties.items()),
+        )
+
+
+def estimate_size(graph):
+    """Returns a rough estimate of the memory use of a graph in bytes."""
+    kind = _kind(graph)
+    if kind == "networkx":
+        counts = [graph.number_of_nodes(), graph.number_of_edges()]
+        attributes = [
+            len(_networkx_schema(graph.nodes(data=True))),
+            len(_networkx_schema((None, data) for *_, data in graph.edges(data=True))),
+        ]
+    elif kind == "igraph":
+        counts = [graph.vcount(), graph.ecount()]
+        attributes = [len(graph.vs.attributes()), len(graph.es.attributes())]
+    else:
+        counts = [graph.num_vertices(), graph.num_edges()]
+        attributes = [len(graph.vertex_properties), len(graph.edge_properties)]
+
+    return sum(
+        count * (_ELEMENT_BYTES[kind] + n_attributes * _ATTRIBUTE_BYTES[kind])
+        for count, n_attributes in zip(counts, attributes)
+    )
+
+
+class ConversionCache:
+    """LRU cache of conversion results, bounded by their estimated size in bytes.
+
+    Pass it as cache=... to the functions in funcs.py. The cache can be shared between threads.
+
+    :params:
+        max_bytes: int, defaults to 512 MiB.
+            when the estimated size of all results exceeds max_bytes, the least recently
+            used results are dropped. Results larger than max_bytes are not cached.
+    """
+
+    def __init__(self, max_bytes=512 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        # key -> (result, estimated size)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"ConversionCache(entries={len(self)}, nbytes={self.nbytes}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def get(self, key):
+        """Returns the cached result for key or None, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result, nbytes=None):
+        """Caches result under key and evicts the least recently used results if needed."""
+        if nbytes is None:
+            nbytes = estimate_size(result)
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (result, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def invalidate(self, graph=None):
+        """Drops the cached results of a source graph, or all results if graph is None.
+
+        Structural changes of a graph change its fingerprint, so that outdated results are
+        not found anymore. Invalidate the graph after changing only attribute values.
+        """
+        key = None if graph is None else fingerprint(graph)
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.nbytes = 0
+                return
+
+            for cached in [cached for cached in self._entries if cached[1] == key]:
+                self._remove(cached)
+
+    def clear(self):
+        """Drops all cached results and resets the counters."""
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Returns a dict with the counters and the current size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def cached(*options):
+    """Decorates a conversion function to use the ConversionCache passed as its cache argument.
+
+    Results are cached by the name of the function, the fingerprint of its first argument,
+    the values of the arguments named in options and pyintergraph.USE_LONG_DOUBLE.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            cache = arguments.arguments["cache"]
+            if cache is None:
+                return func(*args, **kwargs)
+
+            graph = next(iter(arguments.arguments.values()))
+            key = (
+                func.__name__,
+                fingerprint(graph),
+                tuple(_freeze(arguments.arguments[name]) for name in options),
+                pyintergraph.USE_LONG_DOUBLE,
+            )
+            result = cache.get(key)
+            if result is None:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,203 @@
+"""Command line converter between the graph file formats of the backends.
+
+Every conversion reads the input into an InterGraph and writes the output from it:
+
+    pyintergraph edges.csv graph.gt --labelname label --workers 4 --profile
+
+Edge lists, CSV files and the native format are read and written in chunks or memory-mapped.
+GraphML and GML are read and written by networkx, graph-tool files by graph-tool, which hold
+the whole graph in memory.
+"""
+import argparse
+import sys
+
+FORMATS = ["graphml", "gml", "native", "gt", "edgelist", "csv"]
+
+_EXTENSIONS = {
+    ".graphml": "graphml",
+    ".xml": "graphml",
+    ".gml": "gml",
+    ".igx": "native",
+    ".gt": "gt",
+    ".edges": "edgelist",
+    ".edgelist": "edgelist",
+    ".txt": "edgelist",
+    ".csv": "csv",
+}
+
+
+def guess_format(path):
+    """Returns the format of a file by its extension or None."""
+    for extension, fmt in _EXTENSIONS.items():
+        if str(path).lower().endswith(extension):
+            return fmt
+    return None
+
+
+def read_graph(path, fmt, args):
+    """Reads an InterGraph from a file of format fmt."""
+    from .Graph import InterGraph
+
+    if fmt == "native":
+        return InterGraph.load(path, mmap=True)
+    elif fmt == "edgelist":
+        return InterGraph.from_edgelist(
+            path, is_directed=args.directed, delimiter=args.delimiter, chunksize=args.chunksize
+        )
+    elif fmt == "csv":
+        return InterGraph.from_csv(
+            path,
+            is_directed=args.directed,
+            nodes_path=args.nodes,
+            delimiter=args.delimiter or ",",
+            chunksize=args.chunksize,
+        )
+    elif fmt == "gt":
+        import graph_tool.all as gt
+
+        return InterGraph.from_graph_tool(gt.load_graph(path), labelname=args.labelname, lazy=True)
+
+    import networkx as nx
+
+    if fmt == "graphml":
+        nxG = nx.read_graphml(path)
+    else:
+        nxG = nx.read_gml(path)
+    return InterGraph.from_networkx(nxG, lazy=True)
+
+
+def write_graph(G, path, fmt, args):
+    """Writes an InterGraph to a file of format fmt."""
+    if fmt == "native":
+        G.save(path)
+    elif fmt == "edgelist":
+        G.to_edgelist(path, delimiter=args.delimiter or " ", data=True, chunksize=args.chunksize)
+    elif fmt == "csv":
+        G.to_csv(
+            path,
+            nodes_path=args.output_nodes,
+            delimiter=args.delimiter or ",",
+            chunksize=args.chunksize,
+        )
+    elif fmt == "gt":
+        G.to_graph_tool(labelname=args.labelname, workers=args.workers).save(str(path))
+    else:
+        import networkx as nx
+
+        if fmt == "graphml":
+            nx.write_graphml(G.to_networkx(), path)
+        else:
+            nx.write_gml(G.to_networkx(), path, stringizer=str)
+
+
+def project(G, attributes):
+    """Returns an InterGraph with only the listed node and edge attributes."""
+    from .columns import select_columns
+
+    return type(G).from_columns(
+        G.labels,
+        G.edge_array,
+        G.is_directed,
+        select_columns(G.node_columns, attributes),
+        select_columns(G.edge_columns, attributes),
+    )
+
+
+def convert(args):
+    G = read_graph(args.input, args.input_format, args)
+    if args.attributes is not None:
+        G = project(G, args.attributes)
+    write_graph(G, args.output, args.output_format, args)
+
+
+def _attributes(value):
+    return [name for name in value.split(",") if name]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pyintergraph",
+        description="Converts graph files between formats, the formats are guessed from the "
+        "file extensions: " + ", ".join(f"{ext} ({fmt})" for ext, fmt in _EXTENSIONS.items()),
+    )
+    parser.add_argument("input", help="path of the input file")
+    parser.add_argument("output", help="path of the output file")
+    parser.add_argument("--from", dest="input_format", choices=FORMATS, help="input format")
+    parser.add_argument("--to", dest="output_format", choices=FORMATS, help="output format")
+    parser.add_argument(
+        "--attributes",
+        type=_attributes,
+        help="comma separated names of the node and edge attributes to convert, "
+        "all attributes if not given",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="threads that convert the attributes for graph-tool"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="report the time of every conversion stage, as JSON to PATH if given",
+    )
+    parser.add_argument(
+        "--undirected",
+        dest="directed",
+        action="store_false",
+        help="read edge lists and CSV files as undirected graph",
+    )
+    parser.add_argument("--labelname", help="graph-tool vertex property with the node labels")
+    parser.add_argument("--nodes", help="CSV file with the node attributes of the input")
+    parser.add_argument("--output-nodes", help="CSV file for the node attributes of the output")
+    parser.add_argument("--delimiter", help="delimiter of edge lists and CSV files")
+    parser.add_argument(
+        "--chunksize", type=int, help="lines of edge lists and CSV files processed at once"
+    )
+    return parser
+
+
+def _print_summary(report, file):
+    summary = report.summary()
+    width = max((len(path) for path in summary), default=0)
+    for path, entry in summary.items():
+        print(f"{path:<{width}}  {entry['seconds']:10.3f}s  {entry['count']:>12}", file=file)
+
+
+def main(argv=None):
+    """Entry point of the pyintergraph command. Returns the exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    for key, path in (("input_format", args.input), ("output_format", args.output)):
+        if getattr(args, key) is None:
+            fmt = guess_format(path)
+            if fmt is None:
+                parser.error(f"cannot guess the format of {path}, pass --from or --to")
+            setattr(args, key, fmt)
+
+    from .exceptions import PyIntergraphCompatibilityException, PyIntergraphInferException
+    from .profiling import profile
+
+    try:
+        if args.profile is None:
+            convert(args)
+            return 0
+
+        with profile() as report:
+            convert(args)
+    except (
+        OSError,
+        ImportError,
+        ValueError,
+        PyIntergraphCompatibilityException,
+        PyIntergraphInferException,
+    ) as e:
+        print(f"pyintergraph: error: {e}", file=sys.stderr)
+        return 1
+
+    if args.profile == "-":
+        _print_summary(report, sys.stderr)
+    else:
+        with open(args.profile, "w") as f:
+            f.write(report.to_json(indent=2))
+    return 0
@@ -0,0 +1,488 @@
+"""Columnar storage for the node and edge attributes of an InterGraph"""
+from collections.abc import Mapping, MutableMapping
+from functools import partial
+
+import numpy as np
+
+
+class Column:
+    """A single attribute stored as one typed numpy array.
+
+    :params:
+        values: np.ndarray with one entry per node or edge.
+            numeric attributes get a numeric dtype, everything else is kept
+            in an array of dtype object.
+        mask: None or boolean np.ndarray of the same length
+            marks the entries that are actually set.
+            None means that the attribute is set on every element.
+    """
+
+    def __init__(self, values, mask=None):
+        self.values = values
+        self.mask = mask
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"Column(dtype={self.values.dtype}, length={len(self)})"
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def is_complete(self):
+        return self.mask is None or bool(self.mask.all())
+
+    @classmethod
+    def from_values(cls, values, categorical=False):
+        """Creates a complete Column from a sequence of python values.
+
+        If categorical is True, strings with many repeated values are dictionary-encoded
+        into a CategoricalColumn.
+        """
+        values = list(values)
+        if categorical:
+            column = CategoricalColumn.encode(values)
+            if column is not None:
+                return column
+        return cls(to_array(values))
+
+    @classmethod
+    def from_sparse(cls, n, indices, values, categorical=False):
+        """Creates a Column of length n that is only set at the positions in indices.
+
+        See from_values for categorical.
+        """
+        values = list(values)
+        if len(values) == n:
+            return cls.from_values(values, categorical=categorical)
+
+        indices = np.asarray(indices, dtype=np.int64)
+        mask = np.zeros(n, dtype=bool)
+        mask[indices] = True
+
+        if categorical:
+            column = CategoricalColumn.encode(values)
+            if column is not None:
+                codes = np.zeros(n, dtype=column.codes.dtype)
+                codes[indices] = column.codes
+                return CategoricalColumn(codes, column.categories, mask)
+
+        data = to_array(values)
+        if data.dtype == object:
+            full = np.empty(n, dtype=object)
+        else:
+            full = np.zeros(n, dtype=data.dtype)
+        full[indices] = data
+        return cls(full, mask)
+
+    def tolist(self):
+        """Returns the values as python objects, None where the attribute is not set."""
+        return self.filled_values(None)
+
+    def filled_values(self, fill):
+        """Returns the values as python objects, fill where the attribute is not set."""
+        values = self.values.tolist()
+        if self.mask is not None:
+            for i in np.flatnonzero(~self.mask).tolist():
+                values[i] = fill
+        return values
+
+    def take(self, indices):
+        """Returns a new Column with the entries at indices."""
+        mask = None if self.mask is None else self.mask[indices]
+        return Column(self.values[indices], mask)
+
+
+class CategoricalColumn(Column):
+    """A string attribute stored as integer codes into a table of its unique values.
+
+    :params:
+        codes: integer np.ndarray with the position of every value in categories.
+            the codes of entries that are not set are 0.
+        categories: np.ndarray of dtype object with the unique values.
+        mask: see Column.
+    """
+
+    # strings are only encoded if they have at most this many unique values per value
+    MAX_CATEGORY_RATIO = 0.5
+
+    def __init__(self, codes, categories, mask=None):
+        self.codes = codes
+        self.categories = categories
+        self.mask = mask
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __repr__(self):
+        return f"CategoricalColumn(categories={len(self.categories)}, length={len(self)})"
+
+    @property
+    def values(self):
+        """The decoded values as array of dtype object, None where the attribute is not set."""
+        if len(self.categories) == 0:
+            return np.empty(len(self), dtype=object)
+        values = self.categories[self.codes]
+        if self.mask is not None:
+            values[~self.mask] = None
+        return values
+
+    @property
+    def dtype(self):
+        return np.dtype(object)
+
+    @classmethod
+    def encode(cls, values, max_ratio=None):
+        """Dictionary-encodes a list of strings.
+
+        :returns:
+            CategoricalColumn or None, if not all values are strings or more than
+            max_ratio (defaults to MAX_CATEGORY_RATIO) of them are unique.
+        """
+        if max_ratio is None:
+            max_ratio = cls.MAX_CATEGORY_RATIO
+        max_categories = max(int(len(values) * max_ratio), 1)
+
+        lookup = {}
+        codes = []
+        for v in values:
+            if type(v) is not str:
+                return None
+            code = lookup.get(v)
+            if code is None:
+                if len(lookup) == max_categories:
+                    return None
+                code = lookup[v] = len(lookup)
+            codes.append(code)
+
+        return cls(np.array(codes, dtype=code_dtype(len(lookup))), object_array(list(lookup)))
+
+    def take(self, indices):
+        """Returns a new CategoricalColumn with the entries at indices."""
+        mask = None if self.mask is None else self.mask[indices]
+        return CategoricalColumn(self.codes[indices], self.categories, mask)
+
+    def filled_values(self, fill):
+        if self.mask is None:
+            return self.categories[self.codes].tolist()
+        categories = np.append(self.categories, object_array([fill]))
+        return categories[np.where(self.mask, self.codes, len(self.categories))].tolist()
+
+
+def code_dtype(n_categories):
+    """Returns the smallest unsigned integer dtype for codes into n_categories values."""
+    if n_categories <= 2**8:
+        return np.dtype(np.uint8)
+    elif n_categories <= 2**16:
+        return np.dtype(np.uint16)
+    elif n_categories <= 2**32:
+        return np.dtype(np.uint32)
+    return np.dtype(np.int64)
+
+
+def infer_dtype(values):
+    """Returns the numpy dtype that holds all values without losing information."""
+    types = set(map(type, values))
+    if len(types) != 1:
+        return np.dtype(object)
+
+    value_type = types.pop()
+    if value_type is bool or value_type is np.bool_:
+        return np.dtype(bool)
+    elif value_type is int:
+        return np.dtype(np.int64)
+    elif value_type is float:
+        return np.dtype(np.float64)
+    elif issubclass(value_type, np.number):
+        return np.dtype(value_type)
+    return np.dtype(object)
+
+
+def object_array(values):
+    """Creates a 1-d object array, even if the values are sequences themselves."""
+    arr = np.empty(len(values), dtype=object)
+    for i, val in enumerate(values):
+        arr[i] = val
+    return arr
+
+
+def to_array(values):
+    dtype = infer_dtype(values)
+    if dtype != object:
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            pass
+    return object_array(values)
+
+
+def edge_array(edges):
+    """Converts a sequence of (u, v) pairs to a contiguous (E, 2) integer array."""
+    arr = np.asarray(edges, dtype=np.int64)
+    if arr.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.ascontiguousarray(arr.reshape(-1, 2))
+
+
+def has_parallel_edges(edges, is_directed):
+    """Checks an (E, 2) edge array for parallel edges with a vectorized sort.
+
+    For undirected graphs, (u, v) and (v, u) are the same edge.
+    """
+    if len(edges) < 2:
+        return False
+
+    if not is_directed:
+        edges = np.sort(edges, axis=1)
+
+    n = int(edges.max()) + 1
+    if n <= 2**31:
+        keys = np.sort(edges[:, 0] * n + edges[:, 1])
+        return bool((keys[1:] == keys[:-1]).any())
+    return len(np.unique(edges, axis=0)) < len(edges)
+
+
+class ColumnBuilder:
+    """Collects attribute-dicts element by element into one Column per attribute key."""
+
+    def __init__(self):
+        self._indices = {}
+        self._values = {}
+
+    def add(self, i, attrs):
+        """Adds the attributes of element i."""
+        for key, val in attrs.items():
+            if key not in self._values:
+                self._indices[key] = []
+                self._values[key] = []
+            self._indices[key].append(i)
+            self._values[key].append(val)
+
+    def build(self, n):
+        """Returns the collected Columns for n elements."""
+        return {
+            key: Column.from_sparse(n, self._indices[key], self._values[key], categorical=True)
+            for key in self._values
+        }
+
+
+class LazyColumns(MutableMapping):
+    """Mapping of attribute name -> Column that extracts every Column on first access.
+
+    :params:
+        loaders: dict of attribute name -> callable without arguments that returns the Column.
+    """
+
+    def __init__(self, loaders):
+        self._loaders = dict(loaders)
+        self._columns = {}
+
+    def __repr__(self):
+        return f"LazyColumns({list(self._loaders)}, loaded={list(self._columns)})"
+
+    def __getitem__(self, key):
+        column = self._columns.get(key)
+        if column is None:
+            column = self._loaders[key]()
+            self._columns[key] = column
+        return column
+
+    def __setitem__(self, key, column):
+        self._loaders.setdefault(key, None)
+        self._columns[key] = column
+
+    def __delitem__(self, key):
+        del self._loaders[key]
+        self._columns.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._loaders
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def is_loaded(self, key):
+        return key in self._columns
+
+    def stream(self, attributes=None):
+        """Yields the (name, Column)-pairs of the attributes without keeping the Columns.
+
+        :params:
+            attributes: None or collection of attribute names, defaults to None.
+                if given, only these attributes are extracted.
+        """
+        for key in self._loaders:
+            if attributes is not None and key not in attributes:
+                continue
+            column = self._columns.get(key)
+            yield key, self._loaders[key]() if column is None else column
+
+    def take(self, indices):
+        """Returns LazyColumns with the entries at indices, extracted on first access."""
+        return LazyColumns({key: partial(_take, self, key, indices) for key in self._loaders})
+
+
+def _take(columns, key, indices):
+    return columns[key].take(indices)
+
+
+def take_columns(columns, indices):
+    """Returns the entries at indices of every column, lazily for LazyColumns."""
+    if isinstance(columns, LazyColumns):
+        return columns.take(indices)
+    return {key: column.take(indices) for key, column in columns.items()}
+
+
+def assign_values(column, n, indices, values):
+    """Returns a Column of length n with values set at indices.
+
+    The first len(column) entries are copied from column, the other entries are not set.
+    The dtype of column is kept if the new values have the same dtype, else the Column
+    falls back to dtype object. New strings are added to the categories of a
+    CategoricalColumn.
+
+    :params:
+        column: None or Column with at most n entries.
+        n: int, length of the new Column.
+        indices: sequence of positions in the new Column.
+        values: sequence of python values of the same length as indices.
+    :returns:
+        Column, column itself if it has n entries and no values are set.
+    """
+    old = 0 if column is None else len(column)
+    indices = np.asarray(indices, dtype=np.int64)
+    values = list(values)
+    if column is not None and not values and n == old:
+        return column
+
+    mask = np.zeros(n, dtype=bool)
+    mask[:old] = True if column is None or column.mask is None else column.mask
+    mask[indices] = True
+    if mask.all():
+        mask = None
+
+    if column is None:
+        new = Column.from_values(values, categorical=True)
+    elif isinstance(column, CategoricalColumn):
+        new = CategoricalColumn.encode(values, max_ratio=1)
+        if new is None:
+            new = Column.from_values(values)
+    else:
+        new = Column.from_values(values)
+
+    categorical = column is None or isinstance(column, CategoricalColumn)
+    if categorical and isinstance(new, CategoricalColumn):
+        lookup = {}
+        if column is not None:
+            lookup = {c: i for i, c in enumerate(column.categories.tolist())}
+        remap = np.fromiter(
+            (lookup.setdefault(c, len(lookup)) for c in new.categories.tolist()),
+            dtype=np.int64,
+            count=len(new.categories),
+        )
+        codes = np.zeros(n, dtype=code_dtype(len(lookup)))
+        if column is not None:
+            codes[:old] = column.codes
+        codes[indices] = remap[new.codes]
+        return CategoricalColumn(codes, object_array(list(lookup)), mask)
+
+    if column is None or column.dtype == new.dtype:
+        dtype = new.dtype
+    elif not values:
+        dtype = column.dtype
+    else:
+        dtype = np.dtype(object)
+
+    full = np.empty(n, dtype=object) if dtype == object else np.zeros(n, dtype=dtype)
+    if column is not None:
+        full[:old] = column.values
+    full[indices] = new.values
+    return Column(full, mask)
+
+
+def _assign(columns, key, n, indices, values):
+    return assign_values(columns[key] if key in columns else None, n, indices, values)
+
+
+def assign_columns(columns, n, updates):
+    """Applies assign_values to every column, lazily for LazyColumns.
+
+    :params:
+        columns: dict or LazyColumns of attribute name -> Column.
+        n: int, length of the new Columns.
+        updates: dict of attribute name -> (indices, values).
+            attributes that are not in columns are added.
+    :returns:
+        dict or LazyColumns of attribute name -> Column
+    """
+    keys = list(columns) + [key for key in updates if key not in columns]
+    if isinstance(columns, LazyColumns):
+        return LazyColumns(
+            {key: partial(_assign, columns, key, n, *updates.get(key, ((), ()))) for key in keys}
+        )
+    return {key: _assign(columns, key, n, *updates.get(key, ((), ()))) for key in keys}
+
+
+class ValuesView(Mapping):
+    """Read-only mapping of attribute name -> values array of the Column.
+
+    The values of columns with unset entries are np.ma.MaskedArrays that mask these entries,
+    so that they can be told apart from set values like 0.
+    """
+
+    def __init__(self, columns):
+        self._columns = columns
+
+    def __getitem__(self, key):
+        column = self._columns[key]
+        if column.mask is None:
+            return column.values
+        return np.ma.MaskedArray(column.values, mask=~column.mask)
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+def select_columns(columns, attributes=None):
+    """Returns a dict with the columns whose name is in attributes, all columns if None."""
+    if attributes is None:
+        return dict(columns.items())
+    return {key: columns[key] for key in columns if key in attributes}
+
+
+def columns_from_dicts(dicts, n):
+    """Splits a sequence of n attribute-dicts into one Column per attribute key."""
+    builder = ColumnBuilder()
+    for i, attrs in enumerate(dicts):
+        builder.add(i, attrs)
+    return builder.build(n)
+
+
+def iter_rows(columns, n):
+    """Yields one attribute-dict per element, leaving out attributes that are not set."""
+    names = list(columns)
+    if not names:
+        for _ in range(n):
+            yield {}
+        return
+
+    lists = [columns[name].values.tolist() for name in names]
+    masks = [columns[name].mask for name in names]
+
+    if all(mask is None for mask in masks):
+        for row in zip(*lists):
+            yield dict(zip(names, row))
+        return
+
+    masks = [np.ones(n, dtype=bool) if mask is None else mask for mask in masks]
+    for row, valid in zip(zip(*lists), zip(*(mask.tolist() for mask in masks))):
+        yield {name: val for name, val, is_set in zip(names, row, valid) if is_set}
@@ -0,0 +1,323 @@
+"""Incremental updates of InterGraph objects and of graphs converted from them.
+
+A ChangeLog records added and removed nodes and edges by node label. InterGraph.apply_changes
+applies it to the columns of an InterGraph and, if given, to the igraph or graph-tool Graph
+that was converted from it, so that the converted graph does not have to be rebuilt.
+
+The node indices stay stable: removed nodes are dropped, the remaining nodes keep their
+order and new nodes are appended. igraph and graph-tool renumber their vertices in the same
+way when vertices are removed, so every node keeps the same index in the InterGraph and in
+the converted graph.
+"""
+import numpy as np
+
+from .columns import assign_columns, assign_values, edge_array
+from .exceptions import PyIntergraphCompatibilityException
+from .profiling import stage
+
+
+class ChangeLog:
+    """Records changes to a graph by node label.
+
+    The changes are applied in this order: removed edges, removed nodes together with their
+    edges, added nodes and attributes of existing nodes, added edges.
+    """
+
+    def __init__(self):
+        # label -> attributes, dicts are used as ordered sets
+        self.added_nodes = {}
+        self.removed_nodes = {}
+        # (source label, target label, attributes)
+        self.added_edges = []
+        # (source label, target label)
+        self.removed_edges = []
+
+    def __len__(self):
+        return (
+            len(self.added_nodes)
+            + len(self.removed_nodes)
+            + len(self.added_edges)
+            + len(self.removed_edges)
+        )
+
+    def __repr__(self):
+        return (
+            f"ChangeLog(added_nodes={len(self.added_nodes)}, "
+            f"removed_nodes={len(self.removed_nodes)}, added_edges={len(self.added_edges)}, "
+            f"removed_edges={len(self.removed_edges)})"
+        )
+
+    def add_node(self, label, **attrs):
+        """Adds a node, or sets attributes of a node that is already in the graph."""
+        self.added_nodes.setdefault(label, {}).update(attrs)
+
+    def remove_node(self, label):
+        """Removes a node and its edges. Nodes that are not in the graph are ignored."""
+        self.added_nodes.pop(label, None)
+        self.added_edges = [edge for edge in self.added_edges if label not in edge[:2]]
+        self.removed_nodes[label] = None
+
+    def add_edge(self, u, v, **attrs):
+        """Adds an edge. Nodes that are not in the graph yet are added as well."""
+        self.added_edges.append((u, v, attrs))
+
+    def remove_edge(self, u, v):
+        """Removes one edge from u to v.
+
+        If the edge was added to this ChangeLog before, only that addition is undone.
+        """
+        for i in range(len(self.added_edges) - 1, -1, -1):
+            if self.added_edges[i][:2] == (u, v):
+                del self.added_edges[i]
+                return
+        self.removed_edges.append((u, v))
+
+
+def node_index(G):
+    """Returns the dict of node label -> node index of G, built once and then cached."""
+    if G._label_index is None:
+        index = dict(zip(G.labels.tolist(), range(G.n_nodes)))
+        if len(index) != G.n_nodes:
+            raise ValueError("The node labels are not unique !")
+        G._label_index = index
+    return G._label_index
+
+
+def _find_edges(G, index, pairs):
+    """Returns the positions of the edges between the labels in pairs.
+
+    For parallel edges, the edges are taken in the order of the edge array.
+    """
+    if not pairs:
+        return np.empty(0, dtype=np.int64)
+
+    try:
+        wanted = edge_array([(index[u], index[v]) for u, v in pairs])
+    except KeyError as e:
+        raise ValueError(f"Node {e.args[0]!r} is not in the graph !")
+
+    edges = G.edge_array
+    if not G.is_directed:
+        edges = np.sort(edges, axis=1)
+        wanted = np.sort(wanted, axis=1)
+
+    n = max(G.n_nodes, 1)
+    keys = edges[:, 0] * n + edges[:, 1]
+    wanted_keys = wanted[:, 0] * n + wanted[:, 1]
+
+    candidates = {}
+    found = np.flatnonzero(np.isin(keys, wanted_keys))
+    for position, key in zip(found.tolist(), keys[found].tolist()):
+        candidates.setdefault(key, []).append(position)
+
+    positions = []
+    for (u, v), key in zip(pairs, wanted_keys.tolist()):
+        found = candidates.get(key)
+        if not found:
+            raise ValueError(f"Edge ({u!r}, {v!r}) is not in the graph !")
+        positions.append(found.pop(0))
+    return np.array(positions, dtype=np.int64)
+
+
+def _updates(indices, attributes):
+    """Turns a sequence of attribute-dicts into attribute name -> (indices, values)."""
+    updates = {}
+    for i, attrs in zip(indices, attributes):
+        for key, val in attrs.items():
+            key_indices, values = updates.setdefault(key, ([], []))
+            key_indices.append(i)
+            values.append(val)
+    return updates
+
+
+class _Plan:
+    """The changes of a ChangeLog as node and edge indices."""
+
+    def __init__(self, removed_edges, removed_nodes, new_labels, node_updates, edges, updates):
+        # positions in the graph before the update
+        self.removed_edges = removed_edges
+        self.removed_nodes = removed_nodes
+        # positions in the graph after the update, the new edges start at n_kept_edges
+        self.new_labels = new_labels
+        self.node_updates = node_updates
+        self.edges = edges
+        self.edge_updates = updates
+        self.n_kept_edges = None
+
+
+def apply_changes(G, changes, target=None, labelname=None):
+    """Applies a ChangeLog to G and target, see InterGraph.apply_changes."""
+    kind = None if target is None else _target_kind(target)
+    if kind is not None:
+        _check_target(G, target, kind)
+        if kind == "igraph" and any("name" in attrs for attrs in changes.added_nodes.values()):
+            raise PyIntergraphCompatibilityException(
+                "'name' is a reserved keyword for node labels in python-igraph. "
+                "You cannot use it as node attribute !"
+            )
+        # the columns of G are read from the target before it is changed
+        for columns in (G.node_columns, G.edge_columns):
+            for key in columns:
+                columns[key]
+
+    index = node_index(G)
+    with stage("find_edges", count=len(changes.removed_edges)):
+        removed_edges = _find_edges(G, index, changes.removed_edges)
+    removed_nodes = np.array(
+        sorted(index[label] for label in changes.removed_nodes if label in index), dtype=np.int64
+    )
+
+    # from here on, the index is changed in place and belongs to the new Graph object
+    G._label_index = None
+
+    node_mask = None
+    if len(removed_nodes):
+        node_mask = np.ones(G.n_nodes, dtype=bool)
+        node_mask[removed_nodes] = False
+    edge_mask = None
+    if len(removed_edges):
+        edge_mask = np.ones(G.n_edges, dtype=bool)
+        edge_mask[removed_edges] = False
+    kept = G._apply_filters(node_mask, edge_mask)
+
+    if len(removed_nodes):
+        with stage("remove_nodes", count=len(removed_nodes)):
+            first = int(removed_nodes[0])
+            for label in G.labels.take(removed_nodes).tolist():
+                del index[label]
+            shifted = kept.labels.take(slice(first, None)).tolist()
+            index.update(zip(shifted, range(first, kept.n_nodes)))
+
+    n_kept = kept.n_nodes
+    new_labels = []
+
+    def position(label):
+        i = index.get(label)
+        if i is None:
+            i = index[label] = n_kept + len(new_labels)
+            new_labels.append(label)
+        return i
+
+    with stage("add_nodes", count=len(changes.added_nodes)):
+        node_updates = _updates(
+            [position(label) for label in changes.added_nodes], changes.added_nodes.values()
+        )
+    with stage("add_edges", count=len(changes.added_edges)):
+        edges = edge_array([(position(u), position(v)) for u, v, _ in changes.added_edges])
+        edge_updates = _updates(
+            range(kept.n_edges, kept.n_edges + len(edges)),
+            (attrs for _, _, attrs in changes.added_edges),
+        )
+
+    n_nodes = n_kept + len(new_labels)
+    n_edges = kept.n_edges + len(edges)
+    labels = kept.labels
+    if new_labels:
+        labels = assign_values(labels, n_nodes, range(n_kept, n_nodes), new_labels)
+
+    updated = type(G).from_columns(
+        labels,
+        np.concatenate([kept.edge_array, edges]) if len(edges) else kept.edge_array,
+        G.is_directed,
+        assign_columns(kept.node_columns, n_nodes, node_updates),
+        assign_columns(kept.edge_columns, n_edges, edge_updates),
+    )
+    updated._label_index = index
+
+    if kind is not None:
+        plan = _Plan(removed_edges, removed_nodes, new_labels, node_updates, edges, edge_updates)
+        plan.n_kept_edges = kept.n_edges
+        with stage("update_target", count=len(changes)):
+            if kind == "igraph":
+                _update_igraph(target, G, plan)
+            else:
+                _update_graph_tool(target, G, updated, plan, labelname)
+    return updated
+
+
+def _target_kind(target):
+    module = type(target).__module__.split(".")[0]
+    if module not in ("igraph", "graph_tool"):
+        raise TypeError("target must be an igraph or a graph-tool Graph !")
+    return module
+
+
+def _check_target(G, target, kind):
+    if kind == "igraph":
+        counts = target.vcount(), target.ecount()
+    else:
+        counts = target.num_vertices(), target.num_edges()
+    if counts != (G.n_nodes, G.n_edges):
+        raise ValueError(
+            f"The target has {counts[0]} nodes and {counts[1]} edges, but the Graph object "
+            f"has {G.n_nodes} nodes and {G.n_edges} edges. The target has to be converted "
+            "from the Graph object and may only be changed with apply_changes !"
+        )
+
+
+def _update_igraph(iG, G, plan):
+    """Applies a plan to an igraph Graph whose vertex and edge ids are the positions in G."""
+    if len(plan.removed_edges):
+        iG.delete_edges(plan.removed_edges.tolist())
+    if len(plan.removed_nodes):
+        iG.delete_vertices(plan.removed_nodes.tolist())
+    if plan.new_labels:
+        iG.add_vertices(len(plan.new_labels), attributes={"name": plan.new_labels})
+    for key, (indices, values) in plan.node_updates.items():
+        for i, val in zip(indices, values):
+            iG.vs[i][key] = val
+
+    if len(plan.edges):
+        iG.add_edges(plan.edges.tolist())
+    for key, (indices, values) in plan.edge_updates.items():
+        for i, val in zip(indices, values):
+            iG.es[i][key] = val
+
+
+def _update_graph_tool(gtG, G, updated, plan, labelname):
+    """Applies a plan to a graph-tool Graph whose vertex indices are the positions in G.
+
+    The edges are looked up by their endpoints. For parallel edges, the edge with the
+    lowest edge index is removed first. The value types of new property maps are inferred
+    from the whole column of the updated Graph object, not only from the new values.
+    """
+    for u, v in G.edge_array[plan.removed_edges].tolist():
+        found = gtG.edge(u, v, all_edges=True)
+        gtG.remove_edge(min(found, key=lambda e: int(gtG.edge_index[e])))
+    if len(plan.removed_nodes):
+        gtG.remove_vertex(plan.removed_nodes.tolist(), fast=False)
+
+    n_nodes = gtG.num_vertices()
+    node_updates = dict(plan.node_updates)
+    if plan.new_labels:
+        gtG.add_vertex(len(plan.new_labels))
+        if labelname:
+            node_updates[labelname] = (range(n_nodes, gtG.num_vertices()), plan.new_labels)
+
+    def value_type(kind, key):
+        if kind == "node" and key == labelname:
+            return updated._value_type("label", key, updated.labels)
+        columns = updated.node_columns if kind == "node" else updated.edge_columns
+        return updated._value_type(kind, key, columns[key])
+
+    def set_values(properties, new_property, descriptor, kind, updates):
+        for key, (indices, values) in updates.items():
+            if key not in properties:
+                properties[key] = new_property(value_type(kind, key))
+            prop = properties[key]
+            for i, val in zip(indices, values):
+                prop[descriptor(i)] = val
+
+    set_values(
+        gtG.vertex_properties, gtG.new_vertex_property, gtG.vertex, "node", node_updates
+    )
+
+    new_edges = [gtG.add_edge(u, v) for u, v in plan.edges.tolist()]
+    first = plan.n_kept_edges
+    set_values(
+        gtG.edge_properties,
+        gtG.new_edge_property,
+        lambda i: new_edges[i - first],
+        "edge",
+        plan.edge_updates,
+    )
@@ -0,0 +1,396 @@
+"""Chunked reading and writing of edge lists and CSV files.
+
+Rows are read in chunks of a fixed size. Every chunk is parsed into numpy arrays right away,
+so that only the rows of a single chunk exist as python strings at any time. Node labels are
+mapped to integer ids through an incremental label index while the rows stream in.
+"""
+from contextlib import nullcontext
+import csv
+from itertools import chain, islice
+
+import numpy as np
+
+from .columns import CategoricalColumn, Column, code_dtype, object_array
+from .profiling import stage
+
+CHUNKSIZE = 100_000
+
+_NUMPY_TYPES = {int: np.int64, float: np.float64}
+
+
+class LabelIndex:
+    """Assigns consecutive integer ids to node labels in order of their first appearance."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def encode(self, labels, count=-1):
+        """Returns the ids of labels as int64 array, adding unknown labels to the index."""
+        ids = self.ids
+        return np.fromiter(
+            (ids.setdefault(label, len(ids)) for label in labels), dtype=np.int64, count=count
+        )
+
+    def labels(self):
+        return Column.from_values(self.ids)
+
+
+class _ChunkedColumn:
+    """Collects the parsed chunks of one column and joins them into a single Column.
+
+    Chunks of strings are dictionary-encoded right away, so that every distinct string is
+    kept only once while reading.
+    """
+
+    def __init__(self, dtype=None):
+        self.dtype = dtype
+        self.chunks = []
+        self.length = 0
+        self.categories = {}
+
+    def add(self, values):
+        values, mask = _parse(values, self.dtype)
+        valid = values if mask is None else values[mask]
+        if values.dtype == object and all(type(v) is str for v in valid):
+            categories = self.categories
+            codes = np.zeros(len(values), dtype=np.int64)
+            codes[slice(None) if mask is None else mask] = np.fromiter(
+                (categories.setdefault(v, len(categories)) for v in valid),
+                dtype=np.int64,
+                count=len(valid),
+            )
+            self.chunks.append((_Codes(codes), mask))
+        else:
+            self.chunks.append((values, mask))
+        self.length += len(values)
+
+    def pad(self, n):
+        """Marks the column as not set for n further elements."""
+        if n > 0:
+            self.chunks.append((np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)))
+            self.length += n
+
+    def build(self):
+        if not self.chunks:
+            return Column(np.empty(0, dtype=object))
+
+        set_chunks = [values for values, mask in self.chunks if mask is None or mask.any()]
+        categories = object_array(list(self.categories))
+        if set_chunks and all(isinstance(values, _Codes) for values in set_chunks):
+            max_categories = max(int(self.length * CategoricalColumn.MAX_CATEGORY_RATIO), 1)
+            if len(categories) <= max_categories:
+                return self._build_categorical(categories)
+
+        chunks = [
+            (categories[values.codes] if isinstance(values, _Codes) else values, mask)
+            for values, mask in self.chunks
+        ]
+        set_chunks = [values for values, mask in chunks if mask is None or mask.any()]
+        kinds = {values.dtype.kind for values in set_chunks}
+        if len(kinds) > 1 and not kinds <= {"i", "f"}:
+            # the column only looked numeric in some chunks, keep all values as strings
+            chunks = [(_as_strings(values), mask) for values, mask in chunks]
+        else:
+            dtype = np.result_type(*set_chunks) if set_chunks else np.dtype(object)
+            chunks = [(values.astype(dtype, copy=False), mask) for values, mask in chunks]
+
+        values = np.concatenate([values for values, _ in chunks])
+        mask = self._mask()
+        if mask is None:
+            return Column(values)
+        if values.dtype == object:
+            values[~mask] = None
+        return Column(values, mask)
+
+    def _build_categorical(self, categories):
+        codes = np.concatenate(
+            [
+                values.codes if isinstance(values, _Codes) else np.zeros(len(values), np.int64)
+                for values, _ in self.chunks
+            ]
+        )
+        codes = codes.astype(code_dtype(len(categories)))
+        return CategoricalColumn(codes, categories, self._mask())
+
+    def _mask(self):
+        if all(mask is None for _, mask in self.chunks):
+            return None
+        return np.concatenate(
+            [
+                np.ones(len(values), dtype=bool) if mask is None else mask
+                for values, mask in self.chunks
+            ]
+        )
+
+
+class _Codes:
+    """Codes of a chunk of strings into the categories of a _ChunkedColumn."""
+
+    def __init__(self, codes):
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.codes)
+
+
+def _as_strings(values):
+    return object_array([str(v) for v in values.tolist()])
+
+
+def _parse(values, dtype=None):
+    """Parses a chunk of strings into a typed array and a mask of the non-empty entries.
+
+    Without dtype, the values become bool if they are all 'True' or 'False', else int64 or
+    float64 if they can be parsed as such and strings otherwise.
+    """
+    mask = None
+    if "" in values:
+        mask = np.array([v != "" for v in values], dtype=bool)
+        present = [v for v in values if v != ""]
+    else:
+        present = list(values)
+
+    parsed = _parse_values(present, dtype)
+    if mask is None:
+        return parsed, None
+
+    if parsed.dtype == object:
+        full = np.empty(len(values), dtype=object)
+    else:
+        full = np.zeros(len(values), dtype=parsed.dtype)
+    full[mask] = parsed
+    return full, mask
+
+
+def _parse_values(values, dtype):
+    if dtype is None:
+        if values and set(values) <= {"True", "False"}:
+            return np.array([v == "True" for v in values], dtype=bool)
+        for numpy_type in (np.int64, np.float64):
+            try:
+                return np.array(values).astype(numpy_type)
+            except (ValueError, OverflowError):
+                continue
+        return object_array(values)
+
+    if dtype in _NUMPY_TYPES:
+        return np.array(values).astype(_NUMPY_TYPES[dtype])
+    elif dtype is bool:
+        return np.array([v == "True" for v in values], dtype=bool)
+    return object_array([dtype(v) for v in values])
+
+
+def _open(path, mode):
+    """Opens path, or uses path directly if it already is a file object."""
+    if hasattr(path, "read") or hasattr(path, "write"):
+        return nullcontext(path)
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def _chunks(rows, chunksize):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_rows(reader, n_fields):
+    """Yields the non-empty rows of a csv.reader, each of them has to have n_fields fields."""
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < n_fields:
+            raise ValueError(
+                f"Line {reader.line_num} has {len(row)} fields, but the header has {n_fields} !"
+            )
+        yield row
+
+
+def _read_edge_rows(rows, index, n_fields, nodetype, columns, chunksize):
+    """Reads rows of (source, target, *attributes) into an edge array and edge columns."""
+    edge_chunks = []
+    for chunk in _chunks(rows, chunksize):
+        fields = list(zip(*(row[:n_fields] for row in chunk)))
+        if len(fields) != n_fields or any(len(row) < n_fields for row in chunk):
+            raise ValueError(f"Every row needs at least {n_fields} fields !")
+
+        sources, targets = fields[0], fields[1]
+        if nodetype is not None:
+            sources = [nodetype(label) for label in sources]
+            targets = [nodetype(label) for label in targets]
+
+        # source and target of every edge in turn, so that nodes are numbered in the order
+        # in which they appear in the file
+        endpoints = chain.from_iterable(zip(sources, targets))
+        edge_chunks.append(index.encode(endpoints, count=2 * len(chunk)).reshape(-1, 2))
+
+        for column, values in zip(columns, fields[2:]):
+            column.add(values)
+
+    if not edge_chunks:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(edge_chunks)
+
+
+def read_edgelist(cls, path, is_directed, delimiter, comments, nodetype, data, chunksize):
+    """Reads an edge list, see InterGraph.from_edgelist."""
+    data = list(data)
+    columns = [_ChunkedColumn(dtype) for _, dtype in data]
+    index = LabelIndex()
+
+    def rows(f):
+        for line in f:
+            if comments:
+                line = line.split(comments, 1)[0]
+            line = line.rstrip("\r\n")
+            if line.strip():
+                yield line.split(delimiter)
+
+    with _open(path, "r") as f, stage("read_edges"):
+        edges = _read_edge_rows(rows(f), index, 2 + len(data), nodetype, columns, chunksize)
+
+    return cls.from_columns(
+        index.labels(),
+        edges,
+        is_directed,
+        edge_columns={key: column.build() for (key, _), column in zip(data, columns)},
+    )
+
+
+def read_csv(
+    cls,
+    path,
+    is_directed,
+    nodes_path,
+    source,
+    target,
+    node_id,
+    delimiter,
+    nodetype,
+    dtypes,
+    chunksize,
+):
+    """Reads edges and optionally nodes from CSV files, see InterGraph.from_csv."""
+    dtypes = dtypes or {}
+    index = LabelIndex()
+
+    node_columns = {}
+    if nodes_path is not None:
+        with _open(nodes_path, "r") as f, stage("read_nodes"):
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader)
+            if node_id not in header:
+                raise ValueError(f"Column '{node_id}' not found in {nodes_path} !")
+            position = header.index(node_id)
+            node_columns = {
+                key: _ChunkedColumn(dtypes.get(key)) for key in header if key != node_id
+            }
+            for chunk in _chunks(_csv_rows(reader, len(header)), chunksize):
+                fields = list(zip(*chunk))
+                labels = fields[position]
+                if nodetype is not None:
+                    labels = [nodetype(label) for label in labels]
+                start = len(index)
+                ids = index.encode(labels, count=len(labels))
+                # every row of the node file has to add a new node
+                duplicates = np.flatnonzero(ids != np.arange(start, start + len(ids)))
+                if len(duplicates):
+                    raise ValueError(
+                        f"Node id {labels[duplicates[0]]!r} appears more than once "
+                        f"in {nodes_path} !"
+                    )
+                for key, values in zip(header, fields):
+                    if key != node_id:
+                        node_columns[key].add(values)
+
+    with _open(path, "r") as f, stage("read_edges"):
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader)
+        for key in (source, target):
+            if key not in header:
+                raise ValueError(f"Column '{key}' not found in {path} !")
+
+        order = [header.index(source), header.index(target)]
+        order += [i for i, key in enumerate(header) if i not in order]
+        keys = [header[i] for i in order[2:]]
+        edge_columns = {key: _ChunkedColumn(dtypes.get(key)) for key in keys}
+
+        rows = ([row[i] for i in order] for row in _csv_rows(reader, len(header)))
+        edges = _read_edge_rows(
+            rows, index, len(order), nodetype, list(edge_columns.values()), chunksize
+        )
+
+    # nodes that only appear in the edges have no node attributes
+    for column in node_columns.values():
+        column.pad(len(index) - column.length)
+
+    return cls.from_columns(
+        index.labels(),
+        edges,
+        is_directed,
+        {key: column.build() for key, column in node_columns.items()},
+        {key: column.build() for key, column in edge_columns.items()},
+    )
+
+
+def _chunk_values(column, start, stop, missing):
+    return column.take(slice(start, stop)).filled_values(missing)
+
+
+def _edge_rows(G, keys, chunksize, missing):
+    labels = G.labels.values
+    columns = [G.edge_columns[key] for key in keys]
+    for start in range(0, G.n_edges, chunksize):
+        stop = start + chunksize
+        edges = G.edge_array[start:stop]
+        yield zip(
+            labels[edges[:, 0]].tolist(),
+            labels[edges[:, 1]].tolist(),
+            *(_chunk_values(column, start, stop, missing) for column in columns),
+        )
+
+
+def write_edgelist(G, path, delimiter, data, chunksize):
+    """Writes an edge list, see InterGraph.to_edgelist."""
+    keys = list(G.edge_columns) if data is True else list(data or ())
+    for key in keys:
+        if not G.edge_columns[key].is_complete:
+            raise ValueError(
+                f"Edge attribute {key} is not set on every edge and cannot be written "
+                "to an edge list, use to_csv instead !"
+            )
+
+    with _open(path, "w") as f, stage("write_edges", count=G.n_edges):
+        for rows in _edge_rows(G, keys, chunksize, None):
+            f.writelines(delimiter.join(map(str, row)) + "\n" for row in rows)
+
+
+def write_csv(G, path, nodes_path, source, target, node_id, delimiter, chunksize):
+    """Writes edges and optionally nodes to CSV files, see InterGraph.to_csv."""
+    if nodes_path is not None:
+        with _open(nodes_path, "w") as f, stage("write_nodes", count=G.n_nodes):
+            writer = csv.writer(f, delimiter=delimiter)
+            writer.writerow([node_id, *G.node_columns])
+            for start in range(0, G.n_nodes, chunksize):
+                stop = start + chunksize
+                writer.writerows(
+                    zip(
+                        _chunk_values(G.labels, start, stop, ""),
+                        *(
+                            _chunk_values(column, start, stop, "")
+                            for column in G.node_columns.values()
+                        ),
+                    )
+                )
+
+    keys = list(G.edge_columns)
+    with _open(path, "w") as f, stage("write_edges", count=G.n_edges):
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow([source, target, *keys])
+        for rows in _edge_rows(G, keys, chunksize, ""):
+            writer.writerows(rows)
@@ -1,31 +1,82 @@
-from .Graph import InterGraph
+from .Graph import InterGraph, _read_graph_tool, _read_igraph, _write_graph_tool, _write_igraph
+from .cache import cached
+from .columns import edge_array
+from .profiling import profiled
 
+__all__ = ["nx2gt", "nx2igraph", "gt2nx", "gt2igraph", "igraph2nx", "igraph2gt"]
 
-def nx2gt(nxG, labelname=None):
-    G = InterGraph.from_networkx(nxG)
-    return G.to_graph_tool(labelname=labelname)
+# With attributes=[...], the InterGraph is created lazily, so that only the selected
+# attributes are extracted from the source graph.
+# With cache=ConversionCache(), results are reused for graphs with the same fingerprint,
+# see cache.py. Cached results are shared and must not be changed in place.
 
 
-def nx2igraph(nxG):
-    G = InterGraph.from_networkx(nxG)
-    return G.to_igraph()
+@profiled("nx2gt")
+@cached("labelname", "attributes")
+def nx2gt(nxG, labelname=None, workers=None, attributes=None, cache=None):
+    G = InterGraph.from_networkx(nxG, lazy=attributes is not None)
+    return G.to_graph_tool(labelname=labelname, workers=workers, attributes=attributes)
 
 
-def gt2nx(gtG, labelname=None):
-    G = InterGraph.from_graph_tool(gtG, labelname=labelname)
-    return G.to_networkx()
+@profiled("nx2igraph")
+@cached("attributes")
+def nx2igraph(nxG, attributes=None, cache=None):
+    G = InterGraph.from_networkx(nxG, lazy=attributes is not None)
+    return G.to_igraph(attributes=attributes)
 
 
-def gt2igraph(gtG, labelname=None):
-    G = InterGraph.from_graph_tool(gtG, labelname=labelname)
-    return G.to_igraph()
+@profiled("gt2nx")
+@cached("labelname", "attributes")
+def gt2nx(gtG, labelname=None, attributes=None, cache=None):
+    G = InterGraph.from_graph_tool(gtG, labelname=labelname, lazy=attributes is not None)
+    return G.to_networkx(attributes=attributes)
 
 
-def igraph2nx(iG):
-    G = InterGraph.from_igraph(iG)
-    return G.to_networkx()
+@profiled("gt2igraph")
+@cached("labelname", "attributes")
+def gt2igraph(gtG, labelname=None, attributes=None, cache=None):
+    # graph-tool and igraph exchange the edge array and one attribute column at a time,
+    # without building an InterGraph of the whole graph first.
+    from graph_tool import Graph
 
+    if not isinstance(gtG, Graph):
+        raise TypeError("gtG must be an instance of graph_tool.Graph() !")
 
-def igraph2gt(iG, labelname=None):
-    G = InterGraph.from_igraph(iG)
-    return G.to_graph_tool(labelname=labelname)
+    is_directed, labels, edges, node_columns, edge_columns = _read_graph_tool(gtG, labelname)
+    return _write_igraph(
+        len(labels),
+        edges,
+        is_directed,
+        labels,
+        node_columns.stream(attributes),
+        edge_columns.stream(attributes),
+    )
+
+
+@profiled("igraph2nx")
+@cached("attributes")
+def igraph2nx(iG, attributes=None, cache=None):
+    G = InterGraph.from_igraph(iG, lazy=attributes is not None)
+    return G.to_networkx(attributes=attributes)
+
+
+@profiled("igraph2gt")
+@cached("labelname", "attributes")
+def igraph2gt(iG, labelname=None, workers=None, attributes=None, cache=None):
+    # see gt2igraph
+    import igraph
+
+    if not isinstance(iG, igraph.Graph):
+        raise TypeError("iG must be instance of igraph.Graph() !")
+
+    is_directed, labels, edges, node_columns, edge_columns = _read_igraph(iG)
+    return _write_graph_tool(
+        len(labels),
+        edge_array(edges),
+        is_directed,
+        labels,
+        node_columns.stream(attributes),
+        edge_columns.stream(attributes),
+        labelname=labelname,
+        workers=workers,
+    )
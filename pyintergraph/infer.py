@@ -1,4 +1,5 @@
 from collections import abc
+from itertools import chain
 import numbers
 
 import pyintergraph
@@ -58,16 +59,76 @@ def get_best_fitting_type(c_types):
         return "uint8_t"
 
 
+def is_scalar_type(value_type):
+    """Checks whether a graph-tool value type can be accessed as numpy array."""
+    return not (
+        value_type.startswith("vector") or value_type in ("string", "python::object")
+    )
+
+
+def _is_vector(v):
+    return isinstance(v, abc.Iterable) and not isinstance(v, (str, dict))
+
+
+def get_c_types(values):
+    """Collects the c types of all values in a single pass.
+
+    get_c_type is only called once per python type, integers are checked by their range.
+    """
+    c_types = set()
+    seen = set()
+    low = high = None
+    for v in values:
+        value_type = type(v)
+        if value_type is int:
+            if low is None:
+                low = high = v
+            elif v < low:
+                low = v
+            elif v > high:
+                high = v
+        elif value_type not in seen:
+            seen.add(value_type)
+            c_types.add(get_c_type(v))
+
+    if low is not None:
+        c_types.add(get_c_type(low))
+        c_types.add(get_c_type(high))
+    return c_types
+
+
+def infer_array_type(values):
+    """Infers the graph-tool value type for all values of a numpy array.
+
+    Numeric arrays are inferred from their dtype and value range, arrays of dtype object
+    are scanned once. If all values are sequences, the value type is a vector of the best
+    fitting type for all of their elements.
+    """
+    kind = values.dtype.kind
+    if kind == "b":
+        return "uint8_t"
+    elif kind in "iu":
+        return get_best_fitting_type(
+            {get_c_type(int(values.min())), get_c_type(int(values.max()))}
+        )
+    elif kind == "f":
+        return get_c_type(1.0)
+
+    values = values.tolist()
+    if values and all(_is_vector(v) for v in values):
+        elements = list(chain.from_iterable(values))
+        if not elements:
+            return "vector<double>"
+        return infer_type(elements, as_vector=True)
+    return infer_type(values, as_vector=False)
+
+
 def infer_type(values, as_vector=True):
     # check for types in Iterable
-    if (
-        isinstance(values, abc.Iterable)
-        and not isinstance(values, str)
-        and not isinstance(values, dict)
-    ):
-        c_types = {get_c_type(v) for v in values}
+    if _is_vector(values):
+        c_types = get_c_types(values)
     else:
-        c_types = get_c_type(values)
+        c_types = {get_c_type(values)}
 
     number_types = ["long double", "double", "long", "int", "short", "bool"]
     if any(t in number_types for t in c_types) and not all(
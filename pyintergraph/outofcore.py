@@ -0,0 +1,333 @@
+"""Out-of-core construction of InterGraph objects for graphs that do not fit in memory.
+
+OutOfCoreBuilder takes the edges and attributes of a graph in chunks and appends every chunk
+to raw files in a temporary directory right away. build() memory-maps these files as the
+columns of an InterGraph. Only the node label index, the categories of string attributes and
+attributes of other python objects are kept in memory.
+
+The converters read the memory-mapped columns like any other column. With a chunksize,
+to_graph_tool and to_igraph insert the edges chunk by chunk, so that only the pages of the
+current chunk have to be resident.
+"""
+from itertools import chain
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .columns import CategoricalColumn, Column, object_array, to_array
+from .edgelist import CHUNKSIZE, LabelIndex
+from .profiling import stage
+
+
+class _SpillFile:
+    """A 1-d array of fixed dtype that grows by appending chunks to a raw file."""
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self._file = open(path, "wb")
+
+    def append(self, values):
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        values.tofile(self._file)
+        self.length += len(values)
+
+    def fill(self, value, n):
+        for start in range(0, n, CHUNKSIZE):
+            self.append(np.full(min(CHUNKSIZE, n - start), value, dtype=self.dtype))
+
+    def promote(self, dtype):
+        """Rewrites the file with all values cast to a wider dtype, chunk by chunk."""
+        self.close()
+        dtype = np.dtype(dtype)
+        if self.length:
+            old = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(self.length,))
+            with open(self.path + ".promoted", "wb") as f:
+                for start in range(0, self.length, CHUNKSIZE):
+                    old[start : start + CHUNKSIZE].astype(dtype).tofile(f)
+            del old
+            os.replace(self.path + ".promoted", self.path)
+        self.dtype = dtype
+        self._file = open(self.path, "ab")
+
+    def close(self):
+        self._file.close()
+
+    def map(self, shape=None):
+        """Closes the file and returns its content as read-only memory-mapped array."""
+        self.close()
+        shape = shape or (self.length,)
+        if self.length == 0:
+            return np.zeros(shape, dtype=self.dtype)
+        return np.memmap(self.path, dtype=self.dtype, mode="r", shape=shape)
+
+
+def _as_array(values):
+    if not isinstance(values, np.ndarray):
+        return to_array(list(values))
+    if values.dtype.kind in "US":
+        return values.astype(object)
+    return values
+
+
+class _SpillColumn:
+    """Appends the chunks of one attribute to files, see OutOfCoreBuilder.
+
+    Numeric attributes are written as raw values and strings as codes into categories that
+    are kept in memory. If a chunk does not fit the dtype of the values written so far, they
+    are promoted to the common dtype. All other python objects are kept in memory as well.
+    Entries that are not set are tracked in a mask file, which is only created once the
+    first entry is missing.
+    """
+
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+        self.length = 0
+        self.values = None
+        self.mask = None
+        self.categories = None
+        self.objects = None
+
+    def add(self, start, values):
+        """Writes values at the positions start, start + 1, ..."""
+        values = _as_array(values)
+        if self.values is None and self.objects is None:
+            self._create(values)
+        if start > self.length:
+            self._pad(start - self.length)
+
+        if self.objects is not None:
+            self.objects.append(values.astype(object))
+        elif self.categories is not None:
+            if not all(type(v) is str for v in values):
+                raise ValueError(f"Attribute {self.name} mixes strings and other values !")
+            categories = self.categories
+            self.values.append(
+                np.fromiter(
+                    (categories.setdefault(v, len(categories)) for v in values),
+                    dtype=np.int64,
+                    count=len(values),
+                )
+            )
+        else:
+            if values.dtype == object:
+                raise ValueError(
+                    f"Attribute {self.name} changes its type from {self.values.dtype} to "
+                    f"{values.dtype} !"
+                )
+            if not np.can_cast(values.dtype, self.values.dtype, casting="safe"):
+                # e.g. an int8 chunk followed by larger ints, the values written so far
+                # are rewritten with the common dtype
+                self.values.promote(np.result_type(self.values.dtype, values.dtype))
+            self.values.append(values)
+
+        if self.mask is not None:
+            self.mask.fill(1, len(values))
+        self.length += len(values)
+
+    def _create(self, values):
+        if values.dtype != object:
+            self.values = _SpillFile(self.path + ".values", values.dtype)
+        elif all(type(v) is str for v in values):
+            self.values = _SpillFile(self.path + ".codes", np.int64)
+            self.categories = {}
+        else:
+            self.objects = []
+
+    def _pad(self, n):
+        if self.mask is None:
+            self.mask = _SpillFile(self.path + ".mask", np.uint8)
+            self.mask.fill(1, self.length)
+        self.mask.fill(0, n)
+        if self.objects is not None:
+            self.objects.append(np.empty(n, dtype=object))
+        else:
+            self.values.fill(0, n)
+        self.length += n
+
+    def build(self, n):
+        """Returns the memory-mapped Column of length n."""
+        if n > self.length:
+            self._pad(n - self.length)
+        mask = None if self.mask is None else self.mask.map().view(bool)
+
+        if self.objects is not None:
+            values = np.concatenate(self.objects) if self.objects else np.empty(0, object)
+            return Column(values, mask)
+        elif self.categories is not None:
+            return CategoricalColumn(
+                self.values.map(), object_array(list(self.categories)), mask
+            )
+        return Column(self.values.map(), mask)
+
+    def close(self):
+        for spill in (self.values, self.mask):
+            if spill is not None:
+                spill.close()
+
+
+class _ScatterColumn:
+    """A _SpillColumn whose values are written to arbitrary positions, used for nodes.
+
+    The values and their positions are appended to files while adding and scattered into
+    the final Column chunk by chunk in build. Later values overwrite earlier ones.
+    """
+
+    def __init__(self, path, name):
+        self.path = path
+        self.column = _SpillColumn(path + ".added", name)
+        self.positions = _SpillFile(path + ".positions", np.int64)
+
+    def add(self, positions, values):
+        self.column.add(self.positions.length, values)
+        self.positions.append(positions)
+
+    def build(self, n):
+        added = self.column.build(self.positions.length)
+        positions = self.positions.map()
+
+        mask = self._output(".mask", bool, n)
+        if isinstance(added, CategoricalColumn):
+            source = added.codes
+            values = self._output(".codes", np.int64, n)
+        elif added.dtype == object:
+            source = added.values
+            values = np.empty(n, dtype=object)
+        else:
+            source = added.values
+            values = self._output(".values", added.dtype, n)
+
+        for start in range(0, len(positions), CHUNKSIZE):
+            stop = start + CHUNKSIZE
+            index = positions[start:stop]
+            values[index] = source[start:stop]
+            mask[index] = True
+
+        mask = None if mask.all() else mask
+        if isinstance(added, CategoricalColumn):
+            return CategoricalColumn(values, added.categories, mask)
+        return Column(values, mask)
+
+    def _output(self, suffix, dtype, n):
+        # memmap cannot map empty files
+        return np.memmap(self.path + suffix, dtype=dtype, mode="w+", shape=(max(n, 1),))[:n]
+
+    def close(self):
+        self.column.close()
+        self.positions.close()
+
+
+class OutOfCoreBuilder:
+    """Builds an InterGraph from chunks of edges and nodes, spilling the columns to disk.
+
+    Usage:
+        with OutOfCoreBuilder(is_directed=True) as builder:
+            for chunk in chunks:
+                builder.add_edges(chunk.source, chunk.target, {"weight": chunk.weight})
+            G = builder.build()
+        G.to_graph_tool(chunksize=1_000_000)
+
+    The InterGraph returned by build keeps using the memory-mapped files. If the builder
+    created the directory itself, it is removed by close. The mapped files stay readable
+    until the columns are released on POSIX systems.
+
+    :params:
+        is_directed: bool, defaults to True.
+        directory: None or path, defaults to None.
+            directory for the column files, a new temporary directory if None.
+    """
+
+    def __init__(self, is_directed=True, directory=None):
+        self.is_directed = is_directed
+        self._own_directory = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="pyintergraph-")
+        self.directory = directory
+
+        self.index = LabelIndex()
+        self.n_edges = 0
+        self._edges = _SpillFile(self._path("edges"), np.int64)
+        self._edge_columns = {}
+        self._node_columns = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _column(self, columns, cls, kind, key):
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = cls(self._path(f"{kind}-{len(columns)}"), key)
+        return column
+
+    def add_edges(self, sources, targets, attributes=None):
+        """Appends a chunk of edges.
+
+        :params:
+            sources: sequence of source node labels.
+            targets: sequence of target node labels of the same length.
+            attributes: None or dict of edge attribute name -> sequence of values, defaults
+                to None. attributes that are missing in a chunk are not set on its edges.
+        """
+        n = len(sources)
+        if len(targets) != n:
+            raise ValueError("sources and targets need to have the same length !")
+
+        with stage("add_edges", count=n):
+            endpoints = chain.from_iterable(zip(sources, targets))
+            self._edges.append(self.index.encode(endpoints, count=2 * n))
+            for key, values in (attributes or {}).items():
+                if len(values) != n:
+                    raise ValueError(f"Edge attribute {key} needs one value per edge !")
+                column = self._column(self._edge_columns, _SpillColumn, "edge", key)
+                column.add(self.n_edges, values)
+        self.n_edges += n
+
+    def add_nodes(self, labels, attributes=None):
+        """Adds a chunk of nodes, or sets attributes of nodes that were added before.
+
+        :params:
+            labels: sequence of node labels.
+            attributes: None or dict of node attribute name -> sequence of values, defaults
+                to None.
+        """
+        with stage("add_nodes", count=len(labels)):
+            positions = self.index.encode(labels, count=len(labels))
+            for key, values in (attributes or {}).items():
+                if len(values) != len(labels):
+                    raise ValueError(f"Node attribute {key} needs one value per node !")
+                column = self._column(self._node_columns, _ScatterColumn, "node", key)
+                column.add(positions, values)
+
+    def build(self):
+        """Returns the InterGraph with the memory-mapped columns and closes the builder."""
+        from .Graph import InterGraph
+
+        n_nodes = len(self.index)
+        with stage("build", count=self.n_edges):
+            G = InterGraph.from_columns(
+                self.index.labels(),
+                self._edges.map((self.n_edges, 2)),
+                self.is_directed,
+                {key: column.build(n_nodes) for key, column in self._node_columns.items()},
+                {key: column.build(self.n_edges) for key, column in self._edge_columns.items()},
+            )
+        self.close()
+        return G
+
+    def close(self):
+        """Closes all files and removes the directory if the builder created it."""
+        self._edges.close()
+        for column in chain(self._edge_columns.values(), self._node_columns.values()):
+            column.close()
+        if self._own_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
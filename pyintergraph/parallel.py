@@ -0,0 +1,38 @@
+"""Per-column work of the conversions in a pool of worker threads"""
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+
+from .profiling import stage
+
+
+def map_columns(func, items, workers=None, in_pool=None):
+    """Applies func to every item, e.g. a (kind, key, Column)-tuple.
+
+    Without workers, func is applied lazily while the results are consumed, so that only
+    one prepared column exists at a time. With workers > 1, the items selected by in_pool
+    are prepared at once in a thread pool. Threads only help for work that releases the
+    GIL, like the range scans and dtype casts of numeric numpy arrays, so in_pool should
+    select only such items. All other items are prepared lazily in the calling thread, as
+    without workers. Stages inside the worker threads are not reported to an active
+    Profile, only the enclosing 'prepare_columns' stage is.
+
+    :params:
+        func: callable that is called with the fields of every item.
+        items: iterable of tuples.
+        workers: None or int, defaults to None.
+            number of worker threads.
+        in_pool: None or callable, defaults to None.
+            called with the fields of every item, whether to prepare it in the pool.
+            all items are prepared in the pool if None.
+    :returns:
+        iterable of (item, result)-pairs in the order of items.
+    """
+    if workers is None or workers <= 1:
+        return ((item, func(*item)) for item in items)
+
+    items = list(items)
+    pooled = [in_pool is None or in_pool(*item) for item in items]
+    with stage("prepare_columns", count=sum(pooled)):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = iter(list(pool.map(lambda item: func(*item), compress(items, pooled))))
+    return ((item, next(results) if p else func(*item)) for item, p in zip(items, pooled))
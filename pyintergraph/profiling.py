@@ -0,0 +1,191 @@
+"""Opt-in instrumentation of the single stages of a conversion"""
+from contextlib import nullcontext
+import contextvars
+import functools
+import json
+import time
+import tracemalloc
+
+_active_profile = contextvars.ContextVar("pyintergraph_profile", default=None)
+
+
+class Stage:
+    """Measurements of one stage of a conversion.
+
+    :attributes:
+        name: name of the stage, e.g. 'add_edges'.
+        path: names of all enclosing stages and this stage, joined by '/'.
+        attribute: name of the attribute the stage worked on, if any.
+        count: number of elements (nodes, edges or values) the stage processed, if known.
+        seconds: wall time of the stage.
+        memory_peak: peak of memory allocated during the stage in bytes,
+            None if the Profile does not trace memory.
+    """
+
+    def __init__(self, name, path, attribute=None, count=None):
+        self.name = name
+        self.path = path
+        self.attribute = attribute
+        self.count = count
+        self.seconds = None
+        self.memory_peak = None
+
+        self._start_time = None
+        self._start_memory = None
+        self._peak_memory = 0
+
+    def __repr__(self):
+        return f"Stage({self.path!r}, seconds={self.seconds}, count={self.count})"
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "path": self.path,
+            "attribute": self.attribute,
+            "count": self.count,
+            "seconds": self.seconds,
+            "memory_peak": self.memory_peak,
+        }
+
+
+class Profile:
+    """Records every stage of the conversions that run while the Profile is active.
+
+    Usage:
+        with pyintergraph.profile(trace_memory=True) as report:
+            pyintergraph.nx2gt(nxG)
+        report.to_dict()
+
+    :params:
+        callback: None or callable, defaults to None.
+            called with every Stage as soon as it is finished.
+        trace_memory: bool, defaults to False.
+            if True, the peak of the memory allocated during every stage is recorded
+            with tracemalloc. This slows down the conversion considerably.
+    """
+
+    def __init__(self, callback=None, trace_memory=False):
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.stages = []
+
+        self._stack = []
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _active_profile.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_profile.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _enter_stage(self, name, attribute, count):
+        path = "/".join([s.name for s in self._stack] + [name])
+        stage = Stage(name, path, attribute=attribute, count=count)
+        self.stages.append(stage)
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent._peak_memory = max(parent._peak_memory, peak)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            stage._start_memory = current
+            stage._peak_memory = current
+
+        self._stack.append(stage)
+        stage._start_time = time.perf_counter()
+        return stage
+
+    def _exit_stage(self, stage):
+        stage.seconds = time.perf_counter() - stage._start_time
+        self._stack.pop()
+
+        if self.trace_memory:
+            stage._peak_memory = max(stage._peak_memory, tracemalloc.get_traced_memory()[1])
+            stage.memory_peak = stage._peak_memory - stage._start_memory
+            if self._stack:
+                parent = self._stack[-1]
+                parent._peak_memory = max(parent._peak_memory, stage._peak_memory)
+
+        if self.callback is not None:
+            self.callback(stage)
+
+    def summary(self):
+        """Aggregates the stages by their path.
+
+        :returns:
+            dict of path -> dict with the number of calls, total seconds, total count
+            and the largest memory_peak.
+        """
+        summary = {}
+        for stage in self.stages:
+            entry = summary.setdefault(
+                stage.path, {"calls": 0, "seconds": 0.0, "count": 0, "memory_peak": None}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += stage.seconds or 0.0
+            entry["count"] += stage.count or 0
+            if stage.memory_peak is not None:
+                entry["memory_peak"] = max(entry["memory_peak"] or 0, stage.memory_peak)
+        return summary
+
+    def to_dict(self):
+        return {
+            "stages": [stage.to_dict() for stage in self.stages],
+            "summary": self.summary(),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def profile(callback=None, trace_memory=False):
+    """Returns a Profile that records all conversion stages inside its with-block."""
+    return Profile(callback=callback, trace_memory=trace_memory)
+
+
+class _StageContext:
+    def __init__(self, profile, name, attribute, count):
+        self._profile = profile
+        self._args = (name, attribute, count)
+        self._stage = None
+
+    def __enter__(self):
+        self._stage = self._profile._enter_stage(*self._args)
+        return self._stage
+
+    def __exit__(self, *exc_info):
+        self._profile._exit_stage(self._stage)
+
+
+def stage(name, count=None, attribute=None):
+    """Context manager that reports a stage to the active Profile, if there is one."""
+    active = _active_profile.get()
+    if active is None:
+        return nullcontext()
+    return _StageContext(active, name, attribute, count)
+
+
+def profiled(name):
+    """Decorator that reports every call of the decorated function as a stage."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_profile.get() is None:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,139 @@
+"""Sharing InterGraph objects between processes through multiprocessing.shared_memory.
+
+InterGraph.to_shared_memory copies the edge array, the numeric labels and the values, masks
+and codes of all attribute columns into a single shared memory block and returns a
+SharedGraph. The SharedGraph is small and can be pickled to worker processes, which attach
+to the block with InterGraph.from_shared_memory without copying the arrays. String labels,
+the categories of string attributes and attributes of other python objects are pickled with
+the SharedGraph.
+"""
+import numpy as np
+
+from .columns import CategoricalColumn, Column
+
+# offsets of the arrays in the block are aligned to this many bytes
+_ALIGNMENT = 64
+
+
+def _attach(name):
+    from multiprocessing import shared_memory
+
+    try:
+        # the attaching process must not unlink the block when it exits
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # python < 3.13, the block is tracked by the resource tracker of the pool
+        return shared_memory.SharedMemory(name=name)
+
+
+class _Layout:
+    """Collects the arrays of a graph and assigns them their offsets in the block."""
+
+    def __init__(self):
+        self.arrays = []
+        self.size = 0
+
+    def add(self, array):
+        array = np.ascontiguousarray(array)
+        offset = -(-self.size // _ALIGNMENT) * _ALIGNMENT
+        self.arrays.append((offset, array))
+        self.size = offset + array.nbytes
+        return offset, array.dtype.str, array.shape
+
+    def add_column(self, column):
+        mask = None if column.mask is None else self.add(column.mask)
+        if isinstance(column, CategoricalColumn):
+            return {
+                "kind": "categorical",
+                "codes": self.add(column.codes),
+                "categories": column.categories,
+                "mask": mask,
+            }
+        elif column.dtype == object:
+            return {"kind": "object", "values": column.values, "mask": mask}
+        return {"kind": "array", "values": self.add(column.values), "mask": mask}
+
+
+class SharedGraph:
+    """Picklable handle of an InterGraph in a shared memory block.
+
+    Created by InterGraph.to_shared_memory. The creating process owns the block and has to
+    call close once no worker uses the graph anymore, or use the SharedGraph as context
+    manager. Workers attach with InterGraph.from_shared_memory.
+    """
+
+    def __init__(self, G):
+        from multiprocessing import shared_memory
+
+        layout = _Layout()
+        self.is_directed = G.is_directed
+        if G.labels.dtype == object:
+            self.labels = {"kind": "object", "values": G.labels.values, "mask": None}
+        else:
+            self.labels = layout.add_column(G.labels)
+        self.edges = layout.add(G.edge_array)
+        self.node_columns = {key: layout.add_column(col) for key, col in G.node_columns.items()}
+        self.edge_columns = {key: layout.add_column(col) for key, col in G.edge_columns.items()}
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(layout.size, 1))
+        self.name = self._shm.name
+        for offset, array in layout.arrays:
+            target = np.ndarray(array.shape, array.dtype, buffer=self._shm.buf, offset=offset)
+            target[...] = array
+            del target
+
+    def __repr__(self):
+        return f"SharedGraph(name={self.name!r}, size={self.size})"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_shm"] = None
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def size(self):
+        return None if self._shm is None else self._shm.size
+
+    def close(self):
+        """Releases the block. Only the creating process removes it from the system."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def attach(self, cls):
+        """Returns a read-only Graph object of class cls on the arrays in the block."""
+        shm = _attach(self.name)
+
+        def array(spec):
+            if spec is None:
+                return None
+            offset, dtype, shape = spec
+            arr = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf, offset=offset)
+            arr.flags.writeable = False
+            return arr
+
+        def column(spec):
+            mask = array(spec["mask"])
+            if spec["kind"] == "categorical":
+                return CategoricalColumn(array(spec["codes"]), spec["categories"], mask)
+            elif spec["kind"] == "object":
+                return Column(spec["values"], mask)
+            return Column(array(spec["values"]), mask)
+
+        G = cls.from_columns(
+            column(self.labels),
+            array(self.edges),
+            self.is_directed,
+            {key: column(spec) for key, spec in self.node_columns.items()},
+            {key: column(spec) for key, spec in self.edge_columns.items()},
+        )
+        # the block stays mapped as long as the Graph object exists
+        G._shared_memory = shm
+        return G
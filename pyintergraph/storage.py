@@ -0,0 +1,229 @@
+"""Native binary file format for InterGraph objects.
+
+A file consists of
+    - the magic bytes MAGIC,
+    - the length of the header as little-endian uint64,
+    - a JSON header that describes the graph and where its arrays are stored,
+    - the raw arrays, each aligned to ALIGNMENT bytes.
+
+The edges are stored as one (E, 2) int64 array. Numeric columns are stored as raw arrays,
+so that they can be memory-mapped when loading. String labels are stored as a table of
+strings, string attributes are dictionary-encoded: an integer code array plus a table of the
+unique strings. All other columns are pickled, so only trusted files should be loaded.
+"""
+import json
+import os
+import pickle
+import struct
+import uuid
+
+import numpy as np
+
+from .columns import CategoricalColumn, Column, code_dtype, object_array
+
+MAGIC = b"PYIGRAPH"
+# version 2 stores string labels as plain table of strings
+VERSION = 2
+ALIGNMENT = 64
+
+
+class _Writer:
+    def __init__(self):
+        self.blobs = []
+        self.offset = 0
+
+    def add(self, data):
+        """Registers bytes or a contiguous array and returns its offset in the data section.
+
+        Arrays are kept by reference and only written out by save.
+        """
+        offset = self.offset
+        self.blobs.append((offset, data))
+        self.offset += data.nbytes if isinstance(data, np.ndarray) else len(data)
+        self.offset += -self.offset % ALIGNMENT
+        return offset
+
+    def add_array(self, arr):
+        arr = np.ascontiguousarray(arr)
+        return {
+            "offset": self.add(arr),
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+        }
+
+    def add_strings(self, strings):
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return {
+            "offsets": self.add_array(offsets),
+            "data": {"offset": self.add(b"".join(encoded)), "size": int(offsets[-1])},
+        }
+
+    def add_column(self, column):
+        mask = None if column.mask is None else self.add_array(column.mask)
+        if isinstance(column, CategoricalColumn):
+            return self.add_string_column(column.categories.tolist(), column.codes, mask)
+
+        values = column.values
+        if values.dtype != object:
+            return {"kind": "numeric", "values": self.add_array(values), "mask": mask}
+
+        valid = values if column.mask is None else values[column.mask]
+        if all(type(v) is str for v in valid):
+            categories, codes = encode_strings(values, column.mask)
+            return self.add_string_column(categories, codes, mask)
+
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+        return {
+            "kind": "object",
+            "pickle": {"offset": self.add(data), "size": len(data)},
+            "mask": mask,
+        }
+
+    def add_labels(self, labels):
+        """Adds the node labels, strings are stored as they are and not dictionary-encoded."""
+        values = labels.values
+        if values.dtype == object and all(type(v) is str for v in values):
+            return {"kind": "strings", "values": self.add_strings(values.tolist()), "mask": None}
+        return self.add_column(labels)
+
+    def add_string_column(self, categories, codes, mask):
+        return {
+            "kind": "string",
+            "codes": self.add_array(codes),
+            "categories": self.add_strings(categories),
+            "mask": mask,
+        }
+
+
+def encode_strings(values, mask=None):
+    """Dictionary-encodes an object array of strings.
+
+    :returns:
+        list of the unique strings in order of their first appearance and an integer
+        array with the position of every value in that list (0 where mask is False).
+    """
+    lookup = {}
+    valid = values if mask is None else values[mask]
+    valid_codes = np.fromiter(
+        (lookup.setdefault(v, len(lookup)) for v in valid), dtype=np.int64, count=len(valid)
+    )
+    codes = np.zeros(len(values), dtype=code_dtype(len(lookup)))
+    if mask is None:
+        codes[:] = valid_codes
+    else:
+        codes[mask] = valid_codes
+    return list(lookup), codes
+
+
+def save(G, path):
+    """Writes an InterGraph to path."""
+    writer = _Writer()
+    header = {
+        "version": VERSION,
+        "is_directed": bool(G.is_directed),
+        "is_multigraph": G._is_multigraph,
+        "edges": writer.add_array(G.edge_array.astype(np.int64, copy=False)),
+        "labels": writer.add_labels(G.labels),
+        "node_columns": {key: writer.add_column(col) for key, col in G.node_columns.items()},
+        "edge_columns": {key: writer.add_column(col) for key, col in G.edge_columns.items()},
+    }
+    header = json.dumps(header).encode("utf-8")
+
+    start = len(MAGIC) + 8 + len(header)
+    start += -start % ALIGNMENT
+
+    # the graph may be memory-mapped from path itself, so the file is written next to it
+    # and only replaces path once it is complete
+    path = os.fspath(path)
+    tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(b"\0" * (start - f.tell()))
+            for offset, data in writer.blobs:
+                f.write(b"\0" * (start + offset - f.tell()))
+                if isinstance(data, np.ndarray):
+                    data = data.reshape(-1).view(np.uint8)
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class _Reader:
+    def __init__(self, path, start, mmap):
+        self.path = path
+        self.start = start
+        self.mmap = mmap
+
+    def read_bytes(self, ref):
+        with open(self.path, "rb") as f:
+            f.seek(self.start + ref["offset"])
+            return f.read(ref["size"])
+
+    def read_array(self, ref):
+        dtype = np.dtype(ref["dtype"])
+        shape = tuple(ref["shape"])
+        offset = self.start + ref["offset"]
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=dtype)
+        if self.mmap:
+            return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        count = int(np.prod(shape))
+        return np.fromfile(self.path, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+    def read_strings(self, ref):
+        offsets = np.asarray(self.read_array(ref["offsets"])).tolist()
+        data = self.read_bytes(ref["data"])
+        return [data[a:b].decode("utf-8") for a, b in zip(offsets[:-1], offsets[1:])]
+
+    def read_column(self, ref):
+        mask = None if ref["mask"] is None else self.read_array(ref["mask"])
+        if ref["kind"] == "numeric":
+            return Column(self.read_array(ref["values"]), mask)
+        elif ref["kind"] == "strings":
+            return Column(object_array(self.read_strings(ref["values"])), mask)
+        elif ref["kind"] == "string":
+            categories = object_array(self.read_strings(ref["categories"]))
+            return CategoricalColumn(self.read_array(ref["codes"]), categories, mask)
+        return Column(pickle.loads(self.read_bytes(ref["pickle"])), mask)
+
+
+def read_header(path):
+    """Reads the header of a file written by save and the offset of its data section."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an InterGraph file !")
+        (length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(length).decode("utf-8"))
+
+    if header["version"] > VERSION:
+        raise ValueError(f"{path} was written by a newer version of pyintergraph !")
+
+    start = len(MAGIC) + 8 + length
+    start += -start % ALIGNMENT
+    return header, start
+
+
+def load(cls, path, mmap=True):
+    """Reads an InterGraph from path, see InterGraph.load.
+
+    Columns of python objects are unpickled, only load files from trusted sources.
+    """
+    header, start = read_header(path)
+    reader = _Reader(path, start, mmap)
+
+    return cls.from_columns(
+        reader.read_column(header["labels"]),
+        reader.read_array(header["edges"]),
+        header["is_directed"],
+        {key: reader.read_column(ref) for key, ref in header["node_columns"].items()},
+        {key: reader.read_column(ref) for key, ref in header["edge_columns"].items()},
+        is_multigraph=header["is_multigraph"],
+    )
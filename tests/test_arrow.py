@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn, Column
+from pyintergraph.exceptions import PyIntergraphCompatibilityException
+
+from .testdata.networkxdata import nx_test_graphs
+
+pa = pytest.importorskip("pyarrow")
+
+
+def attributed_graph():
+    return pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c"],
+        edges=np.array([[0, 1], [1, 2]]),
+        is_directed=False,
+        node_columns={
+            "kind": Column(np.array(["x", "y", None], dtype=object), np.array([1, 1, 0], bool)),
+            "size": Column(np.array([1, 2, 3]), np.array([1, 0, 1], bool)),
+        },
+        edge_columns={
+            "weight": Column(np.array([0.5, 1.5])),
+            "flag": Column(np.array([True, False])),
+        },
+    )
+
+
+def test_to_arrow_tables():
+    G = attributed_graph()
+    nodes, edges = G.to_arrow()
+
+    assert nodes.column_names == ["id", "kind", "size"]
+    assert nodes.column("kind").to_pylist() == ["x", "y", None]
+    assert nodes.column("size").to_pylist() == [1, None, 3]
+    assert edges.column_names == ["source", "target", "weight", "flag"]
+    assert edges.column("target").to_pylist() == [1, 2]
+    assert edges.schema.metadata[b"pyintergraph.is_directed"] == b"false"
+
+
+def test_numeric_columns_are_not_copied():
+    G = attributed_graph()
+    weight = G.edge_columns["weight"].values
+    _, edges = G.to_arrow()
+
+    buffer = edges.column("weight").chunk(0).buffers()[1]
+    assert buffer.address == weight.ctypes.data
+
+    loaded = pyintergraph.InterGraph.from_arrow(None, edges)
+    assert loaded.edge_columns["weight"].values.ctypes.data == buffer.address
+    assert loaded.node_labels == {0: 0, 1: 1, 2: 2}
+
+
+def test_arrow_roundtrip():
+    G = attributed_graph()
+    loaded = pyintergraph.InterGraph.from_arrow(*G.to_arrow())
+
+    assert loaded.is_directed is False
+    assert loaded.node_labels == G.node_labels
+    assert loaded.edges == G.edges
+    assert loaded.node_attributes == G.node_attributes
+    assert loaded.edge_attributes == G.edge_attributes
+    assert loaded.node_columns["size"].dtype == np.int64
+
+
+def test_from_arrow_needs_direction():
+    edges = pa.table({"source": [0], "target": [1]})
+    with pytest.raises(ValueError):
+        pyintergraph.InterGraph.from_arrow(None, edges)
+
+    G = pyintergraph.InterGraph.from_arrow(None, edges, is_directed=True)
+    assert G.edges == [(0, 1)]
+
+
+def test_reserved_column_names():
+    G = pyintergraph.InterGraph.from_columns(
+        [0, 1], np.array([[0, 1]]), True, edge_columns={"source": Column(np.array([1]))}
+    )
+    with pytest.raises(PyIntergraphCompatibilityException):
+        G.to_arrow()
+    assert G.to_arrow(source="u")[1].column_names == ["u", "target", "source"]
+
+
+def test_parquet_attribute_selection(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    G = attributed_graph()
+    G.to_parquet(tmp_path / "nodes.parquet", tmp_path / "edges.parquet")
+
+    loaded = pyintergraph.InterGraph.from_parquet(
+        tmp_path / "nodes.parquet", tmp_path / "edges.parquet", attributes=["weight"]
+    )
+    assert loaded.is_directed is False
+    assert loaded.edges == G.edges
+    assert list(loaded.node_columns) == []
+    assert loaded.edge_attributes == [{"weight": 0.5}, {"weight": 1.5}]
+
+
+@pytest.mark.nx
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_parquet_roundtrip(nx_graph, tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    G = pyintergraph.InterGraph.from_networkx(nx_graph)
+    G.to_parquet(tmp_path / "nodes.parquet", tmp_path / "edges.parquet")
+
+    loaded = pyintergraph.InterGraph.from_parquet(
+        tmp_path / "nodes.parquet", tmp_path / "edges.parquet"
+    )
+    reversed_nx_graph = loaded.to_networkx()
+    assert list(nx_graph.nodes(data=True)) == list(reversed_nx_graph.nodes(data=True))
+    assert list(nx_graph.edges(data=True)) == list(reversed_nx_graph.edges(data=True))
+
+
+def test_categorical_dictionary_array():
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c", "d", "e"],
+        np.array([[0, 1], [2, 3]]),
+        True,
+        node_columns={
+            "kind": Column.from_sparse(5, [0, 1, 3, 4], ["x", "y", "x", "y"], categorical=True)
+        },
+    )
+    nodes, edges = G.to_arrow()
+    assert pa.types.is_dictionary(nodes.column("kind").type)
+
+    loaded = pyintergraph.InterGraph.from_arrow(nodes, edges)
+    assert isinstance(loaded.node_columns["kind"], CategoricalColumn)
+    assert loaded.node_attributes == G.node_attributes
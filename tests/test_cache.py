@@ -0,0 +1,76 @@
+import pytest
+
+import pyintergraph
+from pyintergraph.cache import ConversionCache, fingerprint
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_cache_hits_and_fingerprint():
+    import networkx as nx
+
+    nx_graph = nx.karate_club_graph()
+    cache = ConversionCache()
+
+    first = pyintergraph.nx2igraph(nx_graph, cache=cache)
+    assert pyintergraph.nx2igraph(nx_graph, cache=cache) is first
+    assert pyintergraph.nx2igraph(nx.karate_club_graph(), cache=cache) is first
+    assert pyintergraph.nx2igraph(nx_graph, attributes=["weight"], cache=cache) is not first
+    assert cache.info()["hits"] == 2
+    assert cache.info()["misses"] == 2
+
+    nx_graph.add_edge(0, 33)
+    assert pyintergraph.nx2igraph(nx_graph, cache=cache) is not first
+    assert len(cache) == 3
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_cache_invalidate():
+    import networkx as nx
+
+    nx_graph = nx.karate_club_graph()
+    cache = ConversionCache()
+    first = pyintergraph.nx2igraph(nx_graph, cache=cache)
+
+    nx_graph.nodes[0]["club"] = "changed"
+    assert pyintergraph.nx2igraph(nx_graph, cache=cache) is first
+
+    cache.invalidate(nx_graph)
+    second = pyintergraph.nx2igraph(nx_graph, cache=cache)
+    assert second is not first
+    assert second.vs[0]["club"] == "changed"
+
+    cache.clear()
+    assert cache.info()["entries"] == cache.info()["nbytes"] == cache.info()["hits"] == 0
+
+
+@pytest.mark.ig
+def test_cache_evicts_least_recently_used():
+    import igraph as ig
+
+    graphs = [ig.Graph(n=10, edges=[(0, i)]) for i in range(1, 4)]
+    cache = ConversionCache(max_bytes=2 * 400)
+    for key, graph in enumerate(graphs):
+        cache.put(key, graph, nbytes=400)
+        cache.get(0)
+
+    assert cache.get(1) is None
+    assert cache.get(0) is graphs[0]
+    assert cache.evictions == 1
+    assert cache.nbytes == 800
+
+    cache.put("large", graphs[0], nbytes=1000)
+    assert cache.get("large") is None
+
+
+@pytest.mark.ig
+def test_fingerprint_igraph():
+    import igraph as ig
+
+    graph = ig.Graph(n=3, edges=[(0, 1), (1, 2)], directed=True)
+    assert fingerprint(graph) == fingerprint(graph.copy())
+    assert fingerprint(graph) != fingerprint(ig.Graph(n=3, edges=[(1, 0), (1, 2)], directed=True))
+
+    graph.vs["name"] = ["a", "b", "c"]
+    assert fingerprint(graph) != fingerprint(ig.Graph(n=3, edges=[(0, 1), (1, 2)], directed=True))
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.cli import main
+from pyintergraph.columns import Column
+
+
+@pytest.fixture
+def csv_graph(tmp_path):
+    (tmp_path / "edges.csv").write_text("source,target,weight,kind\na,b,1.5,x\nb,c,2.5,y\n")
+    return tmp_path / "edges.csv"
+
+
+def test_csv_to_native_and_edgelist(csv_graph, tmp_path):
+    assert main([str(csv_graph), str(tmp_path / "graph.igx"), "--chunksize", "1"]) == 0
+    G = pyintergraph.InterGraph.load(tmp_path / "graph.igx")
+    assert G.edge_attributes == [{"weight": 1.5, "kind": "x"}, {"weight": 2.5, "kind": "y"}]
+
+    args = [str(tmp_path / "graph.igx"), str(tmp_path / "graph.txt"), "--attributes", "weight"]
+    assert main(args) == 0
+    assert (tmp_path / "graph.txt").read_text() == "a b 1.5\nb c 2.5\n"
+
+
+def test_profile_to_json(csv_graph, tmp_path):
+    report = tmp_path / "profile.json"
+    args = [str(csv_graph), str(tmp_path / "graph.bin"), "--to", "native", "--profile", str(report)]
+    assert main(args) == 0
+
+    summary = json.loads(report.read_text())["summary"]
+    assert "from_csv/read_edges" in summary
+    assert "save" in summary
+
+
+def test_profile_summary(csv_graph, tmp_path, capsys):
+    assert main([str(csv_graph), str(tmp_path / "out.csv"), "--profile"]) == 0
+    assert "to_csv/write_edges" in capsys.readouterr().err
+
+
+def test_errors(csv_graph, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(csv_graph), str(tmp_path / "graph.unknown")])
+
+    assert main([str(tmp_path / "missing.csv"), str(tmp_path / "out.igx")]) == 1
+    assert "pyintergraph: error:" in capsys.readouterr().err
+
+
+@pytest.mark.nx
+def test_graphml_roundtrip(csv_graph, tmp_path):
+    assert main([str(csv_graph), str(tmp_path / "graph.graphml"), "--undirected"]) == 0
+    assert main([str(tmp_path / "graph.graphml"), str(tmp_path / "graph.gml")]) == 0
+
+    import networkx as nx
+
+    nxG = nx.read_gml(tmp_path / "graph.gml")
+    assert not nxG.is_directed()
+    assert sorted(nxG.edges(data="weight")) == [("a", "b", 1.5), ("b", "c", 2.5)]
+
+
+@pytest.mark.gt
+def test_infer_errors(tmp_path, capsys):
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b"],
+        np.array([[0, 1]]),
+        True,
+        node_columns={"value": Column(np.array([1, "x"], dtype=object))},
+    )
+    G.save(tmp_path / "graph.igx")
+
+    assert main([str(tmp_path / "graph.igx"), str(tmp_path / "graph.gt")]) == 1
+    assert "pyintergraph: error: Type not equal" in capsys.readouterr().err
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn, Column, columns_from_dicts, iter_rows
+
+from .testdata.networkxdata import nx_test_graphs
+
+
+def column_dtypes():
+    yield [1, 2, 3], np.int64
+    yield [1.5, 2.0], np.float64
+    yield [True, False], np.bool_
+    yield ["a", "b"], object
+    yield [[1], [2, 3]], object
+    yield [1, 2.5], object
+    yield [2**70], object
+
+
+@pytest.mark.parametrize("testvals", column_dtypes())
+def test_column_dtype(testvals):
+    _in, _out = testvals
+    col = Column.from_values(_in)
+    assert col.dtype == np.dtype(_out)
+    assert col.tolist() == _in
+
+
+def test_columns_from_dicts_mask():
+    dicts = [{"a": 1}, {}, {"a": 3, "b": "x"}]
+    columns = columns_from_dicts(dicts, 3)
+
+    assert columns["a"].values.dtype == np.int64
+    assert columns["a"].mask.tolist() == [True, False, True]
+    assert columns["b"].tolist() == [None, None, "x"]
+    assert list(iter_rows(columns, 3)) == dicts
+
+
+@pytest.mark.nx
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_columns_match_lists(nx_graph):
+    G = pyintergraph.InterGraph.from_networkx(nx_graph)
+
+    assert G.edge_array.shape == (nx_graph.number_of_edges(), 2)
+    assert G.nodes == list(range(nx_graph.number_of_nodes()))
+    assert list(G.node_labels.values()) == list(nx_graph.nodes())
+    assert G.node_attributes == [data for _, data in nx_graph.nodes(data=True)]
+    assert G.edge_attributes == [data for _, _, data in nx_graph.edges(data=True)]
+
+
+def test_from_columns():
+    G = pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c"],
+        edges=np.array([[0, 1], [1, 2]]),
+        is_directed=True,
+        edge_columns={"weight": Column(np.array([0.5, 1.5]))},
+    )
+
+    assert G.edges == [(0, 1), (1, 2)]
+    assert G.edge_attributes == [{"weight": 0.5}, {"weight": 1.5}]
+    assert G.node_labels == {0: "a", 1: "b", 2: "c"}
+
+
+def test_is_multigraph_undirected():
+    edges = np.array([[0, 1], [1, 0]])
+
+    directed = pyintergraph.InterGraph.from_columns([0, 1], edges, is_directed=True)
+    undirected = pyintergraph.InterGraph.from_columns([0, 1], edges, is_directed=False)
+
+    assert directed.is_multigraph is False
+    assert undirected.is_multigraph is True
+    assert type(undirected.to_networkx()).__name__ == "MultiGraph"
+    assert type(undirected.to_networkx(multigraph=False)).__name__ == "Graph"
+
+
+@pytest.mark.nx
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_to_networkx_without_copy(nx_graph):
+    import networkx as nx
+
+    G = pyintergraph.InterGraph.from_networkx(nx_graph)
+
+    assert nx.utils.graphs_equal(G.to_networkx(), G.to_networkx(copy_attributes=False))
+
+
+def test_categorical_column():
+    col = Column.from_sparse(5, [0, 1, 3, 4], ["x", "y", "x", "x"], categorical=True)
+
+    assert isinstance(col, CategoricalColumn)
+    assert col.codes.dtype == np.uint8
+    assert col.categories.tolist() == ["x", "y"]
+    assert col.tolist() == ["x", "y", None, "x", "x"]
+    assert col.take(np.array([4, 2, 1])).tolist() == ["x", None, "y"]
+    assert col.filled_values("") == ["x", "y", "", "x", "x"]
+
+
+def test_categorical_column_fallback():
+    assert not isinstance(Column.from_values(["a", "b", "c"], categorical=True), CategoricalColumn)
+    assert not isinstance(Column.from_values(["a", 1, "a", 1], categorical=True), CategoricalColumn)
+    assert CategoricalColumn.encode(["a", "b", "c"], max_ratio=1) is not None
+
+
+def test_categorical_native_format(tmp_path):
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c", "d"],
+        np.array([[0, 1], [1, 2]]),
+        True,
+        node_columns={"kind": Column.from_values(["x", "y", "x", "x"], categorical=True)},
+    )
+    G.save(tmp_path / "graph")
+
+    loaded = pyintergraph.InterGraph.load(tmp_path / "graph")
+    assert isinstance(loaded.node_columns["kind"], CategoricalColumn)
+    assert loaded.node_attributes == G.node_attributes
+
+
+def test_csv_strings_are_categorical():
+    import io
+
+    edges = io.StringIO("source,target,kind\n1,2,x\n2,3,y\n3,1,x\n1,3,\n")
+    G = pyintergraph.InterGraph.from_csv(edges, chunksize=2)
+
+    assert isinstance(G.edge_columns["kind"], CategoricalColumn)
+    assert G.edge_columns["kind"].tolist() == ["x", "y", "x", None]
@@ -0,0 +1,159 @@
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn, Column
+
+
+def base_graph(is_directed=True):
+    return pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c", "d"],
+        edges=np.array([[0, 1], [1, 2], [2, 3], [1, 2]]),
+        is_directed=is_directed,
+        node_columns={"size": Column(np.array([1, 2, 3, 4]))},
+        edge_columns={"weight": Column(np.array([0.5, 1.5, 2.5, 3.5]))},
+    )
+
+
+def changes():
+    changes = pyintergraph.ChangeLog()
+    changes.remove_edge("b", "c")
+    changes.remove_node("a")
+    changes.add_node("e", size=5)
+    changes.add_node("c", kind="x")
+    changes.add_edge("d", "f", weight=4.5)
+    return changes
+
+
+def test_apply_changes():
+    G = base_graph().apply_changes(changes())
+
+    assert G.node_labels == {0: "b", 1: "c", 2: "d", 3: "e", 4: "f"}
+    assert G.edges == [(1, 2), (0, 1), (2, 4)]
+    assert G.node_attributes == [
+        {"size": 2},
+        {"size": 3, "kind": "x"},
+        {"size": 4},
+        {"size": 5},
+        {},
+    ]
+    assert G.edge_attributes == [{"weight": 2.5}, {"weight": 3.5}, {"weight": 4.5}]
+    assert G.node_columns["size"].dtype == np.int64
+
+
+def test_index_is_kept_across_updates():
+    G = base_graph()
+    first = G.apply_changes(changes())
+    assert G._label_index is None
+
+    more = pyintergraph.ChangeLog()
+    more.remove_node("c")
+    more.add_edge("f", "b")
+    second = first.apply_changes(more)
+
+    assert second._label_index == {label: i for i, label in second.node_labels.items()}
+    assert second.edges == [(1, 3), (3, 0)]
+
+
+def test_undirected_edges_and_errors():
+    G = base_graph(is_directed=False)
+    log = pyintergraph.ChangeLog()
+    log.remove_edge("d", "c")
+    assert G.apply_changes(log).edges == [(0, 1), (1, 2), (1, 2)]
+
+    log = pyintergraph.ChangeLog()
+    log.remove_edge("a", "d")
+    with pytest.raises(ValueError):
+        G.apply_changes(log)
+
+
+def test_change_log_cancels_additions():
+    log = pyintergraph.ChangeLog()
+    log.add_edge("x", "y")
+    log.add_edge("x", "z")
+    log.remove_edge("x", "y")
+    log.remove_node("z")
+
+    assert log.added_edges == []
+    assert log.removed_edges == []
+    assert list(log.removed_nodes) == ["z"]
+
+
+def test_categorical_columns_are_extended():
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c", "d"],
+        np.array([[0, 1]]),
+        True,
+        node_columns={"kind": Column.from_values(["x", "x", "y", "y"], categorical=True)},
+    )
+    log = pyintergraph.ChangeLog()
+    log.add_node("e", kind="z")
+    log.add_node("f", kind="x")
+
+    kind = G.apply_changes(log).node_columns["kind"]
+    assert isinstance(kind, CategoricalColumn)
+    assert kind.tolist() == ["x", "x", "y", "y", "z", "x"]
+
+
+def test_untouched_categorical_columns_stay_encoded():
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c", "d", "e", "f"],
+        np.array([[0, 1], [1, 2], [2, 3], [3, 4]]),
+        True,
+        node_columns={"kind": Column.from_values(["x", "x", "y", "y", "x", "y"], categorical=True)},
+        edge_columns={"color": Column.from_values(["r", "r", "g", "r"], categorical=True)},
+    )
+    log = pyintergraph.ChangeLog()
+    log.add_edge("a", "f")
+
+    updated = G.apply_changes(log)
+    assert updated.node_columns["kind"] is G.node_columns["kind"]
+    color = updated.edge_columns["color"]
+    assert isinstance(color, CategoricalColumn)
+    assert color.tolist() == ["r", "r", "g", "r", None]
+
+
+@pytest.mark.ig
+def test_apply_changes_to_igraph():
+    G = base_graph()
+    iG = G.to_igraph()
+    updated = G.apply_changes(changes(), target=iG)
+
+    expected = updated.to_igraph()
+    assert iG.vs["name"] == expected.vs["name"]
+    assert iG.get_edgelist() == expected.get_edgelist()
+    assert iG.vs["size"] == expected.vs["size"]
+    assert iG.vs["kind"] == expected.vs["kind"]
+    assert iG.es["weight"] == expected.es["weight"]
+
+    with pytest.raises(ValueError):
+        G.apply_changes(changes(), target=iG)
+
+
+@pytest.mark.gt
+def test_apply_changes_to_graph_tool():
+    G = base_graph()
+    gtG = G.to_graph_tool(labelname="label")
+    updated = G.apply_changes(changes(), target=gtG, labelname="label")
+
+    loaded = pyintergraph.InterGraph.from_graph_tool(gtG, labelname="label")
+    assert loaded.node_labels == updated.node_labels
+    assert sorted(loaded.edges) == sorted(updated.edges)
+    assert loaded.node_columns["kind"].tolist() == ["", "x", "", "", ""]
+    assert sorted(loaded.edge_columns["weight"].tolist()) == [2.5, 3.5, 4.5]
+
+
+@pytest.mark.gt
+def test_graph_tool_property_type_from_whole_column():
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c"],
+        np.array([[0, 1]]),
+        True,
+        node_columns={"count": Column(np.array([1, 100000, 2]))},
+    )
+    gtG = G.to_graph_tool(attributes=[])
+    log = pyintergraph.ChangeLog()
+    log.add_node("d", count=5)
+
+    G.apply_changes(log, target=gtG)
+    assert gtG.vp["count"].value_type() == "int32_t"
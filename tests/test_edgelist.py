@@ -0,0 +1,145 @@
+import io
+
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import Column
+
+
+def attributed_graph():
+    return pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c", "d"],
+        edges=np.array([[0, 1], [1, 2], [2, 0]]),
+        is_directed=True,
+        node_columns={
+            "kind": Column(
+                np.array(["x", "y", None, "x"], dtype=object), np.array([1, 1, 0, 1], bool)
+            ),
+            "size": Column(np.array([1, 2, 3, 4])),
+        },
+        edge_columns={
+            "weight": Column(np.array([0.5, 1.5, 2.0])),
+            "flag": Column(np.array([True, False, True])),
+        },
+    )
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, None])
+def test_csv_roundtrip(chunksize, tmp_path):
+    G = attributed_graph()
+    G.to_csv(tmp_path / "edges.csv", nodes_path=tmp_path / "nodes.csv", chunksize=chunksize)
+
+    loaded = pyintergraph.InterGraph.from_csv(
+        tmp_path / "edges.csv", nodes_path=tmp_path / "nodes.csv", chunksize=chunksize
+    )
+    assert loaded.node_labels == G.node_labels
+    assert loaded.edges == G.edges
+    assert loaded.node_attributes == G.node_attributes
+    assert loaded.edge_attributes == G.edge_attributes
+    assert loaded.edge_columns["weight"].dtype == np.float64
+    assert loaded.node_columns["size"].dtype == np.int64
+
+
+def test_csv_label_index_and_types():
+    edges = io.StringIO("to,from,weight,label\n1,2,3,x\n2,3,,y\n3,1,4.5,7\n")
+    G = pyintergraph.InterGraph.from_csv(
+        edges, source="from", target="to", nodetype=int, chunksize=2
+    )
+
+    assert G.node_labels == {0: 2, 1: 1, 2: 3}
+    assert G.edges == [(0, 1), (2, 0), (1, 2)]
+    assert G.edge_columns["weight"].tolist() == [3.0, None, 4.5]
+    assert G.edge_columns["label"].tolist() == ["x", "y", "7"]
+
+
+def test_csv_nodes_without_edges_and_attributes():
+    nodes = io.StringIO("id,kind\na,x\nb,y\nc,z\n")
+    edges = io.StringIO("source,target\na,b\nb,d\n")
+    G = pyintergraph.InterGraph.from_csv(edges, nodes_path=nodes, is_directed=False)
+
+    assert G.node_labels == {0: "a", 1: "b", 2: "c", 3: "d"}
+    assert G.node_attributes == [{"kind": "x"}, {"kind": "y"}, {"kind": "z"}, {}]
+
+
+def test_csv_missing_column():
+    with pytest.raises(ValueError):
+        pyintergraph.InterGraph.from_csv(io.StringIO("u,v\n1,2\n"))
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 10])
+def test_csv_short_rows(chunksize):
+    nodes = io.StringIO("id,x,y\na,1,10\nb,2\nc,3,30\nd,4,40\n")
+    with pytest.raises(ValueError, match="Line 3 has 2 fields"):
+        pyintergraph.InterGraph.from_csv(
+            io.StringIO("source,target\na,b\n"), nodes_path=nodes, chunksize=chunksize
+        )
+
+    edges = io.StringIO("source,target,weight\na,b,1\nb\n")
+    with pytest.raises(ValueError, match="Line 3 has 1 fields"):
+        pyintergraph.InterGraph.from_csv(edges, chunksize=chunksize)
+
+
+@pytest.mark.parametrize("chunksize", [1, 10])
+def test_csv_duplicate_node_ids(chunksize):
+    with pytest.raises(ValueError, match="'a' appears more than once"):
+        pyintergraph.InterGraph.from_csv(
+            io.StringIO("source,target\na,b\n"),
+            nodes_path=io.StringIO("id,v\na,1\na,2\nb,3\n"),
+            chunksize=chunksize,
+        )
+
+
+@pytest.mark.parametrize("chunksize", [1, None])
+def test_edgelist_roundtrip(chunksize, tmp_path):
+    G = attributed_graph()
+    G.to_edgelist(tmp_path / "graph.edges", data=["weight"], chunksize=chunksize)
+
+    assert (tmp_path / "graph.edges").read_text().splitlines()[0] == "a b 0.5"
+
+    loaded = pyintergraph.InterGraph.from_edgelist(
+        tmp_path / "graph.edges", data=[("weight", float)], chunksize=chunksize
+    )
+    assert loaded.node_labels == {0: "a", 1: "b", 2: "c"}
+    assert loaded.edges == G.edges
+    assert loaded.edge_attributes == [{"weight": 0.5}, {"weight": 1.5}, {"weight": 2.0}]
+
+
+def test_edgelist_comments_and_nodetype():
+    f = io.StringIO("# comment\n1 2 extra\n\n2 3 # trailing\n")
+    G = pyintergraph.InterGraph.from_edgelist(f, nodetype=int, is_directed=False)
+
+    assert G.node_labels == {0: 1, 1: 2, 2: 3}
+    assert G.edges == [(0, 1), (1, 2)]
+    assert G.edge_columns == {}
+
+
+def test_edgelist_rejects_incomplete_attributes():
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b"],
+        np.array([[0, 1], [1, 0]]),
+        True,
+        edge_columns={"weight": Column(np.array([1.0, 0.0]), np.array([True, False]))},
+    )
+    with pytest.raises(ValueError):
+        G.to_edgelist(io.StringIO(), data=True)
+
+
+@pytest.mark.nx
+def test_csv_from_networkx(tmp_path):
+    import networkx as nx
+
+    nx_graph = nx.karate_club_graph()
+    G = pyintergraph.InterGraph.from_networkx(nx_graph)
+    G.to_csv(tmp_path / "edges.csv", nodes_path=tmp_path / "nodes.csv", chunksize=10)
+
+    loaded = pyintergraph.InterGraph.from_csv(
+        tmp_path / "edges.csv",
+        nodes_path=tmp_path / "nodes.csv",
+        is_directed=False,
+        nodetype=int,
+        chunksize=7,
+    )
+    reversed_nx_graph = loaded.to_networkx()
+    assert list(nx_graph.nodes(data=True)) == list(reversed_nx_graph.nodes(data=True))
+    assert list(nx_graph.edges(data=True)) == list(reversed_nx_graph.edges(data=True))
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import Column
+
+
+def attributed_graph():
+    return pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c", "d"],
+        edges=np.array([[0, 1], [1, 2], [2, 3], [3, 0], [1, 3]]),
+        is_directed=True,
+        node_columns={
+            "kind": Column(np.array(["x", "y", "x", "x"], dtype=object)),
+        },
+        edge_columns={
+            "weight": Column(np.array([0.1, 0.9, 0.5, 0.7, 0.2])),
+        },
+    )
+
+
+def test_filter_edges():
+    G = attributed_graph().filter(edge_filter=lambda edges: edges["weight"] > 0.4)
+
+    assert G.node_labels == {0: "a", 1: "b", 2: "c", 3: "d"}
+    assert G.edges == [(1, 2), (2, 3), (3, 0)]
+    assert G.edge_columns["weight"].tolist() == [0.9, 0.5, 0.7]
+
+
+def test_filter_nodes_reindexes_edges():
+    G = attributed_graph().filter(node_filter=lambda nodes: nodes["kind"] == "x")
+
+    assert G.node_labels == {0: "a", 1: "c", 2: "d"}
+    assert G.edges == [(1, 2), (2, 0)]
+    assert G.edge_columns["weight"].tolist() == [0.5, 0.7]
+    assert G.node_columns["kind"].tolist() == ["x", "x", "x"]
+
+
+def test_filter_nodes_and_edges_with_masks():
+    G = attributed_graph().filter(
+        node_filter=np.array([True, True, False, True]),
+        edge_filter=np.array([True, True, True, False, False]),
+    )
+
+    assert G.node_labels == {0: "a", 1: "b", 2: "d"}
+    assert G.edges == [(0, 1)]
+
+
+def test_filter_tells_unset_values_from_zero():
+    G = pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c"],
+        edges=np.array([[0, 1], [1, 2], [2, 0]]),
+        is_directed=True,
+        node_columns={"size": Column(np.array([0, 0, 3]), np.array([True, False, True]))},
+        edge_columns={"weight": Column(np.array([0.5, 0.0, 2.0]), np.array([1, 0, 1], bool))},
+    )
+
+    assert G.filter(node_filter=lambda nodes: nodes["size"] == 0).node_labels == {0: "a"}
+    assert G.filter(edge_filter=lambda edges: edges["weight"] < 1).edges == [(0, 1)]
+
+    unset = G.filter(edge_filter=lambda edges: np.ma.getmaskarray(edges["weight"]))
+    assert unset.edges == [(1, 2)]
+
+
+def test_filter_rejects_invalid_masks():
+    G = attributed_graph()
+    with pytest.raises(ValueError):
+        G.filter(node_filter=np.array([0, 1]))
+    with pytest.raises(ValueError):
+        G.filter(edge_filter=np.array([True]))
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_filter_while_building():
+    import networkx as nx
+
+    g = nx.karate_club_graph()
+    G = pyintergraph.InterGraph.from_networkx(
+        g,
+        lazy=True,
+        node_filter=lambda nodes: nodes["club"] == "Mr. Hi",
+        edge_filter=lambda edges: edges["weight"] > 2,
+    )
+    expected = g.subgraph(n for n, club in g.nodes(data="club") if club == "Mr. Hi")
+    expected = [(u, v) for u, v, w in expected.edges(data="weight") if w > 2]
+
+    assert not G.edge_columns.is_loaded("weight")
+    iG = G.to_igraph()
+    assert sorted(tuple(iG.vs[e]["name"]) for e in iG.get_edgelist()) == sorted(expected)
+    assert set(iG.vs["club"]) == {"Mr. Hi"}
+
+    H = pyintergraph.InterGraph.from_igraph(iG, edge_filter=lambda edges: edges["weight"] > 3)
+    assert min(H.edge_columns["weight"].tolist()) > 3
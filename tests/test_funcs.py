@@ -163,6 +163,17 @@ def test_gt2igraph(gt_graph):
             ]
 
 
+@pytest.mark.gt
+@pytest.mark.parametrize("gt_graph", gt_test_graphs())
+def test_lazy_graph_tool_matches_eager(gt_graph):
+    eager = pyintergraph.InterGraph.from_graph_tool(gt_graph)
+    lazy = pyintergraph.InterGraph.from_graph_tool(gt_graph, lazy=True)
+
+    assert lazy.edges == eager.edges
+    assert lazy.node_attributes == eager.node_attributes
+    assert lazy.edge_attributes == eager.edge_attributes
+
+
 @pytest.mark.parametrize("nx_graph", nx_test_graphs())
 def test_round_robin_nx(nx_graph):
     graph_tool_graph = pyintergraph.nx2gt(nx_graph, labelname="node_label")
@@ -191,3 +202,93 @@ def test_round_robin_ig(ig_graph):
         reversed_ig_graph.vertex_attributes()
     ).add("name")
     assert type(ig_graph) == type(reversed_ig_graph)
+
+
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_round_robin_nx_workers(nx_graph):
+    graph_tool_graph = pyintergraph.nx2gt(nx_graph, labelname="node_label", workers=4)
+
+    igraph_graph = pyintergraph.gt2igraph(graph_tool_graph, labelname="node_label")
+
+    reversed_nx_graph = pyintergraph.igraph2nx(igraph_graph)
+    sequential_nx_graph = pyintergraph.igraph2nx(
+        pyintergraph.gt2igraph(pyintergraph.nx2gt(nx_graph, labelname="node_label"), "node_label")
+    )
+
+    assert list(nx_graph.nodes(data=True)) == list(reversed_nx_graph.nodes(data=True))
+    assert list(sequential_nx_graph.edges(data=True)) == list(reversed_nx_graph.edges(data=True))
+    assert type(nx_graph) == type(reversed_nx_graph)
+
+
+@pytest.mark.parametrize("ig_graph", igraph_test_graphs())
+def test_igraph2gt_workers(ig_graph):
+    graph_tool_graph = pyintergraph.igraph2gt(ig_graph, workers=4)
+    reversed_ig_graph = pyintergraph.InterGraph.from_graph_tool(graph_tool_graph).to_igraph()
+
+    assert list(e.tuple for e in ig_graph.es()) == list(e.tuple for e in reversed_ig_graph.es())
+    assert ig_graph.edge_attributes() == reversed_ig_graph.edge_attributes()
+
+
+@pytest.mark.gt
+@pytest.mark.nx
+def test_nx2gt_skips_edge_attributes_filtered_away():
+    import networkx as nx
+
+    nx_graph = nx.DiGraph()
+    nx_graph.add_edge("a", "b", weight=1.0, kind="x", count=3)
+    G = pyintergraph.InterGraph.from_networkx(nx_graph, edge_filter=lambda e: e["weight"] > 10)
+
+    gt_graph = G.to_graph_tool(labelname="node_label")
+    assert gt_graph.num_edges() == 0
+    assert list(gt_graph.edge_properties) == []
+    assert list(gt_graph.vp["node_label"]) == ["a", "b"]
+
+
+@pytest.mark.gt
+@pytest.mark.nx
+def test_nx2gt_skips_node_attributes_filtered_away():
+    import networkx as nx
+    import numpy as np
+
+    nx_graph = nx.Graph()
+    nx_graph.add_node("a", size=10)
+    nx_graph.add_node("b", size=20, kind="x")
+    nx_graph.add_node("c")
+    nx_graph.add_edge("a", "c")
+    G = pyintergraph.InterGraph.from_networkx(
+        nx_graph, node_filter=lambda n: np.ma.getmaskarray(n["size"])
+    )
+
+    gt_graph = G.to_graph_tool()
+    assert gt_graph.num_vertices() == 1
+    assert list(gt_graph.vertex_properties) == []
+
+
+@pytest.mark.gt
+@pytest.mark.ig
+def test_igraph2gt_skips_empty_edge_attributes():
+    import igraph as ig
+
+    ig_graph = ig.Graph(3)
+    ig_graph.es["w"] = []
+
+    gt_graph = pyintergraph.igraph2gt(ig_graph)
+    assert gt_graph.num_vertices() == 3
+    assert list(gt_graph.edge_properties) == []
+
+
+@pytest.mark.gt
+def test_graph_tool_string_edges_unsorted():
+    import numpy as np
+
+    G = pyintergraph.InterGraph.from_columns(
+        ["a", "b", "c"],
+        np.array([[2, 0], [0, 1], [1, 2], [0, 2]]),
+        True,
+        edge_columns={"label": pyintergraph.columns.Column.from_values(["ca", "ab", "bc", "ac"])},
+    )
+
+    reversed_G = pyintergraph.InterGraph.from_graph_tool(G.to_graph_tool())
+    assert sorted(zip(reversed_G.edges, reversed_G.edge_columns["label"].tolist())) == sorted(
+        zip(G.edges, G.edge_columns["label"].tolist())
+    )
@@ -0,0 +1,52 @@
+from pathlib import Path
+import re
+import subprocess
+import sys
+
+import pytest
+
+import pyintergraph
+
+# cumulative import time of the package itself in microseconds, with a wide margin for
+# slow machines. Importing numpy alone takes longer than this.
+IMPORT_BUDGET_US = 20_000
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(pyintergraph.__file__).parents[1],
+    )
+
+
+def test_import_is_lazy():
+    result = run_python(
+        "-c",
+        "import sys, pyintergraph; "
+        "print(sorted({'numpy', 'networkx', 'igraph', 'graph_tool'} & set(sys.modules)))",
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_time_budget():
+    result = run_python("-X", "importtime", "-c", "import pyintergraph")
+    cumulative = [
+        int(match.group(1))
+        for match in re.finditer(r"\|\s*(\d+) \| pyintergraph$", result.stderr, re.MULTILINE)
+    ]
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US
+
+
+def test_lazy_names():
+    assert "InterGraph" in dir(pyintergraph)
+    assert pyintergraph.InterGraph is pyintergraph.Graph.InterGraph
+    assert pyintergraph.nx2gt is pyintergraph.funcs.nx2gt
+    assert set(pyintergraph.__all__) <= set(dir(pyintergraph))
+    for name in pyintergraph.__all__:
+        getattr(pyintergraph, name)
+
+    with pytest.raises(AttributeError):
+        pyintergraph.does_not_exist
@@ -0,0 +1,85 @@
+import networkx as nx
+import pytest
+
+import pyintergraph
+
+from .testdata.networkxdata import nx_test_graphs
+
+
+def weighted_graph():
+    g = nx.Graph()
+    g.add_node("a", kind="x", size=1)
+    g.add_node("b", kind="y")
+    g.add_edge("a", "b", weight=0.5, label="ab")
+    g.add_edge("b", "c", weight=1.5)
+    return g
+
+
+@pytest.mark.nx
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_lazy_networkx_matches_eager(nx_graph):
+    eager = pyintergraph.InterGraph.from_networkx(nx_graph)
+    lazy = pyintergraph.InterGraph.from_networkx(nx_graph, lazy=True)
+
+    assert lazy.edges == eager.edges
+    assert lazy.node_attributes == eager.node_attributes
+    assert lazy.edge_attributes == eager.edge_attributes
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_lazy_extracts_selected_attributes():
+    G = pyintergraph.InterGraph.from_networkx(weighted_graph(), lazy=True)
+
+    assert list(G.node_columns) == ["kind", "size"]
+    assert list(G.edge_columns) == ["weight", "label"]
+    assert not G.edge_columns.is_loaded("weight")
+
+    iG = G.to_igraph(attributes=["weight"])
+    assert iG.vs.attributes() == ["name"]
+    assert iG.es["weight"] == [0.5, 1.5]
+    assert G.edge_columns.is_loaded("weight")
+    assert not G.edge_columns.is_loaded("label")
+    assert not G.node_columns.is_loaded("kind")
+
+    nxG = G.to_networkx(attributes=["kind", "label"])
+    assert list(nxG.nodes(data=True)) == [("a", {"kind": "x"}), ("b", {"kind": "y"}), ("c", {})]
+    assert list(nxG.edges(data=True)) == [("a", "b", {"label": "ab"}), ("b", "c", {})]
+
+
+@pytest.mark.nx
+def test_lazy_networkx_graph_changed():
+    g = weighted_graph()
+    G = pyintergraph.InterGraph.from_networkx(g, lazy=True)
+    g.add_node("d")
+
+    with pytest.raises(RuntimeError):
+        G.node_columns["kind"]
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_funcs_attributes():
+    g = weighted_graph()
+
+    iG = pyintergraph.nx2igraph(g, attributes=["size", "weight"])
+    assert iG.vs["size"] == [1, None, None]
+    assert iG.es.attributes() == ["weight"]
+
+    reversed_nx_graph = pyintergraph.igraph2nx(iG, attributes=[])
+    assert list(reversed_nx_graph.nodes(data=True)) == [("a", {}), ("b", {}), ("c", {})]
+
+
+@pytest.mark.ig
+def test_lazy_igraph():
+    import igraph
+
+    iG = igraph.Graph([(0, 1), (1, 2)])
+    iG.vs["size"] = [1, 2, 3]
+    iG.es["weight"] = [0.5, 1.5]
+
+    G = pyintergraph.InterGraph.from_igraph(iG, lazy=True)
+    assert not G.node_columns.is_loaded("size")
+    assert G.edge_attributes == [{"weight": 0.5}, {"weight": 1.5}]
+    assert G.node_columns.is_loaded("size") is False
+    assert G.to_igraph(attributes=["size"]).vs["size"] == [1, 2, 3]
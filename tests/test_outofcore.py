@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn
+from pyintergraph.outofcore import OutOfCoreBuilder
+
+
+def build_graph(directory=None):
+    with OutOfCoreBuilder(is_directed=True, directory=directory) as builder:
+        builder.add_edges(["a", "b"], ["b", "c"], {"weight": np.array([0.5, 1.5])})
+        builder.add_edges(["c"], ["d"], {"kind": ["x"]})
+        builder.add_edges(
+            np.array(["d", "a"]), np.array(["a", "c"]), {"weight": [2, 3], "kind": ["y", "x"]}
+        )
+        builder.add_nodes(["d", "e"], {"size": [4, 5]})
+        builder.add_nodes(["a"], {"size": [1], "tags": [["t"]]})
+        return builder.build()
+
+
+def test_build_memory_maps_columns(tmp_path):
+    G = build_graph(tmp_path)
+
+    assert not G.edge_array.flags.owndata
+    assert isinstance(G.edge_columns["weight"].values, np.memmap)
+    assert G.node_labels == {0: "a", 1: "b", 2: "c", 3: "d", 4: "e"}
+    assert G.edges == [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+    assert G.edge_columns["weight"].tolist() == [0.5, 1.5, None, 2.0, 3.0]
+    assert isinstance(G.edge_columns["kind"], CategoricalColumn)
+    assert G.edge_columns["kind"].tolist() == [None, None, "x", "y", "x"]
+    assert G.node_attributes == [{"size": 1, "tags": ["t"]}, {}, {}, {"size": 4}, {"size": 5}]
+
+
+def test_temporary_directory_is_removed():
+    with OutOfCoreBuilder() as builder:
+        directory = builder.directory
+        builder.add_edges([1, 2], [2, 3], {"weight": [1.0, 2.0]})
+        G = builder.build()
+
+    assert not os.path.exists(directory)
+    assert G.edge_columns["weight"].tolist() == [1.0, 2.0]
+
+
+def test_type_changes_are_rejected():
+    with OutOfCoreBuilder() as builder:
+        builder.add_edges([1], [2], {"weight": [1]})
+        with pytest.raises(ValueError):
+            builder.add_edges([2], [3], {"weight": ["a"]})
+        with pytest.raises(ValueError):
+            builder.add_edges([2], [3, 4])
+
+
+def test_numeric_types_are_promoted():
+    with OutOfCoreBuilder() as builder:
+        builder.add_edges([1, 2], [2, 3], {"count": np.array([1, -2], dtype=np.int8)})
+        builder.add_edges([3], [4], {"count": [1000]})
+        builder.add_edges([4], [5], {"count": [0.5]})
+        G = builder.build()
+
+    count = G.edge_columns["count"]
+    assert count.dtype == np.float64
+    assert count.tolist() == [1.0, -2.0, 1000.0, 0.5]
+
+
+@pytest.mark.ig
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_to_igraph_in_chunks(chunksize, tmp_path):
+    G = build_graph(tmp_path)
+    iG = G.to_igraph(chunksize=chunksize)
+
+    assert iG.get_edgelist() == G.edges
+    assert iG.es["weight"] == [0.5, 1.5, None, 2.0, 3.0]
+    assert iG.vs["name"] == ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.gt
+def test_to_graph_tool_in_chunks(tmp_path):
+    G = build_graph(tmp_path)
+    gtG = G.to_graph_tool(chunksize=2)
+
+    loaded = pyintergraph.InterGraph.from_graph_tool(gtG)
+    assert sorted(loaded.edges) == sorted(G.edges)
@@ -0,0 +1,43 @@
+import threading
+
+from pyintergraph.parallel import map_columns
+
+
+def test_map_columns_keeps_order():
+    items = [("node", key, None) for key in "abcdefgh"]
+    threads = set()
+
+    def prepare(kind, key, column):
+        threads.add(threading.get_ident())
+        return key.upper()
+
+    results = list(map_columns(prepare, items, workers=4))
+    assert results == [(item, item[1].upper()) for item in items]
+
+    threads.clear()
+    assert list(map_columns(prepare, items)) == results
+    assert threads == {threading.get_ident()}
+
+
+def test_map_columns_is_lazy_without_workers():
+    calls = []
+    results = map_columns(lambda key: calls.append(key), [("a",), ("b",)])
+
+    assert calls == []
+    next(iter(results))
+    assert calls == ["a"]
+
+
+def test_map_columns_in_pool():
+    items = [("node", key, None) for key in "abcd"]
+    threads = {}
+
+    def prepare(kind, key, column):
+        threads[key] = threading.get_ident()
+        return key.upper()
+
+    results = map_columns(prepare, items, workers=4, in_pool=lambda kind, key, c: key in "ac")
+    assert set(threads) == {"a", "c"}
+    assert list(results) == [(item, item[1].upper()) for item in items]
+    assert threads["b"] == threads["d"] == threading.get_ident()
+    assert threading.get_ident() not in (threads["a"], threads["c"])
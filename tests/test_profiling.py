@@ -0,0 +1,46 @@
+import networkx as nx
+import pytest
+
+import pyintergraph
+
+
+@pytest.mark.nx
+@pytest.mark.ig
+def test_profile_records_stages():
+    g = nx.karate_club_graph()
+    finished = []
+
+    with pyintergraph.profile(callback=finished.append) as report:
+        pyintergraph.nx2igraph(g)
+
+    paths = [stage.path for stage in report.stages]
+    assert paths[:2] == ["nx2igraph", "nx2igraph/from_networkx"]
+    assert "nx2igraph/to_igraph/create_graph" in paths
+    assert len(finished) == len(report.stages)
+
+    summary = report.summary()
+    assert summary["nx2igraph/from_networkx/read_edges"]["count"] == g.number_of_edges()
+    assert summary["nx2igraph/to_igraph/set_attribute"]["calls"] == 3
+    assert all(stage.memory_peak is None for stage in report.stages)
+
+
+@pytest.mark.nx
+def test_profile_trace_memory():
+    g = nx.karate_club_graph()
+
+    with pyintergraph.profile(trace_memory=True) as report:
+        pyintergraph.InterGraph.from_networkx(g)
+
+    assert report.stages[0].path == "from_networkx"
+    assert all(stage.memory_peak >= 0 for stage in report.stages)
+    assert report.stages[0].memory_peak >= report.stages[1].memory_peak
+
+
+def test_no_profile_outside_context():
+    g = nx.path_graph(3)
+
+    with pyintergraph.profile() as report:
+        pass
+    pyintergraph.InterGraph.from_networkx(g)
+
+    assert report.stages == []
@@ -0,0 +1,71 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn, Column
+
+
+def attributed_graph():
+    return pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c", "d"],
+        edges=np.array([[0, 1], [1, 2], [2, 3]]),
+        is_directed=True,
+        node_columns={
+            "size": Column(np.array([1, 2, 3, 4]), np.array([1, 1, 0, 1], bool)),
+            "kind": Column.from_values(["x", "y", "x", "x"], categorical=True),
+            "tags": Column.from_values([[1], [2], [3], [4]]),
+        },
+        edge_columns={"weight": Column(np.array([0.5, 1.5, 2.5]))},
+    )
+
+
+def test_attach_without_copy():
+    G = attributed_graph()
+    with G.to_shared_memory() as shared:
+        attached = pyintergraph.InterGraph.from_shared_memory(pickle.loads(pickle.dumps(shared)))
+
+        assert attached.node_labels == G.node_labels
+        assert attached.edges == G.edges
+        assert attached.node_attributes == G.node_attributes
+        assert attached.edge_attributes == G.edge_attributes
+        assert isinstance(attached.node_columns["kind"], CategoricalColumn)
+
+        weight = attached.edge_columns["weight"].values
+        assert not weight.flags.owndata
+        with pytest.raises(ValueError):
+            weight[0] = 1.0
+        del attached, weight
+
+
+def _worker(shared):
+    G = pyintergraph.InterGraph.from_shared_memory(shared)
+    return G.n_nodes, G.edges, G.edge_columns["weight"].tolist()
+
+
+def test_attach_in_worker_process():
+    G = pyintergraph.InterGraph.from_columns(
+        [10, 20, 30],
+        np.array([[0, 1], [1, 2]]),
+        False,
+        edge_columns={"weight": Column(np.array([1.0, 2.0]))},
+    )
+    with G.to_shared_memory() as shared:
+        with multiprocessing.get_context().Pool(1) as pool:
+            result = pool.apply(_worker, (shared,))
+
+    assert result == (3, [(0, 1), (1, 2)], [1.0, 2.0])
+
+
+@pytest.mark.ig
+def test_attached_to_igraph():
+    G = attributed_graph()
+    with G.to_shared_memory() as shared:
+        attached = pyintergraph.InterGraph.from_shared_memory(shared)
+        iG = attached.to_igraph()
+        del attached
+
+    assert iG.vs["name"] == ["a", "b", "c", "d"]
+    assert iG.es["weight"] == [0.5, 1.5, 2.5]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import pyintergraph
+from pyintergraph.columns import CategoricalColumn, Column
+
+from .testdata.networkxdata import nx_test_graphs
+
+
+@pytest.mark.nx
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("nx_graph", nx_test_graphs())
+def test_save_load_roundtrip(nx_graph, mmap, tmp_path):
+    G = pyintergraph.InterGraph.from_networkx(nx_graph)
+    G.save(tmp_path / "graph.igx")
+
+    loaded = pyintergraph.InterGraph.load(tmp_path / "graph.igx", mmap=mmap)
+    assert loaded.is_directed == G.is_directed
+    assert loaded.edges == G.edges
+    assert loaded.node_labels == G.node_labels
+    assert loaded.node_attributes == G.node_attributes
+    assert loaded.edge_attributes == G.edge_attributes
+
+    reversed_nx_graph = loaded.to_networkx()
+    assert list(nx_graph.nodes(data=True)) == list(reversed_nx_graph.nodes(data=True))
+    assert list(nx_graph.edges(data=True)) == list(reversed_nx_graph.edges(data=True))
+
+
+def test_load_memory_maps_numeric_columns(tmp_path):
+    G = pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c"],
+        edges=np.array([[0, 1], [1, 2]]),
+        is_directed=False,
+        node_columns={
+            "kind": Column(np.array(["x", "y", "x"], dtype=object), np.array([1, 1, 0], bool))
+        },
+        edge_columns={"weight": Column(np.array([0.5, 1.5]))},
+    )
+    G.save(tmp_path / "graph.igx")
+
+    loaded = pyintergraph.InterGraph.load(tmp_path / "graph.igx")
+    assert not loaded.edge_array.flags.owndata
+    assert not loaded.edge_array.flags.writeable
+    assert isinstance(loaded.edge_columns["weight"].values, np.memmap)
+    assert not loaded.edge_columns["weight"].values.flags.writeable
+    assert loaded.node_columns["kind"].tolist() == ["x", "y", None]
+    assert loaded.node_labels == {0: "a", 1: "b", 2: "c"}
+
+
+def test_load_rejects_other_files(tmp_path):
+    (tmp_path / "graph.txt").write_text("1 2\n")
+    with pytest.raises(ValueError):
+        pyintergraph.InterGraph.load(tmp_path / "graph.txt")
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_over_loaded_file(mmap, tmp_path):
+    path = tmp_path / "graph.igx"
+    G = pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c"],
+        edges=np.array([[0, 1], [1, 2]]),
+        is_directed=True,
+        edge_columns={"weight": Column(np.array([0.5, 1.5]))},
+    )
+    G.save(path)
+
+    loaded = pyintergraph.InterGraph.load(path, mmap=mmap)
+    loaded.save(path)
+
+    reloaded = pyintergraph.InterGraph.load(path)
+    assert reloaded.edge_array.tolist() == [[0, 1], [1, 2]]
+    assert reloaded.edge_columns["weight"].tolist() == [0.5, 1.5]
+    assert reloaded.node_labels == {0: "a", 1: "b", 2: "c"}
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.igx"]
+
+
+def test_string_labels_are_not_encoded(tmp_path):
+    G = pyintergraph.InterGraph.from_columns(
+        labels=["a", "b", "c", "d"],
+        edges=np.array([[0, 1], [2, 3]]),
+        is_directed=True,
+        node_columns={"kind": Column(np.array(["x", "x", "x", "y"], dtype=object))},
+    )
+    G.save(tmp_path / "graph.igx")
+
+    loaded = pyintergraph.InterGraph.load(tmp_path / "graph.igx")
+    assert not isinstance(loaded.labels, CategoricalColumn)
+    assert loaded.labels.values.dtype == object
+    assert loaded.labels.tolist() == ["a", "b", "c", "d"]
+    assert isinstance(loaded.node_columns["kind"], CategoricalColumn)
@@ -1,7 +1,8 @@
 import pytest
 
 import pyintergraph
-from pyintergraph.infer import infer_type
+from pyintergraph.infer import infer_array_type, infer_type
+from pyintergraph.columns import Column
 
 
 try:
@@ -59,3 +60,23 @@ def test_raise_infer_exception():
     for invalid in invalids:
         with pytest.raises(pyintergraph.PyIntergraphInferException):
             infer_type(invalid)
+
+
+def type_check_column():
+    yield [1, 2, 3], "int16_t"
+    yield [1, 70000], "int32_t"
+    yield [70000, 1], "int32_t"
+    yield [1, 2**40], "int64_t"
+    yield [True, False], "uint8_t"
+    yield [1.5, 2.5], "double"
+    yield ["a", "b"], "string"
+    yield [[1], [70000, 2]], "vector<int32_t>"
+    yield [[], [1.5]], "vector<double>"
+    yield [{"a": 1}], "python::object"
+
+
+@pytest.mark.infer_type
+@pytest.mark.parametrize("testvals", type_check_column())
+def test_infer_array_type(testvals):
+    _in, _out = testvals
+    assert infer_array_type(Column.from_values(_in).values) == _out